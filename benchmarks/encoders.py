@@ -0,0 +1,90 @@
+"""
+Compares the precompiled calldata encoders with 'contract.encode_abi'. Run from the repository root:
+
+    python -m benchmarks.encoders
+"""
+
+import time
+import timeit
+
+from hexbytes import HexBytes
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+
+from data.models import Contracts, load_abi
+from libs.eth_async.data.models import DefaultABIs
+from libs.eth_async.encoders import Encoders
+from modules.nft_badges import NFT_ABI
+
+ITERATIONS = 20_000
+
+ADDRESS = "0x0000000000000000000000000000000000000001"
+SPENDER = Web3.to_checksum_address("0x9b84996d519c6a046da9fb6b9be41bad217cb783")
+
+
+def zenith_swap_encode_abi(router, swap_args, deadline) -> str:
+    swap = router.encode_abi("exactInputSingle", args=[swap_args])
+    refund = router.encode_abi("refundETH", args=[])
+    return router.encode_abi("multicall", args=[deadline, [swap, refund]])
+
+
+def zenith_swap_encoders(swap_args, deadline) -> str:
+    swap = Encoders.exact_input_single.encode(swap_args)
+    refund = Encoders.refund_eth.encode()
+    return Encoders.multicall_deadline.encode(deadline, [HexBytes(swap), HexBytes(refund)])
+
+
+def main():
+    # encoding doesn't send requests, so the provider is never reached
+    w3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:8545"))
+    token = w3.eth.contract(address=Web3.to_checksum_address(Contracts.USDT.address), abi=DefaultABIs.Token)
+    weth = w3.eth.contract(address=Web3.to_checksum_address(Contracts.WETH.address), abi=Contracts.WETH.abi)
+    router = w3.eth.contract(address=SPENDER, abi=load_abi("zenith_router.json"))
+    nft = w3.eth.contract(address=SPENDER, abi=NFT_ABI)
+
+    swap_args = (
+        Web3.to_checksum_address(Contracts.WETH.address),
+        Web3.to_checksum_address(Contracts.USDT.address),
+        500,
+        ADDRESS,
+        10**18,
+        0,
+        0,
+    )
+    deadline = int(time.time() + 20 * 60)
+    claim_args = (ADDRESS, 1, ADDRESS, 10**17, ([], 0, 2**256 - 1, ADDRESS), b"")
+
+    cases = {
+        "approve": (
+            lambda: token.encode_abi("approve", args=[SPENDER, 10**18]),
+            lambda: Encoders.approve.encode(SPENDER, 10**18),
+        ),
+        "deposit": (
+            lambda: weth.encode_abi("deposit", args=[]),
+            lambda: Encoders.deposit.encode(),
+        ),
+        "withdraw": (
+            lambda: weth.encode_abi("withdraw", args=[10**18]),
+            lambda: Encoders.withdraw.encode(10**18),
+        ),
+        "nft claim": (
+            lambda: nft.encode_abi("claim", args=claim_args),
+            lambda: Encoders.nft_drop_claim.encode(*claim_args),
+        ),
+        "zenith swap": (
+            lambda: zenith_swap_encode_abi(router=router, swap_args=swap_args, deadline=deadline),
+            lambda: zenith_swap_encoders(swap_args=swap_args, deadline=deadline),
+        ),
+    }
+
+    print(f"{'call':<12} {'encode_abi':>12} {'Encoders':>12} {'speedup':>8}")
+    for name, (encode_abi, encoder) in cases.items():
+        if HexBytes(encode_abi()) != HexBytes(encoder()):
+            raise ValueError(f"{name}: calldata differs from encode_abi")
+
+        encode_abi_time = timeit.timeit(encode_abi, number=ITERATIONS) / ITERATIONS * 1e6
+        encoder_time = timeit.timeit(encoder, number=ITERATIONS) / ITERATIONS * 1e6
+        print(f"{name:<12} {encode_abi_time:>10.1f}us {encoder_time:>10.1f}us {encode_abi_time / encoder_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
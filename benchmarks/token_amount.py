@@ -0,0 +1,66 @@
+"""
+Compares the slotted TokenAmount with the previous implementation that computed Ether and Gwei eagerly. Run from the
+repository root:
+
+    python -m benchmarks.token_amount
+"""
+
+import sys
+import timeit
+from decimal import Decimal
+
+from libs.eth_async.data.models import TokenAmount
+
+ITERATIONS = 100_000
+REPEAT = 5
+
+
+class EagerTokenAmount:
+    """The previous TokenAmount, kept as the baseline."""
+
+    def __init__(self, amount, decimals: int = 18, wei: bool = False, gwei: bool = False) -> None:
+        if wei:
+            self.Wei: int = int(amount)
+            self.Ether: Decimal = Decimal(str(amount)) / 10**decimals
+            self.Gwei: Decimal = self.Wei / Decimal(10**9)
+        elif gwei:
+            self.Gwei: Decimal = Decimal(str(amount))
+            self.Wei: int = int(self.Gwei * 10**9)
+            self.Ether: Decimal = Decimal(self.Wei) / 10**decimals
+        else:
+            self.Ether: Decimal = Decimal(str(amount))
+            self.Wei: int = int(self.Ether * 10**decimals)
+            self.Gwei: Decimal = self.Wei / Decimal(10**9)
+
+        self.decimals = decimals
+
+
+def best(func) -> float:
+    return min(timeit.repeat(func, number=ITERATIONS, repeat=REPEAT)) / ITERATIONS * 1e6
+
+
+def main():
+    cases = {
+        "wei=True": {"amount": 1234567890123456789, "wei": True},
+        "from Ether": {"amount": 1.2345},
+        "gwei=True": {"amount": 15, "gwei": True},
+    }
+
+    print(f"{'construction':<14} {'eager':>10} {'slotted':>10}")
+    for name, kwargs in cases.items():
+        eager = EagerTokenAmount(**kwargs)
+        slotted = TokenAmount(**kwargs)
+        if (eager.Wei, eager.Ether, eager.Gwei) != (slotted.Wei, slotted.Ether, slotted.Gwei):
+            raise ValueError(f"{name}: values differ from the previous implementation")
+
+        eager_time = best(lambda: EagerTokenAmount(**kwargs))
+        slotted_time = best(lambda: TokenAmount(**kwargs))
+        print(f"{name:<14} {eager_time:>8.2f}us {slotted_time:>8.2f}us")
+
+    eager = EagerTokenAmount(amount=10**18, wei=True)
+    slotted = TokenAmount(amount=10**18, wei=True)
+    print(f"instance size: {sys.getsizeof(eager) + sys.getsizeof(eager.__dict__)} -> {sys.getsizeof(slotted)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,116 +1,242 @@
 from __future__ import annotations
 
+import os
 import sys
+from dataclasses import dataclass, field, fields
+from typing import Any
 
 import yaml
 from loguru import logger
 
 from data.config import LOG_FILE, SETTINGS_FILE
-from libs.eth_async.classes import Singleton
-
-
-class Settings(Singleton):
-    def __init__(self):
-        with open(SETTINGS_FILE, "r") as file:
-            json_data = yaml.safe_load(file) or {}
-
-        self.private_key_encryption = json_data.get("private_key_encryption", False)
-        self.threads = json_data.get("threads", 4)
-        self.range_wallets_to_run = json_data.get("range_wallets_to_run", [0, 0])
-        self.exact_wallets_to_run = json_data.get("exact_wallets_to_run", [])
-        self.shuffle_wallets = json_data.get("shuffle_wallets", True)
-        self.hide_wallet_address_log = json_data.get("hide_wallet_address_log", True)
-        self.log_level = json_data.get("log_level", "INFO")
-        self.check_git_updates = json_data.get("check_git_updates", True)
-        self.sleep_after_each_cycle_hours = json_data.get("sleep_after_each_cycle_hours", 0)
-        self.random_pause_start_wallet_min = json_data.get("random_pause_start_wallet", {}).get("min")
-        self.random_pause_start_wallet_max = json_data.get("random_pause_start_wallet", {}).get("max")
-        self.random_pause_between_actions_min = json_data.get("random_pause_between_actions", {}).get("min")
-        self.random_pause_between_actions_max = json_data.get("random_pause_between_actions", {}).get("max")
-        self.random_pause_wallet_after_completion_min = json_data.get("random_pause_wallet_after_completion", {}).get("min")
-        self.random_pause_wallet_after_completion_max = json_data.get("random_pause_wallet_after_completion", {}).get("max")
-        self.swap_percent_from = json_data.get("swap_percent", {}).get("min")
-        self.swap_percent_to = json_data.get("swap_percent", {}).get("max")
-        self.autostake_percent_min = json_data.get("autostake_percent", {}).get("min")
-        self.autostake_percent_max = json_data.get("autostake_percent", {}).get("max")
-        self.invite_codes = json_data.get("invite_codes", [])
-        self.swaps_count_min = json_data.get("swaps_count", {}).get("min")
-        self.swaps_count_max = json_data.get("swaps_count", {}).get("max")
-        self.tips_count_min = json_data.get("tips_count", {}).get("min")
-        self.tips_count_max = json_data.get("tips_count", {}).get("max")
-        self.domains_count_min = json_data.get("domains_count", {}).get("min")
-        self.domains_count_max = json_data.get("domains_count", {}).get("max")
-        self.autostake_count_min = json_data.get("autostake_count", {}).get("min")
-        self.autostake_count_max = json_data.get("autostake_count", {}).get("max")
-        self.liquidity_count_min = json_data.get("liquidity_count", {}).get("min")
-        self.liquidity_count_max = json_data.get("liquidity_count", {}).get("max")
-        self.lending_count_min = json_data.get("lending_count", {}).get("min")
-        self.lending_count_max = json_data.get("lending_count", {}).get("max")
-        self.liquidity_percent_min = json_data.get("liquidity_percent", {}).get("min")
-        self.liquidity_percent_max = json_data.get("liquidity_percent", {}).get("max")
-        self.brokex_percent_min = json_data.get("brokex_percent", {}).get("min")
-        self.brokex_percent_max = json_data.get("brokex_percent", {}).get("max")
-        self.brokex_count_min = json_data.get("brokex_count", {}).get("min")
-        self.brokex_count_max = json_data.get("brokex_count", {}).get("max")
-        self.retry = json_data.get("retry", {})
-        self.discord_proxy = json_data.get("discord_proxy", {})
-        self.capmonster_api_key = json_data.get("capmonster_api_key", {})
-        self.bitverse_count_min = json_data.get("bitverse_count", {}).get("min")
-        self.bitverse_count_max = json_data.get("bitverse_count", {}).get("max")
-
-        self.bitverse_spot_count_min = json_data.get("bitverse_spot", {}).get("min")
-        self.bitverse_spot_count_max = json_data.get("bitverse_spot", {}).get("max")
-
-        self.bitverse_liquidity_count_min = json_data.get("bitverse_liquidity", {}).get("min")
-        self.bitverse_liquidity_count_max = json_data.get("bitverse_liquidity", {}).get("max")
-
-        self.bitverse_liquidity_percent_min = json_data.get("bitverse_liquidity_percent", {}).get("min")
-        self.bitverse_liquidity_percent_max = json_data.get("bitverse_liquidity_percent", {}).get("max")
-
-        self.bitverse_percent_min = json_data.get("bitverse_percent", {}).get("min")
-        self.bitverse_percent_max = json_data.get("bitverse_percent", {}).get("max")
-
-        self.r2_swap_min = json_data.get("r2_swap", {}).get("min")
-        self.r2_swap_max = json_data.get("r2_swap", {}).get("max")
-
-        self.r2_stake_min = json_data.get("r2_stake", {}).get("min")
-        self.r2_stake_max = json_data.get("r2_stake", {}).get("max")
-
-        self.r2_count_min = json_data.get("r2_count", {}).get("min")
-        self.r2_count_max = json_data.get("r2_count", {}).get("max")
-
-        self.spout_count_min = json_data.get("spout_count", {}).get("min")
-        self.spout_count_max = json_data.get("spout_count", {}).get("max")
-
-        self.spout_percent_min = json_data.get("spout_percent", {}).get("min")
-        self.spout_percent_max = json_data.get("spout_percent", {}).get("max")
-
-        self.gotchipus_count_min = json_data.get("gotchipus_count", {}).get("min")
-        self.gotchipus_count_max = json_data.get("gotchipus_count", {}).get("max")
-
-        self.monad_transfer_min = json_data.get("monad_transfer", {}).get("min")
-        self.monad_transfer_max = json_data.get("monad_transfer", {}).get("max")
-
-        self.asseto_count_min = json_data.get("asseto_count", {}).get("min")
-        self.asseto_count_max = json_data.get("asseto_count", {}).get("max")
-        self.asseto_percent_min = json_data.get("asseto_percent", {}).get("min")
-        self.asseto_percent_max = json_data.get("asseto_percent", {}).get("max")
-
-        self.zenith_liq_min = json_data.get("zenith_liq", {}).get("min")
-        self.zenith_liq_max = json_data.get("zenith_liq", {}).get("max")
-
-        self.aquaflux_deposit_min = json_data.get("aquaflux_deposit", {}).get("min")
-        self.aquaflux_deposit_max = json_data.get("aquaflux_deposit", {}).get("max")
-
-        self.aquaflux_earn_min = json_data.get("aquaflux_earn", {}).get("min")
-        self.aquaflux_earn_max = json_data.get("aquaflux_earn", {}).get("max")
+
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+
+
+class _SettingsMeta(type):
+    def __call__(cls, *args, **kwargs):
+        # Settings() keeps returning the current settings, explicit arguments build a new instance
+        if args or kwargs:
+            return super().__call__(*args, **kwargs)
+
+        return cls.load()
+
+
+@dataclass(frozen=True, slots=True)
+class Settings(metaclass=_SettingsMeta):
+    """
+    Immutable settings parsed from files/settings.yaml.
+
+    'Settings()' returns the current instance. The file is parsed once and again only when its modification time
+    changes, so reading settings in hot paths costs a single stat call.
+    """
+
+    private_key_encryption: bool = False
+    threads: int = 4
+    range_wallets_to_run: list[int] = field(default_factory=lambda: [0, 0])
+    exact_wallets_to_run: list[int] = field(default_factory=list)
+    shuffle_wallets: bool = True
+    hide_wallet_address_log: bool = True
+    log_level: str = "INFO"
+    check_git_updates: bool = True
+    sleep_after_each_cycle_hours: int = 0
+    random_pause_start_wallet_min: int | float | None = None
+    random_pause_start_wallet_max: int | float | None = None
+    random_pause_between_actions_min: int | float | None = None
+    random_pause_between_actions_max: int | float | None = None
+    random_pause_wallet_after_completion_min: int | float | None = None
+    random_pause_wallet_after_completion_max: int | float | None = None
+    swap_percent_from: int | float | None = None
+    swap_percent_to: int | float | None = None
+    autostake_percent_min: int | float | None = None
+    autostake_percent_max: int | float | None = None
+    invite_codes: list = field(default_factory=list)
+    swaps_count_min: int | float | None = None
+    swaps_count_max: int | float | None = None
+    tips_count_min: int | float | None = None
+    tips_count_max: int | float | None = None
+    domains_count_min: int | float | None = None
+    domains_count_max: int | float | None = None
+    autostake_count_min: int | float | None = None
+    autostake_count_max: int | float | None = None
+    liquidity_count_min: int | float | None = None
+    liquidity_count_max: int | float | None = None
+    lending_count_min: int | float | None = None
+    lending_count_max: int | float | None = None
+    liquidity_percent_min: int | float | None = None
+    liquidity_percent_max: int | float | None = None
+    brokex_percent_min: int | float | None = None
+    brokex_percent_max: int | float | None = None
+    brokex_count_min: int | float | None = None
+    brokex_count_max: int | float | None = None
+    retry: Any = field(default_factory=dict)
+    discord_proxy: Any = field(default_factory=dict)
+    capmonster_api_key: Any = field(default_factory=dict)
+    bitverse_count_min: int | float | None = None
+    bitverse_count_max: int | float | None = None
+    bitverse_spot_count_min: int | float | None = None
+    bitverse_spot_count_max: int | float | None = None
+    bitverse_liquidity_count_min: int | float | None = None
+    bitverse_liquidity_count_max: int | float | None = None
+    bitverse_liquidity_percent_min: int | float | None = None
+    bitverse_liquidity_percent_max: int | float | None = None
+    bitverse_percent_min: int | float | None = None
+    bitverse_percent_max: int | float | None = None
+    r2_swap_min: int | float | None = None
+    r2_swap_max: int | float | None = None
+    r2_stake_min: int | float | None = None
+    r2_stake_max: int | float | None = None
+    r2_count_min: int | float | None = None
+    r2_count_max: int | float | None = None
+    spout_count_min: int | float | None = None
+    spout_count_max: int | float | None = None
+    spout_percent_min: int | float | None = None
+    spout_percent_max: int | float | None = None
+    gotchipus_count_min: int | float | None = None
+    gotchipus_count_max: int | float | None = None
+    monad_transfer_min: int | float | None = None
+    monad_transfer_max: int | float | None = None
+    asseto_count_min: int | float | None = None
+    asseto_count_max: int | float | None = None
+    asseto_percent_min: int | float | None = None
+    asseto_percent_max: int | float | None = None
+    zenith_liq_min: int | float | None = None
+    zenith_liq_max: int | float | None = None
+    aquaflux_deposit_min: int | float | None = None
+    aquaflux_deposit_max: int | float | None = None
+    aquaflux_earn_min: int | float | None = None
+    aquaflux_earn_max: int | float | None = None
+
+    def __post_init__(self) -> None:
+        if self.log_level not in LOG_LEVELS:
+            raise ValueError(f"Invalid log level: {self.log_level}. Must be one of: {', '.join(LOG_LEVELS)}")
+
+        if not isinstance(self.threads, int) or self.threads < 1:
+            raise ValueError(f"Invalid threads: {self.threads}. Must be a positive integer")
+
+        for field_ in fields(self):
+            if not field_.name.endswith("_min"):
+                continue
+
+            min_value, max_value = getattr(self, field_.name), getattr(self, field_.name[:-4] + "_max", None)
+            if isinstance(min_value, (int, float)) and isinstance(max_value, (int, float)) and min_value > max_value:
+                raise ValueError(f"Invalid {field_.name[:-4]}: min {min_value} is greater than max {max_value}")
+
+    @classmethod
+    def from_dict(cls, json_data: dict) -> Settings:
+        return cls(
+            private_key_encryption=json_data.get("private_key_encryption", False),
+            threads=json_data.get("threads", 4),
+            range_wallets_to_run=json_data.get("range_wallets_to_run", [0, 0]),
+            exact_wallets_to_run=json_data.get("exact_wallets_to_run", []),
+            shuffle_wallets=json_data.get("shuffle_wallets", True),
+            hide_wallet_address_log=json_data.get("hide_wallet_address_log", True),
+            log_level=json_data.get("log_level", "INFO"),
+            check_git_updates=json_data.get("check_git_updates", True),
+            sleep_after_each_cycle_hours=json_data.get("sleep_after_each_cycle_hours", 0),
+            random_pause_start_wallet_min=json_data.get("random_pause_start_wallet", {}).get("min"),
+            random_pause_start_wallet_max=json_data.get("random_pause_start_wallet", {}).get("max"),
+            random_pause_between_actions_min=json_data.get("random_pause_between_actions", {}).get("min"),
+            random_pause_between_actions_max=json_data.get("random_pause_between_actions", {}).get("max"),
+            random_pause_wallet_after_completion_min=json_data.get("random_pause_wallet_after_completion", {}).get("min"),
+            random_pause_wallet_after_completion_max=json_data.get("random_pause_wallet_after_completion", {}).get("max"),
+            swap_percent_from=json_data.get("swap_percent", {}).get("min"),
+            swap_percent_to=json_data.get("swap_percent", {}).get("max"),
+            autostake_percent_min=json_data.get("autostake_percent", {}).get("min"),
+            autostake_percent_max=json_data.get("autostake_percent", {}).get("max"),
+            invite_codes=json_data.get("invite_codes", []),
+            swaps_count_min=json_data.get("swaps_count", {}).get("min"),
+            swaps_count_max=json_data.get("swaps_count", {}).get("max"),
+            tips_count_min=json_data.get("tips_count", {}).get("min"),
+            tips_count_max=json_data.get("tips_count", {}).get("max"),
+            domains_count_min=json_data.get("domains_count", {}).get("min"),
+            domains_count_max=json_data.get("domains_count", {}).get("max"),
+            autostake_count_min=json_data.get("autostake_count", {}).get("min"),
+            autostake_count_max=json_data.get("autostake_count", {}).get("max"),
+            liquidity_count_min=json_data.get("liquidity_count", {}).get("min"),
+            liquidity_count_max=json_data.get("liquidity_count", {}).get("max"),
+            lending_count_min=json_data.get("lending_count", {}).get("min"),
+            lending_count_max=json_data.get("lending_count", {}).get("max"),
+            liquidity_percent_min=json_data.get("liquidity_percent", {}).get("min"),
+            liquidity_percent_max=json_data.get("liquidity_percent", {}).get("max"),
+            brokex_percent_min=json_data.get("brokex_percent", {}).get("min"),
+            brokex_percent_max=json_data.get("brokex_percent", {}).get("max"),
+            brokex_count_min=json_data.get("brokex_count", {}).get("min"),
+            brokex_count_max=json_data.get("brokex_count", {}).get("max"),
+            retry=json_data.get("retry", {}),
+            discord_proxy=json_data.get("discord_proxy", {}),
+            capmonster_api_key=json_data.get("capmonster_api_key", {}),
+            bitverse_count_min=json_data.get("bitverse_count", {}).get("min"),
+            bitverse_count_max=json_data.get("bitverse_count", {}).get("max"),
+            bitverse_spot_count_min=json_data.get("bitverse_spot", {}).get("min"),
+            bitverse_spot_count_max=json_data.get("bitverse_spot", {}).get("max"),
+            bitverse_liquidity_count_min=json_data.get("bitverse_liquidity", {}).get("min"),
+            bitverse_liquidity_count_max=json_data.get("bitverse_liquidity", {}).get("max"),
+            bitverse_liquidity_percent_min=json_data.get("bitverse_liquidity_percent", {}).get("min"),
+            bitverse_liquidity_percent_max=json_data.get("bitverse_liquidity_percent", {}).get("max"),
+            bitverse_percent_min=json_data.get("bitverse_percent", {}).get("min"),
+            bitverse_percent_max=json_data.get("bitverse_percent", {}).get("max"),
+            r2_swap_min=json_data.get("r2_swap", {}).get("min"),
+            r2_swap_max=json_data.get("r2_swap", {}).get("max"),
+            r2_stake_min=json_data.get("r2_stake", {}).get("min"),
+            r2_stake_max=json_data.get("r2_stake", {}).get("max"),
+            r2_count_min=json_data.get("r2_count", {}).get("min"),
+            r2_count_max=json_data.get("r2_count", {}).get("max"),
+            spout_count_min=json_data.get("spout_count", {}).get("min"),
+            spout_count_max=json_data.get("spout_count", {}).get("max"),
+            spout_percent_min=json_data.get("spout_percent", {}).get("min"),
+            spout_percent_max=json_data.get("spout_percent", {}).get("max"),
+            gotchipus_count_min=json_data.get("gotchipus_count", {}).get("min"),
+            gotchipus_count_max=json_data.get("gotchipus_count", {}).get("max"),
+            monad_transfer_min=json_data.get("monad_transfer", {}).get("min"),
+            monad_transfer_max=json_data.get("monad_transfer", {}).get("max"),
+            asseto_count_min=json_data.get("asseto_count", {}).get("min"),
+            asseto_count_max=json_data.get("asseto_count", {}).get("max"),
+            asseto_percent_min=json_data.get("asseto_percent", {}).get("min"),
+            asseto_percent_max=json_data.get("asseto_percent", {}).get("max"),
+            zenith_liq_min=json_data.get("zenith_liq", {}).get("min"),
+            zenith_liq_max=json_data.get("zenith_liq", {}).get("max"),
+            aquaflux_deposit_min=json_data.get("aquaflux_deposit", {}).get("min"),
+            aquaflux_deposit_max=json_data.get("aquaflux_deposit", {}).get("max"),
+            aquaflux_earn_min=json_data.get("aquaflux_earn", {}).get("min"),
+            aquaflux_earn_max=json_data.get("aquaflux_earn", {}).get("max"),
+        )
+
+    @classmethod
+    def load(cls) -> Settings:
+        """
+        Get the current settings, parsing the file if it changed since the last load.
+
+        An invalid file raises on the first load. Later, the error is logged and the previous settings stay in use.
+        """
+        global _loaded
+
+        mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+        if _loaded is not None and _loaded[0] == mtime:
+            return _loaded[1]
+
+        try:
+            with open(SETTINGS_FILE, "r") as file:
+                settings = cls.from_dict(yaml.safe_load(file) or {})
+
+        except Exception as err:
+            if _loaded is None:
+                raise
+
+            logger.error(f"Settings | Failed to reload {SETTINGS_FILE}, keeping previous settings: {err}")
+            _loaded = (mtime, _loaded[1])
+            return _loaded[1]
+
+        _loaded = (mtime, settings)
+        return settings
+
+
+_loaded: tuple[int, Settings] | None = None
 
 
 # Configure the logger based on the settings
 settings = Settings()
 
-if settings.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR"]:
-    raise ValueError(f"Invalid log level: {settings.log_level}. Must be one of: DEBUG, INFO, WARNING, ERROR")
 logger.remove()  # Remove the default logger
 logger.add(sys.stderr, level=settings.log_level)
 
@@ -13,10 +13,12 @@ from libs.eth_async.client import Client
 from libs.eth_async.data.models import Networks
 from modules.euclid import EuclidSwap
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db
+from utils.db_api.wallet_api import adb
+from utils.db_update import update_expired, update_next_action_time
 from utils.discord.discord import DiscordStatus
 from utils.encryption import check_encrypt_param
 from utils.resource_manager import replace_twitter_tokens
+from utils.scheduler import WalletScheduler, pause
 from utils.twitter.twitter_client import TwitterStatuses
 
 
@@ -25,13 +27,11 @@ async def random_sleep_before_start(wallet):
     now = datetime.now()
 
     logger.info(f"{wallet} Start at {now + timedelta(seconds=random_sleep)} sleep {random_sleep} seconds before start actions")
-    await asyncio.sleep(random_sleep)
+    await pause(random_sleep)
 
 
 async def random_activity_task(wallet):
     try:
-        await random_sleep_before_start(wallet=wallet)
-
         if wallet.twitter_status and wallet.twitter_status in [
             TwitterStatuses.bad_token,
             TwitterStatuses.relogin,
@@ -66,7 +66,7 @@ async def random_activity_task(wallet):
                     continue
 
                 finally:
-                    await asyncio.sleep(sleep)
+                    await pause(sleep)
 
         await controller.update_db_by_user_info()
 
@@ -78,38 +78,25 @@ async def random_activity_task(wallet):
         raise e
 
 
-async def execute(wallets: List[Wallet], task_func, random_pause_wallet_after_completion: int = 0):
-    while True:
-        semaphore = asyncio.Semaphore(min(len(wallets), Settings().threads))
-
-        if Settings().shuffle_wallets:
-            random.shuffle(wallets)
-
-        async def sem_task(wallet: Wallet):
-            async with semaphore:
-                try:
-                    await asyncio.wait_for(task_func(wallet), timeout=3600)
-
-                except asyncio.TimeoutError:
-                    logger.error(f"[{wallet.id}] Core Execution Tasks |{task_func.__name__} timed out after 60m")
+async def save_next_action_time(wallet: Wallet, seconds: int):
+    await update_next_action_time(private_key=wallet.private_key, seconds=seconds)
 
-                except Exception as e:
-                    logger.error(f"[{wallet.id}] failed: {e}")
 
-        tasks = [asyncio.create_task(sem_task(wallet)) for wallet in wallets]
-        await asyncio.gather(*tasks, return_exceptions=True)
+def completion_pause() -> tuple[int, int]:
+    return Settings().random_pause_wallet_after_completion_min, Settings().random_pause_wallet_after_completion_max
 
-        if random_pause_wallet_after_completion == 0:
-            break
 
-        # update dynamically the pause time
-        random_pause_wallet_after_completion = random.randint(
-            Settings().random_pause_wallet_after_completion_min, Settings().random_pause_wallet_after_completion_max
-        )
+async def execute(wallets: List[Wallet], task_func, repeat_pause: tuple[int, int] | None = None, persist: bool = False):
+    if Settings().shuffle_wallets:
+        random.shuffle(wallets)
 
-        next_run = datetime.now() + timedelta(seconds=random_pause_wallet_after_completion)
-        logger.info(f"Sleeping {random_pause_wallet_after_completion} seconds. Next run at: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-        await asyncio.sleep(random_pause_wallet_after_completion)
+    scheduler = WalletScheduler(
+        task_func=task_func,
+        threads=Settings().threads,
+        repeat_pause=repeat_pause,
+        on_reschedule=save_next_action_time if persist else None,
+    )
+    await scheduler.run(wallets, start_at=(lambda wallet: wallet.next_activity_action_time) if persist else None)
 
 
 async def activity(action: int):
@@ -117,7 +104,8 @@ async def activity(action: int):
         logger.error(f"Decryption Failed | Wrong Password")
         return
 
-    wallets = db.all(Wallet)
+    # rows may have been changed by the menu through the sync DB since the last run
+    wallets = await adb.all(Wallet, refresh=True)
 
     range_wallets = Settings().range_wallets_to_run
     if range_wallets != [0, 0]:
@@ -128,14 +116,11 @@ async def activity(action: int):
             wallets = [wallet for i, wallet in enumerate(wallets, start=1) if i in Settings().exact_wallets_to_run]
 
     if action == 1:
-        await execute(
-            wallets,
-            random_activity_task,
-            random.randint(Settings().random_pause_wallet_after_completion_min, Settings().random_pause_wallet_after_completion_max),
-        )
+        await update_expired(wallets)
+        await execute(wallets, random_activity_task, repeat_pause=completion_pause(), persist=True)
 
     elif action == 2:
-        await execute(wallets, twitter_tasks, Settings().sleep_after_each_cycle_hours)
+        await execute(wallets, twitter_tasks, repeat_pause=completion_pause() if Settings().sleep_after_each_cycle_hours else None)
 
     elif action == 3:
         wallets = [wallet for wallet in wallets if wallet.discord_token is not None and wallet.discord_status in [None, DiscordStatus.ok]]
@@ -159,7 +144,7 @@ async def activity(action: int):
             for i, w in enumerate(wallets):
                 w.discord_proxy = discord_proxies[i % n_proxies]
 
-        await execute(wallets, join_discord, 0)
+        await execute(wallets, join_discord)
 
     elif action == 4:
         await execute(wallets, update_points)
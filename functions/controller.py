@@ -2,6 +2,7 @@ import asyncio
 import json
 import random
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from eth_utils import to_checksum_address
 from faker import Faker
@@ -36,46 +37,75 @@ from modules.watchoor import Watchoor
 from modules.asseto import Asseto
 
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db
+from utils.db_api.wallet_api import adb
 from utils.discord.discord import DiscordOAuth, DiscordInviter, DiscordStatus
 from utils.logs_decorator import controller_log
 from utils.query_json import query_to_json
 from utils.twitter.twitter_client import TwitterClient, TwitterStatuses
 from utils.db_update import update_points_invites
 from utils.retry import async_retry
+from utils.shared_cache import SharedCache
+from functions.wallet_snapshot import WalletSnapshot
+
+RECENT_TXS_URL = 'https://api.socialscan.io/pharos-testnet/v1/explorer/transactions?size=12'
+RECENT_TXS_TTL = 30
+
+
+class LazyModule:
+    """
+    A protocol module constructed on first access and cached on the controller, so flows pay only for the modules
+    they use.
+    """
+
+    def __init__(self, module_class):
+        self.module_class = module_class
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, controller, owner=None):
+        if controller is None:
+            return self
+
+        module = controller.__dict__[self.name] = self.module_class(client=controller.client, wallet=controller.wallet)
+        return module
 
 
 class Controller:
     __controller__ = 'Controller'
 
+    base = LazyModule(Base)
+    pharos_portal = LazyModule(PharosPortal)
+    zenith = LazyModule(Zenith)
+    zenith_liq = LazyModule(ZenithLiquidity)
+    zenith_new = LazyModule(ZenithNew)
+    primus = LazyModule(Primus)
+    pns = LazyModule(PNS)
+    autostaking = LazyModule(AutoStaking)
+    brokex = LazyModule(Brokex)
+    aquaflux = LazyModule(AquaFlux)
+    nfts = LazyModule(NFTS)
+    faroswap = LazyModule(Faroswap)
+    faroswap_liqudity = LazyModule(FaroswapLiquidity)
+    openfi = LazyModule(OpenFi)
+    bitverse = LazyModule(Bitverse)
+    r2 = LazyModule(R2)
+    spout = LazyModule(Spout)
+    gotchipus = LazyModule(Gotchipus)
+    watchoor = LazyModule(Watchoor)
+    asseto = LazyModule(Asseto)
+    bitverse_spot_swap = LazyModule(BitverseSpot)
+    bitverse_spot_liquidity = LazyModule(BitverseLiquidity)
+    checker = LazyModule(Checker)
+
     def __init__(self, client: Client, wallet: Wallet):
         # super().__init__(client)
         self.client = client
         self.wallet = wallet
-        self.base = Base(client=client, wallet=wallet)
-        self.pharos_portal = PharosPortal(client=client, wallet=wallet)
-        self.twitter = TwitterClient(user=wallet)
-        self.zenith = Zenith(client=client, wallet=wallet)
-        self.zenith_liq = ZenithLiquidity(client=client, wallet=wallet)
-        self.zenith_new = ZenithNew(client=client, wallet=wallet)
-        self.primus = Primus(client=client, wallet=wallet)
-        self.pns = PNS(client=client, wallet=wallet)
-        self.autostaking = AutoStaking(client=client, wallet=wallet)
-        self.brokex = Brokex(client=client, wallet=wallet)
-        self.aquaflux = AquaFlux(client=client, wallet=wallet)
-        self.nfts = NFTS(client=client, wallet=wallet)
-        self.faroswap = Faroswap(client=client, wallet=wallet)
-        self.faroswap_liqudity = FaroswapLiquidity(client=client, wallet=wallet)
-        self.openfi = OpenFi(client=client, wallet=wallet)
-        self.bitverse = Bitverse(client=client, wallet=wallet)
-        self.r2 = R2(client=client, wallet=wallet)
-        self.spout = Spout(client=client, wallet=wallet)
-        self.gotchipus = Gotchipus(client=client, wallet=wallet)
-        self.watchoor = Watchoor(client=client, wallet=wallet)
-        self.asseto = Asseto(client=client, wallet=wallet)
-        self.bitverse_spot_swap = BitverseSpot(client=client, wallet=wallet)
-        self.bitverse_spot_liquidity = BitverseLiquidity(client=client, wallet=wallet)
-        self.checker = Checker(client=client, wallet=wallet)
+
+    @cached_property
+    def twitter(self) -> TwitterClient:
+        return TwitterClient(user=self.wallet)
 
     @controller_log('CheckIn')
     async def check_in_task(self):
@@ -152,7 +182,7 @@ class Controller:
                 if 'Failed' not in faucet:
                     now = datetime.now()
                     self.wallet.next_faucet_time = now + timedelta(minutes=random.randint(1440, 1540))
-                    db.commit()
+                    await adb.commit()
 
                     await asyncio.sleep(random.randint(12, 20))
                     try:
@@ -388,16 +418,18 @@ class Controller:
     async def r2_swap(self):
         return await self.r2.r2_controller(action='swap')
 
-    @async_retry(retries=3, delay=3, to_raise=False)
-    async def get_onchain_txs(self) -> list:
-        url = 'https://api.socialscan.io/pharos-testnet/v1/explorer/transactions?size=12'
-
-        r = await self.pharos_portal.session.get(url=url)
+    async def _get_recent_txs(self) -> list:
+        r = await self.pharos_portal.session.get(url=RECENT_TXS_URL)
 
         if not r.json().get('data'):
             raise Exception(f"No Onchain tx data")
 
-        data =  r.json().get('data')
+        return r.json().get('data')
+
+    @async_retry(retries=3, delay=3, to_raise=False)
+    async def get_onchain_txs(self) -> list:
+        # the recent transactions page is the same for every wallet
+        data = await SharedCache.get(key=RECENT_TXS_URL, fetch=self._get_recent_txs, ttl=RECENT_TXS_TTL)
         return [item['from_address'] for item in data][5:]
 
     @controller_log('Send Tokens Onchain')
@@ -412,7 +444,7 @@ class Controller:
         amount = randfloat(from_=0.00001, to_=0.0005, step=0.00001)
         amount = TokenAmount(amount=amount)
         balance = await self.client.wallet.balance()
-        if float(amount.Ether) > float(balance.Ether):
+        if amount > balance:
             return "Failed Wallet balance to small"
 
         tx = await self.base.send_eth(to_address=to_checksum_address(to_address), amount=amount)
@@ -422,7 +454,8 @@ class Controller:
 
     async def build_actions(self):
 
-        user_tasks = await self.user_tasks()
+        snapshot = await WalletSnapshot.fetch(self)
+        user_tasks = snapshot.user_tasks
 
         final_actions = []
 
@@ -434,7 +467,7 @@ class Controller:
 
         if not self.wallet.next_faucet_time:
             self.wallet.next_faucet_time = now
-            db.commit()
+            await adb.commit()
             if self.wallet.twitter_token: build_array.append(lambda: self.zenith_faucet())
 
         # swaps_count = random.randint(settings.swaps_count_min, settings.swaps_count_max)
@@ -464,7 +497,7 @@ class Controller:
         bitverse_spot = random.randint(settings.bitverse_spot_count_min, settings.bitverse_spot_count_max)
         bitverse_spot_liq = random.randint(settings.bitverse_liquidity_count_min, settings.bitverse_liquidity_count_max)
 
-        wallet_balance = await self.client.wallet.balance()
+        wallet_balance = snapshot.balance
 
 
         if wallet_balance.Ether == 0:
@@ -472,27 +505,25 @@ class Controller:
             logger.success(register)
 
             await asyncio.sleep(9, 12)
-            wallet_balance = await self.client.wallet.balance()
+            snapshot = await WalletSnapshot.fetch(self)
+            user_tasks = snapshot.user_tasks
+            wallet_balance = snapshot.balance
 
             if wallet_balance.Ether == 0:
                 raise Exception(f'{self.wallet} | Failed Faucet | Got 0 PHRS after registration task')
 
         if wallet_balance:
 
-            wphrs = await self.client.wallet.balance(token=Contracts.WPHRS)
-
-
+            wphrs = snapshot.wphrs_balance
 
             if float(wphrs.Ether) > 0:
                 await self.base.unwrap_eth(amount=wphrs)
 
-            await asyncio.sleep(3, 5)
+                await asyncio.sleep(3, 5)
 
-            user_tasks = await self.user_tasks()
-
-            wallet_balance = await self.client.wallet.balance()
+                wallet_balance = await self.client.wallet.balance()
 
-            faucet_status = await self.pharos_portal.get_faucet_status()
+            faucet_status = snapshot.faucet_status
 
             if faucet_status.get('data').get('is_able_to_faucet'):
                 await self.faucet_task()
@@ -502,7 +533,7 @@ class Controller:
                     logger.warning(f"{self.wallet} | Not enought balance for actions | Awaiting for next faucet")
                     return f"{self.wallet} | Not enought balance for actions | Awaiting for next faucet"
 
-            usdc_balance = await self.client.wallet.balance(token=Contracts.USDC)
+            usdc_balance = snapshot.usdc_balance
             if float(usdc_balance.Ether) > 900:
                 try:
                     await self.swap_usdc_from_zenith()
@@ -522,21 +553,20 @@ class Controller:
                 # usdc_r2_balance = await self.client.wallet.balance(token=USDC_R2)
                 # wallet_balance = await self.client.wallet.balance()
 
-            twitter_tasks, discord_tasks = await self.pharos_portal.tasks_flow()
-            twitter_tasks = await self.pharos_portal.prepare_twitter_tasks(twitter_tasks=twitter_tasks, user_tasks=user_tasks)
+            twitter_tasks = await self.pharos_portal.prepare_twitter_tasks(twitter_tasks=snapshot.twitter_tasks, user_tasks=user_tasks)
 
             # aquaflux_nft = await self.aquaflux.already_minted(premium=True)
 
             # brokex_faucet = await self.brokex.has_claimed()
 
-            user_data = await self.pharos_portal.get_user_info()
+            user_data = snapshot.user_info
 
             if user_data.get('XId') != "":
                 if len(twitter_tasks) > 0:
                     build_array.append(lambda: self.twitter_tasks(tasks_to_do=twitter_tasks))
 
             if wallet_balance.Ether > 0.1:
-                nft_badges = await self.nfts.check_badges()
+                nft_badges = snapshot.nft_badges
 
                 if len(nft_badges) > 0:
                     final_actions.append(lambda: self.nfts.nfts_controller(not_minted=nft_badges))
@@ -712,7 +742,7 @@ class Controller:
                     if 'Failed' not in join_to_channel:
 
                         self.wallet.discord_status = DiscordStatus.ok
-                        db.commit()
+                        await adb.commit()
                     else:
                         return f'Join Failed | {join_to_channel}'
 
@@ -732,7 +762,7 @@ class Controller:
 
                     else:
                         self.wallet.discord_status = DiscordStatus.duplicate
-                        db.commit()
+                        await adb.commit()
                         return bind_discord
 
                     await asyncio.sleep(random.randint(4, 7))
@@ -749,7 +779,7 @@ class Controller:
 
                 return await self.discord_tasks(tasks=discord_tasks)
             self.wallet.discord_status = DiscordStatus.ok
-            db.commit()
+            await adb.commit()
             return f"Already verified discord Task"
 
         return f'Failed | Something Wrong {user_data}'
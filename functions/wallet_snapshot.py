@@ -0,0 +1,79 @@
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from data.models import Contracts
+from libs.eth_async.data.models import RawContract, TokenAmount
+
+if TYPE_CHECKING:
+    from functions.controller import Controller
+
+
+@dataclass
+class WalletSnapshot:
+    """
+    The wallet state read once before planning its actions.
+
+    Attributes:
+        balance (TokenAmount): the native balance.
+        wphrs_balance (TokenAmount): the WPHRS balance.
+        usdc_balance (TokenAmount): the USDC balance.
+        user_tasks (dict[str, int]): completion counts of portal tasks by task ID.
+        twitter_tasks (list[dict]): uncompleted Twitter tasks of the portal.
+        discord_tasks (list[dict]): Discord tasks of the portal.
+        faucet_status (dict): the portal faucet status.
+        user_info (dict): the portal user profile.
+        nft_badges (list[RawContract]): badges the wallet hasn't minted.
+
+    """
+
+    balance: TokenAmount
+    wphrs_balance: TokenAmount
+    usdc_balance: TokenAmount
+    user_tasks: dict[str, int]
+    twitter_tasks: list[dict]
+    discord_tasks: list[dict]
+    faucet_status: dict
+    user_info: dict
+    nft_badges: list[RawContract]
+
+    @classmethod
+    async def fetch(cls, controller: "Controller") -> "WalletSnapshot":
+        """
+        Read the chain and portal state of the controller wallet. Independent reads are requested concurrently and
+            every endpoint is requested once.
+
+        Args:
+            controller (Controller): the wallet controller.
+
+        Returns:
+            WalletSnapshot: the snapshot.
+
+        """
+        portal = controller.pharos_portal
+        if not portal.auth:
+            await portal.login()
+
+        balance, wphrs_balance, usdc_balance, user_tasks, all_tasks, faucet_status, user_info, nft_badges = await asyncio.gather(
+            controller.client.wallet.balance(),
+            controller.client.wallet.balance(token=Contracts.WPHRS),
+            controller.client.wallet.balance(token=Contracts.USDC),
+            portal.get_user_tasks(user=True),
+            portal.get_user_tasks(),
+            portal.get_faucet_status(),
+            portal.get_user_info(),
+            controller.nfts.check_badges(),
+        )
+        twitter_tasks, discord_tasks = await portal.tasks_flow(all_tasks=all_tasks, user_tasks=user_tasks)
+
+        return cls(
+            balance=balance,
+            wphrs_balance=wphrs_balance,
+            usdc_balance=usdc_balance,
+            user_tasks={str(task.get("TaskId")): task.get("CompleteTimes") for task in user_tasks},
+            twitter_tasks=twitter_tasks,
+            discord_tasks=discord_tasks,
+            faucet_status=faucet_status,
+            user_info=user_info,
+            nft_badges=nft_badges,
+        )
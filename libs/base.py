@@ -1,15 +1,16 @@
 import asyncio
-import random
-import time
 
 from eth_account.messages import _hash_eip191_message, encode_defunct, encode_typed_data
 from hexbytes import HexBytes
 from loguru import logger
+from web3.exceptions import TimeExhausted
 from web3.types import TxParams
 
 from data.models import Contracts
+from libs.eth_async.allowance_cache import AllowanceCache
 from libs.eth_async.client import Client
-from libs.eth_async.data.models import Networks, TokenAmount, TxArgs
+from libs.eth_async.data.models import CommonValues, Networks, TokenAmount
+from libs.eth_async.encoders import Encoders
 from utils.browser import Browser
 from utils.db_api.models import Wallet
 
@@ -20,17 +21,13 @@ class Base:
     def __init__(self, client: Client, wallet: Wallet):
         self.client: Client = client
         self.wallet: Wallet = wallet
-        self.browser: Browser = Browser(wallet=self.wallet)
+        self.browser: Browser = Browser.for_wallet(wallet=self.wallet)
 
     async def balance_map(self, tokens: list):
         balance_map = {}
-        for token in tokens:
-            if token == Contracts.PHRS:
-                balance = await self.client.wallet.balance()
-            else:
-                balance = await self.client.wallet.balance(token.address)
-
-            if balance.Ether > 0.001:
+        balances = await self.client.multicall.token_balances(tokens=tokens)
+        for token, balance in zip(tokens, balances):
+            if balance and balance.Ether > 0.001:
                 balance_map[token] = balance.Ether
 
         return balance_map
@@ -47,27 +44,31 @@ class Base:
 
         for _ in range(5):
             try:
-                async with self.browser:
-                    r = await self.browser.get(url=f"https://api.binance.com/api/v3/depth?limit=1&symbol={token_symbol}{second_token}")
-                    if r.status_code != 200:
-                        return None
-                    result_dict = r.json()
-                    if "asks" not in result_dict:
-                        return None
-                    return float(result_dict["asks"][0][0])
+                r = await self.browser.get(url=f"https://api.binance.com/api/v3/depth?limit=1&symbol={token_symbol}{second_token}")
+                if r.status_code != 200:
+                    return None
+                result_dict = r.json()
+                if "asks" not in result_dict:
+                    return None
+                return float(result_dict["asks"][0][0])
             except Exception:
                 await asyncio.sleep(5)
         raise ValueError(f"Can not get {token_symbol + second_token} price from Binance")
 
     async def approve_interface(self, token_address, spender, amount: TokenAmount | None = None) -> bool:
+        chain_id = self.client.network.chain_id
+        owner = self.client.account.address
         balance = await self.client.wallet.balance(token=token_address)
         if balance.Wei <= 0:
             return False
 
+        if AllowanceCache.is_infinite(chain_id=chain_id, owner=owner, token=token_address, spender=spender):
+            return True
+
         if amount and amount.Wei > balance.Wei:
             amount = balance
 
-        approved = await self.client.transactions.approved_amount(token=token_address, spender=spender, owner=self.client.account.address)
+        approved = await self.client.transactions.approved_amount(token=token_address, spender=spender, owner=owner)
 
         if balance.Wei <= approved.Wei:
             return True
@@ -76,9 +77,16 @@ class Base:
 
         tx = await self.client.transactions.approve(token=token_address, spender=spender, amount=amount)
 
-        await asyncio.sleep(2)
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if receipt:
+            if receipt.get("status") == 1:
+                AllowanceCache.update(
+                    chain_id=chain_id,
+                    owner=owner,
+                    token=token_address,
+                    spender=spender,
+                    amount=amount.Wei if amount else CommonValues.InfinityInt,
+                )
             return True
 
         return False
@@ -119,7 +127,6 @@ class Base:
         tx_params = TxParams(to=to_address, data="0x", value=amount.Wei)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -129,22 +136,13 @@ class Base:
             return f"Balance Sender | Failed"
 
     async def wait_tx_status(self, tx_hash: HexBytes, max_wait_time=100) -> bool:
-        start_time = time.time()
-        while True:
-            try:
-                receipts = await self.client.w3.eth.get_transaction_receipt(tx_hash)
-                status = receipts.get("status")
-                if status == 1:
-                    return True
-                elif status is None:
-                    await asyncio.sleep(0.3)
-                else:
-                    return False
-            except BaseException:
-                if time.time() - start_time > max_wait_time:
-                    logger.exception(f"{self.client.account.address} получил неудачную транзакцию")
-                    return False
-                await asyncio.sleep(3)
+        try:
+            receipt = await self.client.receipt_tracker.wait(tx_hash=tx_hash, timeout=max_wait_time)
+        except TimeExhausted:
+            logger.exception(f"{self.client.account.address} получил неудачную транзакцию")
+            return False
+
+        return receipt.get("status") == 1
 
     async def wrap_eth(self, amount: TokenAmount = None):
         success_text = f"BASE | Wrap ETH | Success | {amount.Ether:.5f} ETH"
@@ -155,16 +153,11 @@ class Base:
         else:
             weth = Contracts.WETH
 
-        contract = await self.client.contracts.get(contract_address=weth)
-
-        encode = contract.encode_abi("deposit", args=[])
-        # print(encode)
-        tx_params = TxParams(to=contract.address, data=encode, value=amount.Wei)
+        tx_params = TxParams(to=weth.address, data=Encoders.deposit.encode(), value=amount.Wei)
 
         tx_label = f"Wrapped {amount.Ether:.5f}"
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -185,18 +178,11 @@ class Base:
         if not amount:
             amount = await self.client.wallet.balance(token=weth)
 
-        contract = await self.client.contracts.get(contract_address=weth)
-
-        data = TxArgs(wad=amount.Wei).tuple()
-
-        encode = contract.encode_abi("withdraw", args=data)
-        # print(encode)
-        tx_params = TxParams(to=contract.address, data=encode, value=0)
+        tx_params = TxParams(to=weth.address, data=Encoders.withdraw.encode(amount.Wei), value=0)
 
         tx_label = f"Unwrapper {amount.Ether:.5f}"
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
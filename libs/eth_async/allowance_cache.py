@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from web3 import Web3
+
+ALLOWANCE_ERRORS = ("insufficient allowance", "exceeds allowance", "allowance exceeded", "transfer_from_failed", "reverted: stf")
+
+# Allowances above this are treated as infinite. Some tokens decrease even a max approval on every spend, so the
+# value is compared with a threshold rather than with 2 ** 256 - 1.
+INFINITE_ALLOWANCE = 2**255
+
+AllowanceKey = tuple[int, str, str, str]
+
+
+class AllowanceCache:
+    """
+    A process-wide cache of infinite ERC-20 allowances keyed by (chain_id, owner, token, spender).
+
+    Finite allowances are consumed by spends, so only infinite ones are cached: once seen, they are trusted without
+    querying the node until a spend fails with an allowance error. An optional storage (see 'attach_storage') makes
+    the cache survive restarts.
+    """
+
+    _allowances: set[AllowanceKey] = set()
+    _load: Callable[[], Iterable[AllowanceKey]] | None = None
+    _save: Callable[[AllowanceKey], None] | None = None
+    _delete: Callable[[AllowanceKey], None] | None = None
+    _loaded: bool = False
+
+    @staticmethod
+    def _key(chain_id: int, owner: str, token: str, spender: str) -> AllowanceKey:
+        return int(chain_id), Web3.to_checksum_address(owner), Web3.to_checksum_address(token), Web3.to_checksum_address(spender)
+
+    @staticmethod
+    def is_allowance_error(err: BaseException) -> bool:
+        """
+        Check if a transaction error means a token allowance is too low.
+
+        :param BaseException err: the error.
+        :return bool: True if the allowance has to be checked again.
+        """
+        message = str(err).lower()
+        return any(text in message for text in ALLOWANCE_ERRORS)
+
+    @classmethod
+    def attach_storage(
+        cls,
+        load: Callable[[], Iterable[AllowanceKey]],
+        save: Callable[[AllowanceKey], None],
+        delete: Callable[[AllowanceKey], None],
+    ) -> None:
+        """
+        Attach a persistent storage. Stored allowances are loaded on first lookup, changes are saved immediately.
+
+        :param load: a function returning all stored (chain_id, owner, token, spender) keys.
+        :param save: a function storing a single key.
+        :param delete: a function removing a single key.
+        """
+        cls._load = load
+        cls._save = save
+        cls._delete = delete
+        cls._loaded = False
+
+    @classmethod
+    def _ensure_loaded(cls) -> None:
+        if cls._loaded or cls._load is None:
+            return
+
+        cls._loaded = True
+        for key in cls._load():
+            cls._allowances.add(cls._key(*key))
+
+    @classmethod
+    def is_infinite(cls, chain_id: int, owner: str, token: str, spender: str) -> bool:
+        """
+        Check if the spender is known to have an infinite allowance.
+
+        :param int chain_id: the chain ID.
+        :param str owner: the token owner.
+        :param str token: the token address.
+        :param str spender: the spender address.
+        :return bool: True if the allowance is infinite.
+        """
+        cls._ensure_loaded()
+        return cls._key(chain_id, owner, token, spender) in cls._allowances
+
+    @classmethod
+    def update(cls, chain_id: int, owner: str, token: str, spender: str, amount: int) -> None:
+        """
+        Remember an allowance read from the node or set by a mined approval.
+
+        :param int chain_id: the chain ID.
+        :param str owner: the token owner.
+        :param str token: the token address.
+        :param str spender: the spender address.
+        :param int amount: the allowance in wei.
+        """
+        if amount >= INFINITE_ALLOWANCE:
+            cls._add(cls._key(chain_id, owner, token, spender))
+        else:
+            cls._discard(cls._key(chain_id, owner, token, spender))
+
+    @classmethod
+    def invalidate(cls, chain_id: int, owner: str, spender: str, token: str | None = None) -> None:
+        """
+        Forget allowances of the spender, e.g. after a spend failed with an allowance error.
+
+        :param int chain_id: the chain ID.
+        :param str owner: the token owner.
+        :param str spender: the spender address.
+        :param str | None token: the token address. (all tokens)
+        """
+        cls._ensure_loaded()
+        if token is not None:
+            cls._discard(cls._key(chain_id, owner, token, spender))
+            return
+
+        chain_id, owner, spender = int(chain_id), Web3.to_checksum_address(owner), Web3.to_checksum_address(spender)
+        for key in [key for key in cls._allowances if key[0] == chain_id and key[1] == owner and key[3] == spender]:
+            cls._discard(key)
+
+    @classmethod
+    def _add(cls, key: AllowanceKey) -> None:
+        cls._ensure_loaded()
+        if key in cls._allowances:
+            return
+
+        cls._allowances.add(key)
+        if cls._save is not None:
+            cls._save(key)
+
+    @classmethod
+    def _discard(cls, key: AllowanceKey) -> None:
+        cls._ensure_loaded()
+        if key not in cls._allowances:
+            return
+
+        cls._allowances.discard(key)
+        if cls._delete is not None:
+            cls._delete(key)
@@ -284,6 +284,87 @@ class Transaction(Module):
         return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
 
 
+class Address(Module):
+    """
+    Class with functions related to 'addresses' endpoints of Blockscout API v2.
+
+    Pages are requested with 'next_page_params' of the previous response.
+    """
+
+    module: str = "addresses"
+
+    async def _get(self, address: str, path: str, next_page_params: dict[str, ...] | None = None) -> dict[str, ...]:
+        params = {**(next_page_params or {}), "apikey": self.key or None}
+        return await async_get(f"{self.url}/{self.module}/{address}/{path}", params=aiohttp_params(params), headers=self.headers)
+
+    async def transactions(self, address: str, next_page_params: dict[str, ...] | None = None) -> dict[str, ...]:
+        """
+        Return a page of transactions performed by an address.
+
+        https://docs.blockscout.com/devs/apis/rest
+
+        Args:
+            address (str): the address.
+            next_page_params (Optional[Dict[str, Any]]): the cursor of the page. (the first page)
+
+        Returns:
+            Dict[str, Any]: the dictionary with 'items' and 'next_page_params'.
+
+        """
+        return await self._get(address=address, path="transactions", next_page_params=next_page_params)
+
+    async def nft(self, address: str, next_page_params: dict[str, ...] | None = None) -> dict[str, ...]:
+        """
+        Return a page of NFT instances owned by an address.
+
+        Args:
+            address (str): the address.
+            next_page_params (Optional[Dict[str, Any]]): the cursor of the page. (the first page)
+
+        Returns:
+            Dict[str, Any]: the dictionary with 'items' and 'next_page_params'.
+
+        """
+        return await self._get(address=address, path="nft", next_page_params=next_page_params)
+
+    async def nft_collections(self, address: str, next_page_params: dict[str, ...] | None = None) -> dict[str, ...]:
+        """
+        Return a page of NFT collections owned by an address with their instances.
+
+        Args:
+            address (str): the address.
+            next_page_params (Optional[Dict[str, Any]]): the cursor of the page. (the first page)
+
+        Returns:
+            Dict[str, Any]: the dictionary with 'items' and 'next_page_params'.
+
+        """
+        return await self._get(address=address, path="nft/collections", next_page_params=next_page_params)
+
+
+class Tokens(Module):
+    """
+    Class with functions related to 'tokens' endpoints of Blockscout API v2.
+    """
+
+    module: str = "tokens"
+
+    async def nft_instances(self, address: str, next_page_params: dict[str, ...] | None = None) -> dict[str, ...]:
+        """
+        Return a page of instances of an NFT collection.
+
+        Args:
+            address (str): the collection address.
+            next_page_params (Optional[Dict[str, Any]]): the cursor of the page. (the first page)
+
+        Returns:
+            Dict[str, Any]: the dictionary with 'items' and 'next_page_params'.
+
+        """
+        params = {**(next_page_params or {}), "apikey": self.key or None}
+        return await async_get(f"{self.url}/{self.module}/{address}/instances", params=aiohttp_params(params), headers=self.headers)
+
+
 class APIFunctions:
     """
     Class with functions related to Blockscan API.
@@ -295,6 +376,8 @@ class APIFunctions:
         account (Account): functions related to 'account' API module.
         contract (Contract): functions related to 'contract' API module.
         transaction (Transaction): functions related to 'transaction' API module.
+        address (Address): functions related to 'addresses' endpoints of Blockscout API v2.
+        tokens (Tokens): functions related to 'tokens' endpoints of Blockscout API v2.
         block (Block): functions related to 'block' API module.
         logs (Logs): functions related to 'logs' API module.
         token (Token): functions related to 'token' API module.
@@ -318,6 +401,8 @@ class APIFunctions:
         self.account = Account(self.key, self.url, self.headers)
         self.contract = Contract(self.key, self.url, self.headers)
         self.transaction = Transaction(self.key, self.url, self.headers)
+        self.address = Address(self.key, self.url, self.headers)
+        self.tokens = Tokens(self.key, self.url, self.headers)
         # self.block = Block(self.key, self.url, self.headers)
         # self.logs = Logs(self.key, self.url, self.headers)
         # self.token = Token(self.key, self.url, self.headers)
@@ -1,3 +1,4 @@
+import asyncio
 import random
 import re
 
@@ -12,6 +13,11 @@ from utils.encryption import get_private_key
 from . import exceptions
 from .contracts import Contracts
 from .data.models import Network, Networks
+from .fee_oracle import FeeOracle
+from .multicall import Multicall
+from .nonce_manager import NonceManager
+from .providers import RPCProviders
+from .receipt_tracker import ReceiptTracker
 from .transactions import Transactions
 from .wallet import Wallet
 
@@ -22,9 +28,15 @@ class Client:
     w3: Web3
 
     def __init__(
-        self, private_key: str | None = None, network: Network = Networks.Sepolia, proxy: str | None = None, check_proxy: bool = False
+        self,
+        private_key: str | None = None,
+        network: Network = Networks.Sepolia,
+        proxy: str | None = None,
+        check_proxy: bool = False,
+        batch_requests: bool = True,
     ) -> None:
         self.network = network
+        self.batch_requests = batch_requests
         self.headers = {
             "accept": "*/*",
             "accept-language": "en-US,en;q=0.9",
@@ -43,9 +55,7 @@ class Client:
                     raise exceptions.InvalidProxy(f"Proxy doesn't work! Your IP is {your_ip}.")
 
         self.w3 = Web3(
-            provider=Web3.AsyncHTTPProvider(
-                endpoint_uri=self.network.rpc, request_kwargs={"proxy": self.proxy, "headers": self.headers, "timeout": 360}
-            ),
+            provider=RPCProviders.get(rpc=self.network.rpc, proxy=self.proxy, headers=self.headers, batching=self.batch_requests),
             modules={"eth": (AsyncEth,)},
             middlewares=[],
         )
@@ -60,6 +70,10 @@ class Client:
         self.wallet = Wallet(self)
         self.contracts = Contracts(self)
         self.transactions = Transactions(self)
+        self.multicall = Multicall(self)
+        self.nonce_manager = NonceManager(self)
+        self.fee_oracle = FeeOracle(self)
+        self.receipt_tracker = ReceiptTracker(self)
 
     async def switch_network(self, new_network: Network) -> None:
         """
@@ -71,7 +85,7 @@ class Client:
         self.network = new_network
 
         self.w3 = Web3(
-            provider=Web3.AsyncHTTPProvider(endpoint_uri=self.network.rpc, request_kwargs={"proxy": self.proxy, "headers": self.headers}),
+            provider=RPCProviders.get(rpc=self.network.rpc, proxy=self.proxy, headers=self.headers, batching=self.batch_requests),
             modules={"eth": (AsyncEth,)},
             middlewares=[],
         )
@@ -84,3 +98,13 @@ class Client:
         txn = await self.w3.eth.get_transaction_count(account=self.account.address)
 
         return txn
+
+    async def gather(self, *aws, return_exceptions: bool = False) -> list:
+        """
+        Run RPC reads concurrently so that they leave in a single JSON-RPC batch request.
+
+        :param aws: coroutines or futures making RPC calls through this client.
+        :param bool return_exceptions: return exceptions as results instead of raising the first one.
+        :return list: the results in the order of the passed awaitables.
+        """
+        return list(await asyncio.gather(*aws, return_exceptions=return_exceptions))
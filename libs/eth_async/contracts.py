@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from eth_typing import ChecksumAddress
@@ -16,8 +19,46 @@ if TYPE_CHECKING:
 
 
 class Contracts:
+    abi_hashes_size: int = 256
+
+    _abi_hashes: OrderedDict[int, tuple[list | str, str]] = OrderedDict()
+
     def __init__(self, client: Client) -> None:
         self.client = client
+        self._w3 = client.w3
+        self._cache: dict[tuple[ChecksumAddress, str], AsyncContract | Contract] = {}
+
+    @staticmethod
+    def abi_hash(abi: list | str) -> str:
+        """
+        Get a hash of the ABI content. It is remembered for the 'abi_hashes_size' most recently used ABI objects.
+
+        :param list | str abi: the contract ABI.
+        :return str: the hash.
+        """
+        if (cached := Contracts._abi_hashes.get(id(abi))) and cached[0] is abi:
+            Contracts._abi_hashes.move_to_end(id(abi))
+            return cached[1]
+
+        abi_hash = hashlib.sha1((abi if isinstance(abi, str) else json.dumps(abi, sort_keys=True)).encode()).hexdigest()
+        # the ABI is kept referenced while cached, so its id can not be reused by another object
+        Contracts._abi_hashes[id(abi)] = (abi, abi_hash)
+        Contracts._abi_hashes.move_to_end(id(abi))
+        while len(Contracts._abi_hashes) > Contracts.abi_hashes_size:
+            Contracts._abi_hashes.popitem(last=False)
+
+        return abi_hash
+
+    def _contract(self, contract_address: ChecksumAddress, abi: list | str) -> AsyncContract | Contract:
+        if self._w3 is not self.client.w3:
+            self._w3 = self.client.w3
+            self._cache = {}
+
+        key = (contract_address, self.abi_hash(abi))
+        if key not in self._cache:
+            self._cache[key] = self.client.w3.eth.contract(address=contract_address, abi=abi)
+
+        return self._cache[key]
 
     async def default_token(self, contract_address: ChecksumAddress | str) -> Contract | AsyncContract:
         """
@@ -27,7 +68,7 @@ class Contracts:
         :return Contract | AsyncContract: the token contract instance.
         """
         contract_address = Web3.to_checksum_address(contract_address)
-        return self.client.w3.eth.contract(address=contract_address, abi=DefaultABIs.Token)
+        return self._contract(contract_address=contract_address, abi=DefaultABIs.Token)
 
     @staticmethod
     async def get_signature(hex_signature: str) -> list | None:
@@ -95,7 +136,7 @@ class Contracts:
 
     async def get(self, contract_address: types.Contract, abi: list | str | None = None) -> AsyncContract | Contract:
         """
-        Get a contract instance.
+        Get a contract instance. Instances are cached per address and ABI.
 
         :param Contract contract_address: the contract address or instance.
         :param list | str | None abi: the contract ABI. (get it using the 'get_abi' function)
@@ -110,6 +151,6 @@ class Contracts:
             abi = contract_abi
 
         if abi:
-            return self.client.w3.eth.contract(address=contract_address, abi=abi)
+            return self._contract(contract_address=contract_address, abi=abi)
 
         return self.client.w3.eth.contract(address=contract_address)
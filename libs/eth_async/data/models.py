@@ -1,37 +1,149 @@
+from __future__ import annotations
+
 import json
+import os
+import time
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 
 import requests
 from eth_typing import ChecksumAddress
 from web3 import Web3
 
+from data.config import FILES_DIR
 from libs.eth_async import exceptions
 from libs.eth_async.blockscan_api import APIFunctions
 from libs.eth_async.classes import AutoRepr
 from libs.eth_async.data import config
+from libs.eth_async.utils.files import read_json, write_json
+
+
+@lru_cache(maxsize=None)
+def _pow10(decimals: int) -> tuple[int, Decimal]:
+    return 10**decimals, Decimal(10**decimals)
 
 
 class TokenAmount:
+    """
+    A token amount stored as integer Wei with its decimals. 'Ether' and 'Gwei' are computed on first access.
+
+    Amounts support exact arithmetic and comparison: with other amounts of the same decimals and with numbers, which
+        are interpreted in Ether units (multiplication and division scale the amount).
+
+    Attributes:
+        Wei (int): the amount in the smallest token units.
+        decimals (int): the token decimals.
+
+    """
+
+    __slots__ = ("Wei", "decimals", "_ether", "_gwei")
+
     Wei: int
-    Ether: Decimal
     decimals: int
 
     def __init__(self, amount: int | float | str | Decimal, decimals: int = 18, wei: bool = False, gwei: bool = False) -> None:
+        self.decimals = decimals
+        self._ether = None
+        self._gwei = None
+
         if wei:
-            self.Wei: int = int(amount)
-            self.Ether: Decimal = Decimal(str(amount)) / 10**decimals
-            self.Gwei: Decimal = self.Wei / Decimal(10**9)
+            self.Wei = int(amount)
         elif gwei:
-            self.Gwei: Decimal = Decimal(str(amount))
-            self.Wei: int = int(self.Gwei * 10**9)
-            self.Ether: Decimal = Decimal(self.Wei) / 10**decimals
+            self._gwei = Decimal(str(amount))
+            self.Wei = int(self._gwei * 10**9)
         else:
-            self.Ether: Decimal = Decimal(str(amount))
-            self.Wei: int = int(self.Ether * 10**decimals)
-            self.Gwei: Decimal = self.Wei / Decimal(10**9)
+            self._ether = Decimal(str(amount))
+            self.Wei = int(self._ether * _pow10(decimals)[0])
 
-        self.decimals = decimals
+    @property
+    def Ether(self) -> Decimal:
+        if self._ether is None:
+            self._ether = Decimal(self.Wei) / _pow10(self.decimals)[1]
+
+        return self._ether
+
+    @property
+    def Gwei(self) -> Decimal:
+        if self._gwei is None:
+            self._gwei = self.Wei / _pow10(9)[1]
+
+        return self._gwei
+
+    def _from_wei(self, wei: int) -> TokenAmount:
+        return TokenAmount(amount=wei, decimals=self.decimals, wei=True)
+
+    def _other_wei(self, other: TokenAmount | int | float | Decimal) -> int:
+        if isinstance(other, TokenAmount):
+            if other.decimals != self.decimals:
+                raise ValueError(f"Can not combine amounts with {self.decimals} and {other.decimals} decimals")
+            return other.Wei
+
+        return int(Decimal(str(other)) * _pow10(self.decimals)[0])
+
+    def __add__(self, other: TokenAmount | int | float | Decimal) -> TokenAmount:
+        return self._from_wei(self.Wei + self._other_wei(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: TokenAmount | int | float | Decimal) -> TokenAmount:
+        return self._from_wei(self.Wei - self._other_wei(other))
+
+    def __rsub__(self, other: int | float | Decimal) -> TokenAmount:
+        return self._from_wei(self._other_wei(other) - self.Wei)
+
+    def __mul__(self, factor: int | float | Decimal) -> TokenAmount:
+        if isinstance(factor, int):
+            return self._from_wei(self.Wei * factor)
+        return self._from_wei(int(self.Wei * Decimal(str(factor))))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor: int | float | Decimal) -> TokenAmount:
+        if isinstance(divisor, int):
+            return self._from_wei(self.Wei // divisor)
+        return self._from_wei(int(self.Wei / Decimal(str(divisor))))
+
+    def _compare_key(self, other) -> tuple[int, int] | None:
+        if isinstance(other, TokenAmount):
+            if other.decimals == self.decimals:
+                return self.Wei, other.Wei
+            # compare in the common precision
+            scale = max(self.decimals, other.decimals)
+            return self.Wei * _pow10(scale - self.decimals)[0], other.Wei * _pow10(scale - other.decimals)[0]
+
+        if isinstance(other, (int, float, Decimal)):
+            return self.Wei, self._other_wei(other)
+
+        return None
+
+    def __eq__(self, other) -> bool:
+        if (key := self._compare_key(other)) is None:
+            return NotImplemented
+        return key[0] == key[1]
+
+    def __lt__(self, other) -> bool:
+        if (key := self._compare_key(other)) is None:
+            return NotImplemented
+        return key[0] < key[1]
+
+    def __le__(self, other) -> bool:
+        if (key := self._compare_key(other)) is None:
+            return NotImplemented
+        return key[0] <= key[1]
+
+    def __gt__(self, other) -> bool:
+        if (key := self._compare_key(other)) is None:
+            return NotImplemented
+        return key[0] > key[1]
+
+    def __ge__(self, other) -> bool:
+        if (key := self._compare_key(other)) is None:
+            return NotImplemented
+        return key[0] >= key[1]
+
+    def __hash__(self) -> int:
+        return hash(self.Ether)
 
     def __str__(self):
         return f"{float(self.Ether):.5f}"
@@ -137,6 +249,33 @@ class API:
     functions: APIFunctions | None = None
 
 
+CHAINS_INFO_URL = "https://chainid.network/chains.json"
+CHAINS_INFO_TTL = 7 * 24 * 60 * 60
+
+
+def get_chains_info(ttl: int = CHAINS_INFO_TTL) -> list[dict]:
+    """
+    Get the chain list of chainid.network. The list is cached on disk and downloaded again when it is older than 'ttl'.
+
+    :param int ttl: the cache lifetime in seconds. (a week)
+    :return list[dict]: chain descriptions.
+    """
+    cache_file = os.path.join(FILES_DIR, "chains.json")
+    if os.path.isfile(cache_file) and time.time() - os.path.getmtime(cache_file) < ttl:
+        try:
+            return read_json(path=cache_file)
+        except ValueError:
+            pass
+
+    chains_info = requests.get(CHAINS_INFO_URL, timeout=30).json()
+    try:
+        write_json(path=cache_file, obj=chains_info)
+    except OSError:
+        pass
+
+    return chains_info
+
+
 class Network:
     def __init__(
         self,
@@ -168,8 +307,7 @@ class Network:
         if not self.coin_symbol or not self.decimals:
             try:
                 network = None
-                networks_info_response = requests.get("https://chainid.network/chains.json").json()
-                for network_ in networks_info_response:
+                for network_ in get_chains_info():
                     if network_["chainId"] == self.chain_id:
                         network = network_
                         break
@@ -201,9 +339,26 @@ class Network:
 from data.rpc import RPC_MAP
 
 
+class LazyNetwork:
+    """
+    A Networks attribute that creates its Network on first access, so unused networks never resolve their chain ID
+        or coin metadata.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.network: Network | None = None
+
+    def __get__(self, instance, owner) -> Network:
+        if self.network is None:
+            self.network = Network(**self.kwargs)
+
+        return self.network
+
+
 class Networks:
     # Mainnets
-    Ethereum = Network(
+    Ethereum = LazyNetwork(
         name="ethereum",
         rpc=RPC_MAP["ethereum"],
         chain_id=1,
@@ -214,7 +369,7 @@ class Networks:
         api=API(key=config.ETHEREUM_API_KEY, url="https://api.etherscan.io/api", docs="https://docs.etherscan.io/"),
     )
 
-    Arbitrum = Network(
+    Arbitrum = LazyNetwork(
         name="arbitrum",
         rpc=RPC_MAP["arbitrum"],
         chain_id=42161,
@@ -225,7 +380,7 @@ class Networks:
         api=API(key=config.ARBITRUM_API_KEY, url="https://api.arbiscan.io/api", docs="https://docs.arbiscan.io/"),
     )
 
-    Base = Network(
+    Base = LazyNetwork(
         name="base",
         rpc=RPC_MAP["base"],
         chain_id=8453,
@@ -235,7 +390,7 @@ class Networks:
         api=API(key=config.BASE_API_KEY, url="https://api.basescan.org/api", docs="https://docs.basescan.org/"),
     )
 
-    Optimism = Network(
+    Optimism = LazyNetwork(
         name="optimism",
         rpc=RPC_MAP["optimism"],
         chain_id=10,
@@ -246,7 +401,7 @@ class Networks:
         api=API(key=config.OPTIMISM_API_KEY, url="https://api-optimistic.etherscan.io/api", docs="https://docs.optimism.etherscan.io/"),
     )
 
-    Ink = Network(
+    Ink = LazyNetwork(
         name="ink",
         rpc=RPC_MAP["ink"],
         chain_id=57073,
@@ -260,7 +415,7 @@ class Networks:
         # ),
     )
 
-    Mode = Network(
+    Mode = LazyNetwork(
         name="mode",
         rpc=RPC_MAP["mode"],
         chain_id=34443,
@@ -274,7 +429,7 @@ class Networks:
         # ),
     )
 
-    BSC = Network(
+    BSC = LazyNetwork(
         name="BSC",
         rpc=RPC_MAP["bsc"],
         chain_id=56,
@@ -285,7 +440,7 @@ class Networks:
         api=API(key=config.BSC_API_KEY, url="https://api.bscscan.com/api", docs="https://docs.bscscan.com/"),
     )
 
-    opBNB = Network(
+    opBNB = LazyNetwork(
         name="op_bnb",
         rpc=RPC_MAP["op_bnb"],
         chain_id=204,
@@ -296,7 +451,7 @@ class Networks:
         api=API(key=config.BSC_API_KEY, url="https://api.bscscan.com/api", docs="https://docs.bscscan.com/"),
     )
 
-    Polygon = Network(
+    Polygon = LazyNetwork(
         name="polygon",
         rpc=RPC_MAP["polygon"],
         chain_id=137,
@@ -307,7 +462,7 @@ class Networks:
         api=API(key=config.POLYGON_API_KEY, url="https://api.polygonscan.com/api", docs="https://docs.polygonscan.com/"),
     )
 
-    Soneium = Network(
+    Soneium = LazyNetwork(
         name="Soneium",
         rpc=RPC_MAP["soneium"],
         chain_id=1868,
@@ -320,7 +475,7 @@ class Networks:
         ),
     )
 
-    LISK = Network(
+    LISK = LazyNetwork(
         name="LISK",
         rpc=RPC_MAP["lisk"],
         chain_id=1135,
@@ -331,7 +486,7 @@ class Networks:
         # api=API(key=config.HECO_API_KEY, url='https://api.hecoinfo.com/api', docs='https://hecoinfo.com/apis')
     )
 
-    Unichain = Network(
+    Unichain = LazyNetwork(
         name="unichain",
         rpc=RPC_MAP["unichain"],
         chain_id=130,
@@ -342,7 +497,7 @@ class Networks:
         # api=API(key=config.HECO_API_KEY, url='https://api.hecoinfo.com/api', docs='https://hecoinfo.com/apis')
     )
 
-    Avalanche = Network(
+    Avalanche = LazyNetwork(
         name="avalanche",
         rpc="https://rpc.ankr.com/avalanche/",
         chain_id=43114,
@@ -353,7 +508,7 @@ class Networks:
         api=API(key=config.AVALANCHE_API_KEY, url="https://api.snowtrace.io/api", docs="https://docs.snowtrace.io/"),
     )
 
-    ArbitrumNova = Network(
+    ArbitrumNova = LazyNetwork(
         name="arbitrum_nova",
         rpc="https://nova.arbitrum.io/rpc/",
         chain_id=42170,
@@ -364,7 +519,7 @@ class Networks:
         api=API(key=config.ARBITRUM_API_KEY, url="https://api-nova.arbiscan.io/api", docs="https://nova.arbiscan.io/apis/"),
     )
 
-    Moonbeam = Network(
+    Moonbeam = LazyNetwork(
         name="moonbeam",
         rpc="https://rpc.api.moonbeam.network/",
         chain_id=1284,
@@ -375,7 +530,7 @@ class Networks:
         api=API(key=config.MOONBEAM_API_KEY, url="https://api-moonbeam.moonscan.io/api", docs="https://moonscan.io/apis/"),
     )
 
-    Fantom = Network(
+    Fantom = LazyNetwork(
         name="fantom",
         rpc="https://fantom.publicnode.com",
         chain_id=250,
@@ -386,7 +541,7 @@ class Networks:
         api=API(key=config.FANTOM_API_KEY, url="https://api.ftmscan.com/api", docs="https://docs.ftmscan.com/"),
     )
 
-    Celo = Network(
+    Celo = LazyNetwork(
         name="celo",
         rpc="https://1rpc.io/celo",
         chain_id=42220,
@@ -397,7 +552,7 @@ class Networks:
         api=API(key=config.CELO_API_KEY, url="https://api.celoscan.io/api", docs="https://celoscan.io/apis/"),
     )
 
-    ZkSync = Network(
+    ZkSync = LazyNetwork(
         name="zksync",
         rpc="https://mainnet.era.zksync.io",
         # rpc='https://rpc.ankr.com/zksync_era',
@@ -408,7 +563,7 @@ class Networks:
         explorer="https://explorer.zksync.io/",
     )
 
-    Gnosis = Network(
+    Gnosis = LazyNetwork(
         name="gnosis",
         rpc="https://rpc.ankr.com/gnosis",
         chain_id=100,
@@ -419,7 +574,7 @@ class Networks:
         api=API(key=config.GNOSIS_API_KEY, url="https://api.gnosisscan.io/api", docs="https://docs.gnosisscan.io/"),
     )
 
-    HECO = Network(
+    HECO = LazyNetwork(
         name="heco",
         rpc="https://http-mainnet.hecochain.com",
         chain_id=128,
@@ -430,7 +585,7 @@ class Networks:
         api=API(key=config.HECO_API_KEY, url="https://api.hecoinfo.com/api", docs="https://hecoinfo.com/apis"),
     )
 
-    KAIA = Network(
+    KAIA = LazyNetwork(
         name="KAIA",
         rpc="https://public-en.node.kaia.io",
         chain_id=8217,
@@ -441,7 +596,7 @@ class Networks:
         # api=API(key=config.HECO_API_KEY, url='https://api.hecoinfo.com/api', docs='https://hecoinfo.com/apis')
     )
 
-    Sepolia = Network(
+    Sepolia = LazyNetwork(
         name="sepolia",
         rpc="https://rpc.sepolia.org",
         chain_id=11155111,
@@ -454,7 +609,7 @@ class Networks:
         ),
     )
 
-    PharosTestnet = Network(
+    PharosTestnet = LazyNetwork(
         name="pharos testnet",
         rpc=RPC_MAP["pharos"],
         chain_id=688689,
@@ -465,7 +620,7 @@ class Networks:
         api=None,
     )
 
-    MonadTestnet = Network(
+    MonadTestnet = LazyNetwork(
         name="Monad",
         rpc=RPC_MAP["monad"],
         chain_id=10143,
@@ -484,14 +639,16 @@ class RawContract(AutoRepr):
         title str: a contract title.
         address (ChecksumAddress): a contract address.
         abis list[dict[str, Any]] | str: an ABI of the contract.
+        decimals (Optional[int]): token decimals, if the contract is a token with known decimals.
 
     """
 
     title: str
     address: ChecksumAddress
     abi: list[dict[str, ...]]
+    decimals: int | None
 
-    def __init__(self, address: str, abi: list[dict[str, ...]] | str | None = None, title: str = "") -> None:
+    def __init__(self, address: str, abi: list[dict[str, ...]] | str | None = None, title: str = "", decimals: int | None = None) -> None:
         """
         Initialize the class.
 
@@ -499,11 +656,13 @@ class RawContract(AutoRepr):
             title (str): a contract title.
             address (str): a contract address.
             abi (Union[List[Dict[str, Any]], str]): an ABI of the contract.
+            decimals (Optional[int]): token decimals. (None)
 
         """
         self.title = title
         self.address = Web3.to_checksum_address(address)
         self.abi = json.loads(abi) if isinstance(abi, str) else abi
+        self.decimals = decimals
 
     def __eq__(self, other) -> bool:
         if self.address == other.address and self.abi == other.abi:
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from eth_abi import encode
+from eth_typing import HexStr
+from eth_utils import keccak
+
+
+def _split_types(types: str) -> list[str]:
+    result = []
+    depth = 0
+    current = ""
+    for char in types:
+        if char == "," and depth == 0:
+            result.append(current)
+            current = ""
+            continue
+
+        depth += (char == "(") - (char == ")")
+        current += char
+
+    if current:
+        result.append(current)
+
+    return result
+
+
+class FunctionEncoder:
+    """
+    Encodes calls of a single contract function with a precomputed selector and argument types, skipping the ABI
+        lookup and argument normalization of 'contract.encode_abi'.
+
+    Arguments are passed to eth_abi as is: addresses as checksummed or lowercase strings, bytes as bytes.
+
+    Attributes:
+        signature (str): the canonical function signature, e.g. approve(address,uint256).
+        selector (bytes): the function selector.
+        types (tuple[str, ...]): ABI types of the arguments.
+
+    """
+
+    __slots__ = ("signature", "selector", "types")
+
+    signature: str
+    selector: bytes
+    types: tuple[str, ...]
+
+    def __init__(self, signature: str) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            signature (str): the canonical function signature, tuples are written as (type1,type2).
+
+        """
+        self.signature = signature.replace(" ", "")
+        self.selector = keccak(text=self.signature)[:4]
+        self.types = tuple(_split_types(self.signature[self.signature.index("(") + 1 : -1]))
+
+    def encode(self, *args: Any) -> HexStr:
+        """
+        Encode a call.
+
+        Args:
+            *args: the function arguments.
+
+        Returns:
+            HexStr: the calldata.
+
+        """
+        return HexStr("0x" + (self.selector + encode(self.types, args)).hex())
+
+
+@lru_cache(maxsize=None)
+def get_encoder(signature: str) -> FunctionEncoder:
+    """
+    Get a cached encoder for the function signature.
+
+    Args:
+        signature (str): the canonical function signature.
+
+    Returns:
+        FunctionEncoder: the encoder.
+
+    """
+    return FunctionEncoder(signature)
+
+
+class Encoders:
+    """Encoders of frequently sent functions."""
+
+    approve = get_encoder("approve(address,uint256)")
+    deposit = get_encoder("deposit()")
+    withdraw = get_encoder("withdraw(uint256)")
+    refund_eth = get_encoder("refundETH()")
+    unwrap_weth9 = get_encoder("unwrapWETH9(uint256,address)")
+    exact_input_single = get_encoder("exactInputSingle((address,address,uint24,address,uint256,uint256,uint160))")
+    multicall_deadline = get_encoder("multicall(uint256,bytes[])")
+    claim = get_encoder("claim()")
+    nft_drop_claim = get_encoder("claim(address,uint256,address,uint256,(bytes32[],uint256,uint256,address),bytes)")
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from statistics import median
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+@dataclass(frozen=True)
+class Fees:
+    """
+    Fee estimate for the next block.
+
+    Attributes:
+        base_fee (int): the base fee per gas in Wei.
+        max_priority_fee (int): the suggested tip per gas in Wei.
+        gas_price (int): the suggested legacy gas price in Wei.
+
+    """
+
+    base_fee: int
+    max_priority_fee: int
+    gas_price: int
+
+
+class _FeeState:
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.fees: Fees | None = None
+        self.expires_at: float = 0.0
+
+
+class FeeOracle:
+    """
+    A network-wide fee oracle built on 'eth_feeHistory' percentiles.
+
+    Fees are cached per chain for 'ttl' seconds and shared by all clients, so preparing a transaction takes no RPC
+    calls while the estimate is fresh. Concurrent requests for a stale estimate wait for a single refresh.
+    """
+
+    ttl: float = 3.0
+    block_count: int = 5
+    reward_percentile: int = 50
+
+    _states: dict[int, _FeeState] = {}
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+    @property
+    def _state(self) -> _FeeState:
+        chain_id = self.client.network.chain_id
+        if chain_id not in FeeOracle._states:
+            FeeOracle._states[chain_id] = _FeeState()
+
+        return FeeOracle._states[chain_id]
+
+    async def get(self) -> Fees:
+        """
+        Get the current fee estimate.
+
+        :return Fees: the fee estimate.
+        """
+        state = self._state
+        if state.fees is not None and time.monotonic() < state.expires_at:
+            return state.fees
+
+        async with state.lock:
+            if state.fees is None or time.monotonic() >= state.expires_at:
+                state.fees = await self._fetch()
+                state.expires_at = time.monotonic() + self.ttl
+
+            return state.fees
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached estimate of the client network.
+        """
+        self._state.expires_at = 0.0
+
+    async def _fetch(self) -> Fees:
+        if self.client.network.tx_type != 2:
+            gas_price = await self.client.w3.eth.gas_price
+            return Fees(base_fee=gas_price, max_priority_fee=0, gas_price=gas_price)
+
+        try:
+            history = await self.client.w3.eth.fee_history(self.block_count, "latest", [self.reward_percentile])
+            base_fee = int(history["baseFeePerGas"][-1])
+            rewards = [int(reward[0]) for reward in history.get("reward") or [] if reward]
+            tip = int(median(rewards)) if rewards else await self.client.w3.eth.max_priority_fee
+
+        except Exception:
+            block, tip = await self.client.gather(self.client.w3.eth.get_block("latest"), self.client.w3.eth.max_priority_fee)
+            base_fee = int(block.get("baseFeePerGas") or 0)
+
+        return Fees(base_fee=base_fee, max_priority_fee=int(tip), gas_price=base_fee + int(tip))
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from eth_abi import decode, encode
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
+from web3 import Web3
+
+from .classes import AutoRepr
+from .data import types
+from .data.models import TokenAmount
+from .token_registry import TokenMetadata, TokenRegistry
+
+if TYPE_CHECKING:
+    from .client import Client
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+NATIVE_ADDRESSES = {"0x0000000000000000000000000000000000000000", "0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee"}
+
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+GET_ETH_BALANCE_SELECTOR = bytes.fromhex("4d2301cc")
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")
+ALLOWANCE_SELECTOR = bytes.fromhex("dd62ed3e")
+
+
+class Call(AutoRepr):
+    """
+    A single read-only contract call for aggregation.
+
+    Attributes:
+        target (ChecksumAddress): the contract address.
+        data (bytes): the call data.
+        output_types (tuple[str, ...]): ABI types of the returned values.
+
+    """
+
+    target: ChecksumAddress
+    data: bytes
+    output_types: tuple[str, ...]
+
+    def __init__(self, target: str, data: bytes | str, output_types: tuple[str, ...] = ("uint256",)) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            target (str): the contract address.
+            data (Union[bytes, str]): the call data.
+            output_types (tuple[str, ...]): ABI types of the returned values. (uint256)
+
+        """
+        self.target = Web3.to_checksum_address(target)
+        self.data = bytes(HexBytes(data))
+        self.output_types = output_types
+
+    def decode(self, return_data: bytes) -> Any:
+        """
+        Decode returned data of the call.
+
+        Args:
+            return_data (bytes): the raw returned data.
+
+        Returns:
+            Any: a single value or a tuple if the call returns several values.
+
+        """
+        values = decode(list(self.output_types), return_data)
+        return values[0] if len(values) == 1 else values
+
+
+class Multicall:
+    """
+    Aggregates read-only calls into one Multicall3 'aggregate3' eth_call with per-call failure tolerance.
+
+    If Multicall3 is not deployed on the network, the calls are sent concurrently and leave as one JSON-RPC batch.
+    """
+
+    _deployed: dict[tuple[int, str], bool] = {}
+
+    def __init__(self, client: Client, address: str = MULTICALL3_ADDRESS, chunk_size: int = 200) -> None:
+        self.client = client
+        self.address = Web3.to_checksum_address(address)
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def _address(token: types.Contract) -> ChecksumAddress:
+        return Web3.to_checksum_address(token if isinstance(token, str) else token.address)
+
+    @staticmethod
+    def is_native(token: types.Contract) -> bool:
+        return Multicall._address(token).lower() in NATIVE_ADDRESSES
+
+    @staticmethod
+    def balance_of(token: types.Contract, owner: types.Address) -> Call:
+        return Call(target=Multicall._address(token), data=BALANCE_OF_SELECTOR + encode(["address"], [Web3.to_checksum_address(owner)]))
+
+    @staticmethod
+    def decimals(token: types.Contract) -> Call:
+        return Call(target=Multicall._address(token), data=DECIMALS_SELECTOR)
+
+    @staticmethod
+    def allowance(token: types.Contract, owner: types.Address, spender: types.Address) -> Call:
+        args = [Web3.to_checksum_address(owner), Web3.to_checksum_address(spender)]
+        return Call(target=Multicall._address(token), data=ALLOWANCE_SELECTOR + encode(["address", "address"], args))
+
+    def eth_balance(self, owner: types.Address) -> Call:
+        return Call(target=self.address, data=GET_ETH_BALANCE_SELECTOR + encode(["address"], [Web3.to_checksum_address(owner)]))
+
+    async def is_deployed(self) -> bool:
+        """
+        Check if the Multicall3 contract is deployed on the current network. The result is cached per network.
+
+        Returns:
+            bool: True if the contract has code.
+
+        """
+        key = (self.client.network.chain_id, self.address)
+        if key not in Multicall._deployed:
+            try:
+                code = await self.client.w3.eth.get_code(self.address)
+                Multicall._deployed[key] = len(code) > 0
+            except Exception:
+                return False
+
+        return Multicall._deployed[key]
+
+    async def aggregate(self, calls: list[Call]) -> list[Any | None]:
+        """
+        Execute read-only calls in as few RPC requests as possible.
+
+        Args:
+            calls (list[Call]): the calls to execute.
+
+        Returns:
+            list[Any | None]: decoded results in the order of calls, None for failed calls.
+
+        """
+        if not calls:
+            return []
+
+        if not await self.is_deployed():
+            return await self._aggregate_batched(calls)
+
+        results = []
+        for i in range(0, len(calls), self.chunk_size):
+            results += await self._aggregate3(calls[i : i + self.chunk_size])
+
+        return results
+
+    async def _aggregate3(self, calls: list[Call]) -> list[Any | None]:
+        data = AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [[(call.target, True, call.data) for call in calls]])
+        raw = await self.client.w3.eth.call({"to": self.address, "data": HexBytes(data)})
+        (returned,) = decode(["(bool,bytes)[]"], raw)
+
+        results = []
+        for call, (success, return_data) in zip(calls, returned):
+            results.append(self._safe_decode(call, return_data) if success else None)
+
+        return results
+
+    async def _aggregate_batched(self, calls: list[Call]) -> list[Any | None]:
+        responses = await self.client.gather(
+            *[self.client.w3.eth.call({"to": call.target, "data": HexBytes(call.data)}) for call in calls], return_exceptions=True
+        )
+        return [None if isinstance(raw, BaseException) else self._safe_decode(call, raw) for call, raw in zip(calls, responses)]
+
+    @staticmethod
+    def _safe_decode(call: Call, return_data: bytes) -> Any | None:
+        try:
+            return call.decode(return_data)
+        except Exception:
+            return None
+
+    async def token_balances(self, tokens: list[types.Contract], owner: types.Address | None = None) -> list[TokenAmount | None]:
+        """
+        Get balances of several tokens, including the native coin, with their decimals in a single sweep.
+
+        Args:
+            tokens (list[Contract]): token addresses or instances, zero or 0xEeee... address means the native coin.
+            owner (Optional[Address]): the owner address. (imported to client address)
+
+        Returns:
+            list[TokenAmount | None]: balances in the order of tokens, None if the token could not be read.
+
+        """
+        owner = Web3.to_checksum_address(owner or self.client.account.address)
+        chain_id = self.client.network.chain_id
+        native_decimals = self.client.network.decimals or 18
+
+        if not await self.is_deployed() and any(self.is_native(token) for token in tokens):
+            native_balance = self.client.w3.eth.get_balance(owner)
+        else:
+            native_balance = None
+
+        calls = []
+        known = {}
+        for token in tokens:
+            if self.is_native(token):
+                if native_balance is None:
+                    calls.append(self.eth_balance(owner))
+                continue
+
+            calls.append(self.balance_of(token, owner))
+            if metadata := TokenRegistry.get(chain_id=chain_id, address=self._address(token)):
+                known[self._address(token)] = metadata.decimals
+            else:
+                calls.append(self.decimals(token))
+
+        if native_balance is not None:
+            native_wei, results = await self.client.gather(native_balance, self.aggregate(calls))
+        else:
+            native_wei, results = None, await self.aggregate(calls)
+
+        results = iter(results)
+        balances = []
+        for token in tokens:
+            if self.is_native(token):
+                amount = native_wei if native_wei is not None else next(results)
+                balances.append(None if amount is None else TokenAmount(amount=amount, decimals=native_decimals, wei=True))
+                continue
+
+            amount = next(results)
+            if self._address(token) in known:
+                decimals = known[self._address(token)]
+            else:
+                decimals = next(results)
+                if decimals is not None:
+                    TokenRegistry.register(TokenMetadata(chain_id=chain_id, address=self._address(token), decimals=int(decimals)))
+
+            balances.append(None if amount is None or decimals is None else TokenAmount(amount=amount, decimals=decimals, wei=True))
+
+        return balances
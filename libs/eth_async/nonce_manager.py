@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from web3 import Web3
+
+if TYPE_CHECKING:
+    from .client import Client
+
+NONCE_ERRORS = ("nonce too low", "replacement transaction underpriced", "invalid nonce")
+
+
+class _NonceState:
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.next_nonce: int | None = None
+        self.unsent: set[int] = set()
+
+
+class NonceManager:
+    """
+    Hands out nonces of the client address locally.
+
+    The state is shared by all clients of the same address on the same network, so concurrent transactions never
+    get the same nonce. The pending nonce of the node is fetched once and then counted locally. It is fetched again
+    only after 'resync', 'invalidate' or a 'release' that leaves a gap, e.g. after a nonce error or a dropped
+    transaction, and never below a nonce that is reserved and not sent yet.
+    """
+
+    _states: dict[tuple[int, str], _NonceState] = {}
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+    @property
+    def _state(self) -> _NonceState:
+        key = (self.client.network.chain_id, Web3.to_checksum_address(self.client.account.address))
+        if key not in NonceManager._states:
+            NonceManager._states[key] = _NonceState()
+
+        return NonceManager._states[key]
+
+    async def _fetch(self) -> int:
+        return await self.client.w3.eth.get_transaction_count(self.client.account.address, "pending")
+
+    @staticmethod
+    def is_nonce_error(err: BaseException) -> bool:
+        """
+        Check if a send error means the local nonce is out of sync with the node.
+
+        :param BaseException err: the error.
+        :return bool: True if the nonce has to be resynced.
+        """
+        message = str(err).lower()
+        return any(text in message for text in NONCE_ERRORS)
+
+    @staticmethod
+    def is_rejected(err: BaseException) -> bool:
+        """
+        Check if a send error is an answer of the node, so the transaction surely wasn't accepted. A timeout or a
+        connection error leaves it unknown.
+
+        :param BaseException err: the error.
+        :return bool: True if the node rejected the transaction.
+        """
+        return isinstance(err, ValueError)
+
+    async def peek(self) -> int:
+        """
+        Get the next nonce without reserving it.
+
+        :return int: the nonce.
+        """
+        state = self._state
+        async with state.lock:
+            if state.next_nonce is None:
+                state.next_nonce = await self._fetch()
+
+            return state.next_nonce
+
+    async def reserve(self, count: int = 1) -> list[int]:
+        """
+        Reserve consecutive nonces, e.g. to send approve and swap without waiting for the first receipt.
+
+        :param int count: the number of nonces. (1)
+        :return list[int]: the reserved nonces.
+        """
+        state = self._state
+        async with state.lock:
+            if state.next_nonce is None:
+                state.next_nonce = await self._fetch()
+                if state.unsent:
+                    state.next_nonce = max(state.next_nonce, max(state.unsent) + 1)
+
+            nonces = list(range(state.next_nonce, state.next_nonce + count))
+            state.next_nonce += count
+            state.unsent.update(nonces)
+            return nonces
+
+    async def next(self) -> int:
+        """
+        Reserve the next nonce.
+
+        :return int: the nonce.
+        """
+        return (await self.reserve())[0]
+
+    async def resync(self) -> int:
+        """
+        Fetch the pending nonce from the node again.
+
+        :return int: the next nonce.
+        """
+        state = self._state
+        async with state.lock:
+            state.next_nonce = await self._fetch()
+            return state.next_nonce
+
+    def sent(self, nonce: int) -> None:
+        """
+        Mark a reserved nonce as used by a broadcast transaction.
+
+        :param int nonce: the nonce.
+        """
+        self._state.unsent.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """
+        Give back a reserved nonce that surely wasn't accepted by the node. The local nonce is rolled back if it was
+        the last one reserved, otherwise it is fetched again on the next request.
+
+        :param int nonce: the nonce.
+        """
+        state = self._state
+        state.unsent.discard(nonce)
+        if state.next_nonce == nonce + 1:
+            state.next_nonce = nonce
+        else:
+            state.next_nonce = None
+
+    def invalidate(self) -> None:
+        """
+        Forget the local nonce, e.g. after a sent transaction wasn't mined in time. It is fetched again on the next
+        request.
+        """
+        self._state.next_nonce = None
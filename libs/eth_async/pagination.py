@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from itertools import takewhile
+from typing import Any
+
+from data.config import FILES_DIR
+from libs.eth_async.utils.files import read_json, touch, write_json
+
+LISTINGS_DIR = os.path.join(FILES_DIR, "explorer_listings")
+
+PageFetcher = Callable[[dict[str, Any] | None], Awaitable[dict[str, Any] | None]]
+ItemId = Callable[[dict[str, Any]], Any]
+
+
+class ListingCache:
+    """
+    An on-disk cache of explorer listings keyed by (endpoint, address).
+
+    A listing is stored with its items, newest first, and the cursor to continue from if it wasn't walked to the end.
+    Cursors shift when new items arrive, so pages are not cached by cursor: a listing with stable item IDs is rescanned
+    from the first page until the first already cached item (see 'iter_pages').
+
+    Attributes:
+        ttl (Optional[float]): the listing lifetime in seconds, None means listings never expire.
+
+    """
+
+    def __init__(self, ttl: float | None = None) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            ttl (Optional[float]): the listing lifetime in seconds. (listings never expire)
+
+        """
+        self.ttl = ttl
+
+    @staticmethod
+    def _path(key: tuple) -> str:
+        digest = hashlib.sha1(json.dumps(key, default=str).encode()).hexdigest()
+        return os.path.join(LISTINGS_DIR, f"{digest}.json")
+
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        """
+        Get a cached listing.
+
+        Args:
+            key (tuple): the listing key, e.g. (chain_id, endpoint, address).
+
+        Returns:
+            Optional[Dict[str, Any]]: 'items' and 'next_page_params' of the listing or None if it isn't cached or
+                expired.
+
+        """
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            return read_json(path=path)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: tuple, items: list[dict[str, Any]], next_page_params: dict[str, Any] | None) -> None:
+        """
+        Cache a listing.
+
+        Args:
+            key (tuple): the listing key, e.g. (chain_id, endpoint, address).
+            items (List[Dict[str, Any]]): the items, newest first.
+            next_page_params (Optional[Dict[str, Any]]): the cursor after the last item, None if the listing is complete.
+
+        """
+        try:
+            touch(LISTINGS_DIR)
+            write_json(path=self._path(key), obj={"items": items, "next_page_params": next_page_params})
+        except OSError:
+            pass
+
+
+async def _walk(fetch: PageFetcher, cursor: dict[str, Any] | None) -> AsyncIterator[dict[str, Any]]:
+    task = asyncio.ensure_future(fetch(cursor))
+    try:
+        while task is not None:
+            page = await task
+            if not isinstance(page, dict):
+                return
+
+            cursor = page.get("next_page_params")
+            task = asyncio.ensure_future(fetch(cursor)) if cursor else None
+            yield page
+
+    finally:
+        if task is not None and not task.done():
+            task.cancel()
+
+
+async def iter_pages(
+    fetch: PageFetcher, key: tuple, cache: ListingCache | None = None, item_id: ItemId | None = None
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Walk a listing paginated with 'next_page_params' and yield items of every page. The next page is requested while
+        the caller processes the current one.
+
+    With a cache, a listing with stable item IDs is scanned incrementally: pages are requested until the first cached
+        item, then the cached items are yielded at once and the walk continues where the cached one stopped. A cached
+        listing without item IDs is served whole until it expires.
+
+    Args:
+        fetch (PageFetcher): a coroutine function requesting the page for a cursor (None for the first page).
+        key (tuple): the listing key for the cache, e.g. (chain_id, endpoint, address).
+        cache (Optional[ListingCache]): the listing cache. (None)
+        item_id (Optional[ItemId]): a function returning the stable ID of an item, e.g. the transaction hash. (None)
+
+    Returns:
+        AsyncIterator[List[Dict[str, Any]]]: items of the pages.
+
+    """
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None and item_id is None:
+        if cached.get("next_page_params") is None:
+            yield cached.get("items") or []
+            return
+
+        cached = None
+
+    seen = {item_id(item) for item in cached.get("items") or []} if cached is not None else set()
+    items: list[dict[str, Any]] = []
+    cursor = None
+    walked = False
+    try:
+        reached = False
+        async with aclosing(_walk(fetch, None)) as pages:
+            async for page in pages:
+                walked = True
+                cursor = page.get("next_page_params")
+                page_items = page.get("items") or []
+                new_items = list(takewhile(lambda item: item_id(item) not in seen, page_items)) if seen else page_items
+                reached = len(new_items) < len(page_items)
+
+                items.extend(new_items)
+                if new_items:
+                    yield new_items
+                if reached:
+                    break
+
+        if not reached:
+            return
+
+        items.extend(cached["items"])
+        cursor = cached.get("next_page_params")
+        yield cached["items"]
+
+        if cursor:
+            async with aclosing(_walk(fetch, cursor)) as pages:
+                async for page in pages:
+                    cursor = page.get("next_page_params")
+                    page_items = page.get("items") or []
+                    items.extend(page_items)
+                    yield page_items
+
+    finally:
+        if cache is not None and walked:
+            cache.set(key, items=items, next_page_params=cursor)
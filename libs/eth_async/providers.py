@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from aiohttp import ClientResponseError, ClientSession, TCPConnector
+from web3 import AsyncHTTPProvider
+from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
+from web3.types import RPCEndpoint, RPCResponse
+
+# Writes are sent alone, so a rejected batch can't leave it unknown whether the node accepted them.
+UNBATCHED_METHODS = ("eth_sendRawTransaction", "eth_sendTransaction")
+
+
+class BatchAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    An async HTTP provider that packs JSON-RPC requests issued in the same event loop tick into a single batch request.
+
+    Requests go through the provider's own keep-alive connection pool. Transactions are never batched. If the node
+    rejects a batch with an HTTP 4xx error or answers it with a single error object, batching is turned off and the
+    requests are resent one by one.
+
+    Attributes:
+        batching (bool): whether requests are collected into batches.
+        max_batch_size (int): the maximum number of requests in one batch.
+        pool_size (int): the maximum number of simultaneous connections.
+        keepalive_timeout (float): seconds an idle connection is kept open.
+
+    """
+
+    batching: bool
+    max_batch_size: int
+    pool_size: int
+    keepalive_timeout: float
+
+    def __init__(
+        self,
+        endpoint_uri: str | None = None,
+        request_kwargs: Any | None = None,
+        batching: bool = True,
+        max_batch_size: int = 50,
+        pool_size: int = 100,
+        keepalive_timeout: float = 60.0,
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            endpoint_uri (Optional[str]): the RPC URL.
+            request_kwargs (Optional[Any]): arguments for aiohttp POST requests, e.g. 'proxy', 'headers' or 'timeout'.
+            batching (bool): whether requests are collected into batches. (True)
+            max_batch_size (int): the maximum number of requests in one batch. (50)
+            pool_size (int): the maximum number of simultaneous connections. (100)
+            keepalive_timeout (float): seconds an idle connection is kept open. (60)
+
+        """
+        super().__init__(endpoint_uri=endpoint_uri, request_kwargs=request_kwargs)
+        self.batching = batching
+        self.max_batch_size = max_batch_size
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self._session: ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._batch_supported = True
+        self._pending: list[tuple[int, bytes, asyncio.Future]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def _get_session(self) -> ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = TCPConnector(limit=self.pool_size, keepalive_timeout=self.keepalive_timeout, ttl_dns_cache=300)
+            self._session = ClientSession(connector=connector)
+            self._session_loop = loop
+
+        return self._session
+
+    async def _post(self, body: bytes) -> bytes:
+        session = await self._get_session()
+        async with session.post(self.endpoint_uri, data=body, **self.get_request_kwargs()) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def close(self) -> None:
+        """
+        Close the connection pool. It is reopened on the next request.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+        self._session_loop = None
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        request_id = next(self.request_counter)
+        rpc_dict = {"jsonrpc": "2.0", "method": method, "params": params or [], "id": request_id}
+        payload = FriendlyJsonSerde().json_encode(rpc_dict, cls=Web3JsonEncoder).encode("utf-8")
+
+        if not self.batching or not self._batch_supported or method in UNBATCHED_METHODS:
+            return self.decode_rpc_response(await self._post(payload))
+
+        loop = asyncio.get_running_loop()
+
+        future = loop.create_future()
+        self._pending.append((request_id, payload, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._defer_flush, loop)
+
+        return await future
+
+    def _defer_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        # one more loop iteration lets tasks spawned by a nested gather() enqueue their requests
+        self._flush_handle = loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._send_batch(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send_batch(self, batch: list[tuple[int, bytes, asyncio.Future]]) -> None:
+        if len(batch) == 1:
+            body = batch[0][1]
+        else:
+            body = b"[" + b",".join(payload for _, payload, _ in batch) + b"]"
+
+        try:
+            response = self.decode_rpc_response(await self._post(body))
+
+        except Exception as err:
+            if len(batch) > 1 and isinstance(err, ClientResponseError) and 400 <= err.status < 500 and err.status != 429:
+                # e.g. a node or a proxy that doesn't accept JSON arrays, rate limits aren't about batching
+                self._batch_supported = False
+                await self._send_one_by_one(batch)
+                return
+
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        responses = response if isinstance(response, list) else [response]
+        by_id = {item.get("id"): item for item in responses if isinstance(item, dict)}
+
+        if len(batch) > 1 and not any(request_id in by_id for request_id, _, _ in batch):
+            # the node answered with a single error object, i.e. it does not accept batches
+            self._batch_supported = False
+            await self._send_one_by_one(batch)
+            return
+
+        for request_id, _, future in batch:
+            if future.done():
+                continue
+
+            if request_id in by_id:
+                future.set_result(by_id[request_id])
+            else:
+                future.set_result({"jsonrpc": "2.0", "id": request_id, "error": {"code": -32603, "message": "No response in batch"}})
+
+    async def _send_one_by_one(self, batch: list[tuple[int, bytes, asyncio.Future]]) -> None:
+        for _, payload, future in batch:
+            if future.done():
+                continue
+
+            try:
+                response = self.decode_rpc_response(await self._post(payload))
+                if not future.done():
+                    future.set_result(response)
+
+            except Exception as err:
+                if not future.done():
+                    future.set_exception(err)
+
+
+class RPCProviders:
+    """
+    A process-wide registry of providers keyed by (rpc_url, proxy), so clients sharing a proxy or running without one
+    share a keep-alive connection pool instead of opening their own.
+
+    Attributes:
+        pool_size (int): the maximum number of simultaneous connections per provider.
+        keepalive_timeout (float): seconds an idle connection is kept open.
+        max_batch_size (int): the maximum number of requests in one batch.
+
+    """
+
+    pool_size: int = 100
+    keepalive_timeout: float = 60.0
+    max_batch_size: int = 50
+
+    _providers: dict[tuple[str, str | None, bool], BatchAsyncHTTPProvider] = {}
+
+    @classmethod
+    def configure(cls, pool_size: int | None = None, keepalive_timeout: float | None = None, max_batch_size: int | None = None) -> None:
+        """
+        Change limits of providers created from now on.
+
+        :param int | None pool_size: the maximum number of simultaneous connections per provider.
+        :param float | None keepalive_timeout: seconds an idle connection is kept open.
+        :param int | None max_batch_size: the maximum number of requests in one batch.
+        """
+        if pool_size is not None:
+            cls.pool_size = pool_size
+        if keepalive_timeout is not None:
+            cls.keepalive_timeout = keepalive_timeout
+        if max_batch_size is not None:
+            cls.max_batch_size = max_batch_size
+
+    @classmethod
+    def get(
+        cls, rpc: str, proxy: str | None = None, headers: dict | None = None, batching: bool = True, timeout: int = 360
+    ) -> BatchAsyncHTTPProvider:
+        """
+        Get a shared provider for the RPC URL and proxy, creating it on first use.
+
+        :param str rpc: the RPC URL.
+        :param str | None proxy: the proxy URL.
+        :param dict | None headers: request headers, only applied when the provider is created.
+        :param bool batching: whether requests are collected into batches. (True)
+        :param int timeout: the request timeout in seconds, only applied when the provider is created. (360)
+        :return BatchAsyncHTTPProvider: the provider.
+        """
+        key = (rpc, proxy, batching)
+        if key not in cls._providers:
+            cls._providers[key] = BatchAsyncHTTPProvider(
+                endpoint_uri=rpc,
+                request_kwargs={"proxy": proxy, "headers": headers, "timeout": timeout},
+                batching=batching,
+                max_batch_size=cls.max_batch_size,
+                pool_size=cls.pool_size,
+                keepalive_timeout=cls.keepalive_timeout,
+            )
+
+        return cls._providers[key]
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """
+        Close connection pools of all providers.
+        """
+        providers, cls._providers = list(cls._providers.values()), {}
+        await asyncio.gather(*[provider.close() for provider in providers], return_exceptions=True)
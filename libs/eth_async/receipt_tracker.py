@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import AsyncWeb3
+from web3.exceptions import TimeExhausted
+from web3.types import _Hash32
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+class _TrackerState:
+    def __init__(self) -> None:
+        self.pending: dict[HexBytes, asyncio.Future] = {}
+        self.waiters: dict[HexBytes, int] = {}
+        self.w3: AsyncWeb3 | None = None
+        self.task: asyncio.Task | None = None
+
+
+class ReceiptTracker:
+    """
+    Resolves transaction receipts with one block-driven loop per chain instead of a polling loop per transaction.
+
+    The loop checks the block number every 'poll_interval' seconds. When a new block appears, receipts of all
+    outstanding transactions are requested at once, so they leave in a single JSON-RPC batch. The loop stops when
+    nothing is outstanding.
+
+    An optional idle hook (see 'attach_idle') wraps the waiting, e.g. to let a scheduler run other work meanwhile.
+    """
+
+    poll_interval: float = 1.0
+
+    _states: dict[int, _TrackerState] = {}
+    _idle: Callable[[], AbstractAsyncContextManager] = nullcontext
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+    @classmethod
+    def attach_idle(cls, idle: Callable[[], AbstractAsyncContextManager]) -> None:
+        """
+        Attach a hook wrapping every wait for a receipt.
+
+        :param idle: a function returning an async context manager.
+        """
+        cls._idle = idle
+
+    @property
+    def _state(self) -> _TrackerState:
+        chain_id = self.client.network.chain_id
+        if chain_id not in ReceiptTracker._states:
+            ReceiptTracker._states[chain_id] = _TrackerState()
+
+        return ReceiptTracker._states[chain_id]
+
+    async def wait(self, tx_hash: str | _Hash32, timeout: int | float = 120) -> dict[str, Any]:
+        """
+        Wait for a transaction receipt. The local nonce of the client is fetched again if the receipt doesn't arrive
+        in time.
+
+        :param str | _Hash32 tx_hash: the transaction hash.
+        :param int | float timeout: the receipt waiting timeout. (120)
+        :return dict[str, Any]: the transaction receipt.
+        """
+        tx_hash = HexBytes(tx_hash)
+        state = self._state
+        state.w3 = self.client.w3
+
+        future = state.pending.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            state.pending[tx_hash] = future
+
+        if state.task is None or state.task.done():
+            state.task = asyncio.create_task(self._track(state))
+
+        state.waiters[tx_hash] = state.waiters.get(tx_hash, 0) + 1
+        try:
+            async with ReceiptTracker._idle():
+                return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+
+        except asyncio.TimeoutError:
+            # the transaction may have been dropped, so the local nonce may be ahead of the node
+            self.client.nonce_manager.invalidate()
+            raise TimeExhausted(f"Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds")
+
+        finally:
+            # a timed out or cancelled last waiter stops tracking of the transaction
+            state.waiters[tx_hash] -= 1
+            if not state.waiters[tx_hash]:
+                del state.waiters[tx_hash]
+                if state.pending.get(tx_hash) is future:
+                    del state.pending[tx_hash]
+
+    async def _track(self, state: _TrackerState) -> None:
+        last_block = None
+        while state.pending:
+            try:
+                block = await state.w3.eth.block_number
+                if block != last_block:
+                    last_block = block
+                    await self._fetch_receipts(state)
+
+            except Exception as e:
+                logger.warning(f"Receipt tracking | failed to fetch the block or receipts: {e}")
+
+            if state.pending:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _fetch_receipts(self, state: _TrackerState) -> None:
+        tx_hashes = list(state.pending)
+        receipts = await asyncio.gather(*[state.w3.eth.get_transaction_receipt(tx_hash) for tx_hash in tx_hashes], return_exceptions=True)
+
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            # not mined yet or a transient RPC error, retried on the next block
+            if isinstance(receipt, BaseException) or receipt is None:
+                continue
+
+            future = state.pending.pop(tx_hash, None)
+            if future is not None and not future.done():
+                future.set_result(dict(receipt))
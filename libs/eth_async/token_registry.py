@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+
+from web3 import Web3
+
+from .data.models import RawContract
+
+
+@dataclass(frozen=True)
+class TokenMetadata:
+    """
+    Immutable metadata of a deployed token.
+
+    Attributes:
+        chain_id (int): the chain ID of the network the token is deployed on.
+        address (str): the checksummed token address.
+        decimals (int): the token decimals.
+        symbol (Optional[str]): the token symbol.
+        name (Optional[str]): the token name.
+
+    """
+
+    chain_id: int
+    address: str
+    decimals: int
+    symbol: str | None = None
+    name: str | None = None
+
+
+class TokenRegistry:
+    """
+    A process-wide registry of token metadata keyed by (chain_id, address).
+
+    Decimals never change for a deployed token, so once known they are served from memory. An optional storage
+    (see 'attach_storage') makes the registry survive restarts.
+    """
+
+    _tokens: dict[tuple[int, str], TokenMetadata] = {}
+    _load: Callable[[], Iterable[TokenMetadata]] | None = None
+    _save: Callable[[TokenMetadata], None] | None = None
+    _loaded: bool = False
+
+    @staticmethod
+    def _key(chain_id: int, address: str) -> tuple[int, str]:
+        return int(chain_id), Web3.to_checksum_address(address)
+
+    @classmethod
+    def attach_storage(cls, load: Callable[[], Iterable[TokenMetadata]], save: Callable[[TokenMetadata], None]) -> None:
+        """
+        Attach a persistent storage. Stored tokens are loaded on first lookup, new tokens are saved on registration.
+
+        :param load: a function returning all stored tokens.
+        :param save: a function storing a single token.
+        """
+        cls._load = load
+        cls._save = save
+        cls._loaded = False
+
+    @classmethod
+    def _ensure_loaded(cls) -> None:
+        if cls._loaded or cls._load is None:
+            return
+
+        cls._loaded = True
+        for metadata in cls._load():
+            cls._tokens.setdefault(cls._key(metadata.chain_id, metadata.address), metadata)
+
+    @classmethod
+    def get(cls, chain_id: int, address: str) -> TokenMetadata | None:
+        """
+        Get known metadata of a token.
+
+        :param int chain_id: the chain ID.
+        :param str address: the token address.
+        :return TokenMetadata | None: the metadata or None if the token is unknown.
+        """
+        cls._ensure_loaded()
+        return cls._tokens.get(cls._key(chain_id, address))
+
+    @classmethod
+    def register(cls, metadata: TokenMetadata, persist: bool = True) -> TokenMetadata:
+        """
+        Add token metadata to the registry. Already known tokens are not overwritten.
+
+        :param TokenMetadata metadata: the token metadata.
+        :param bool persist: save the metadata to the attached storage. (True)
+        :return TokenMetadata: the metadata stored in the registry.
+        """
+        cls._ensure_loaded()
+        key = cls._key(metadata.chain_id, metadata.address)
+        if key in cls._tokens:
+            return cls._tokens[key]
+
+        metadata = replace(metadata, chain_id=key[0], address=key[1])
+        cls._tokens[key] = metadata
+        if persist and cls._save is not None:
+            cls._save(metadata)
+
+        return metadata
+
+    @classmethod
+    def seed(cls, chain_id: int, contracts: Iterable[RawContract]) -> None:
+        """
+        Pre-fill the registry with contracts that have known decimals. Seeded tokens are not persisted.
+
+        :param int chain_id: the chain ID of the contracts.
+        :param contracts: the contracts.
+        """
+        for contract in contracts:
+            if contract.decimals is None:
+                continue
+
+            address = Web3.to_checksum_address(contract.address)
+            cls._tokens.setdefault(
+                cls._key(chain_id, address),
+                TokenMetadata(chain_id=chain_id, address=address, decimals=contract.decimals, symbol=contract.title or None),
+            )
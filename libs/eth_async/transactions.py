@@ -1,26 +1,32 @@
 from __future__ import annotations
 
 import random
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 from eth_account.datastructures import SignedTransaction
 from hexbytes import HexBytes
-from web3 import AsyncWeb3, Web3
+from web3 import AsyncWeb3
 
 # from web3.middleware import ExtraDataToPOAMiddleware
 from web3.types import TxParams, TxReceipt, _Hash32
 
-from libs.eth_async.utils.web_requests import async_post
-
 from . import exceptions
+from .allowance_cache import AllowanceCache
 from .classes import AutoRepr
 from .data import types
-from .data.models import CommonValues, TokenAmount, TxArgs
+from .data.models import CommonValues, TokenAmount
+from .encoders import Encoders
+from .pagination import ItemId, ListingCache, PageFetcher, iter_pages
+from .token_registry import TokenMetadata, TokenRegistry
 from .utils.utils import api_key_required
 
 if TYPE_CHECKING:
     from .client import Client
 
+# NFT ownership changes, so cached NFT listings expire, while mined transactions never change.
+NFT_LISTINGS_TTL = 60 * 60
+
 
 class Tx(AutoRepr):
     """
@@ -86,24 +92,39 @@ class Tx(AutoRepr):
         }
         return self.params
 
-    async def wait_for_receipt(self, client, timeout: int | float = 120, poll_latency: float = 0.1) -> dict[str, Any]:
+    async def wait_for_receipt(self, client, timeout: int | float = 120) -> dict[str, Any]:
         """
-        Wait for the transaction receipt.
+        Wait for the transaction receipt. Receipts are tracked per block for all transactions of the network at once.
+            If the transaction reverted, it is replayed to get the reason, and cached allowances of the recipient are
+            forgotten if it is an allowance error.
 
         Args:
             client (Client): the Client instance.
             timeout (Union[int, float]): the receipt waiting timeout. (120 sec)
-            poll_latency (float): the poll latency. (0.1 sec)
 
         Returns:
             Dict[str, Any]: the transaction receipt.
 
         """
-        self.receipt = await client.transactions.wait_for_receipt(
-            w3=client.w3, tx_hash=self.hash, timeout=timeout, poll_latency=poll_latency
-        )
+        self.receipt = await client.receipt_tracker.wait(tx_hash=self.hash, timeout=timeout)
+        if self.receipt.get("status") == 0:
+            await self._check_revert(client)
+
         return self.receipt
 
+    async def _check_revert(self, client) -> None:
+        # a receipt has no revert reason, so the call is repeated on the state of the block
+        if not self.params or not self.params.get("to"):
+            return
+
+        call_params = {key: self.params[key] for key in ("from", "to", "data", "value") if self.params.get(key) is not None}
+        try:
+            await client.w3.eth.call(call_params, block_identifier=self.receipt.get("blockNumber"))
+
+        except Exception as err:
+            if AllowanceCache.is_allowance_error(err):
+                AllowanceCache.invalidate(chain_id=client.network.chain_id, owner=client.account.address, spender=self.params["to"])
+
     async def decode_input_data(self):
         pass
 
@@ -123,7 +144,7 @@ class Transactions:
         Get the current gas price
         :return: gas price
         """
-        return TokenAmount(amount=await self.client.w3.eth.gas_price, wei=True)
+        return TokenAmount(amount=(await self.client.fee_oracle.get()).gas_price, wei=True)
 
     async def max_priority_fee(self) -> TokenAmount:
         """
@@ -133,11 +154,7 @@ class Transactions:
             Wei: the current max priority fee.
 
         """
-        query = [{"id": 26, "jsonrpc": "2.0", "method": "eth_maxPriorityFeePerGas"}]
-
-        response = await async_post(url=self.client.network.rpc, json=query)
-        max_priority_fee_per_gas = int(response[0]["result"], 16)
-        return TokenAmount(amount=max_priority_fee_per_gas, wei=True)
+        return TokenAmount(amount=(await self.client.fee_oracle.get()).max_priority_fee, wei=True)
 
     async def estimate_gas(self, tx_params: TxParams) -> TokenAmount:
         """
@@ -171,31 +188,28 @@ class Transactions:
         if "chainId" not in tx_params:
             tx_params["chainId"] = self.client.network.chain_id
 
-        if not tx_params.get("nonce"):
-            tx_params["nonce"] = await self.client.wallet.nonce()
+        if tx_params.get("nonce") is None:
+            tx_params["nonce"] = await self.client.nonce_manager.next()
 
         if "from" not in tx_params:
             tx_params["from"] = self.client.account.address
 
         if "gasPrice" not in tx_params and "maxFeePerGas" not in tx_params:
-            gas_price = (await self.gas_price()).Wei
+            fees = await self.client.fee_oracle.get()
             if self.client.network.tx_type == 2:
-                tx_params["maxFeePerGas"] = gas_price
+                tx_params["maxFeePerGas"] = fees.gas_price
 
             else:
-                tx_params["gasPrice"] = gas_price
+                tx_params["gasPrice"] = fees.gas_price
 
         elif "gasPrice" in tx_params and not int(tx_params["gasPrice"]):
             tx_params["gasPrice"] = (await self.gas_price()).Wei
 
         if "maxFeePerGas" in tx_params and "maxPriorityFeePerGas" not in tx_params or not tx_params.get("maxPriorityFeePerGas", 0):
-            try:
-                block = await self.client.w3.eth.get_block("latest")
-                base_fee = int(block.get("baseFeePerGas") or 0)
-            except Exception:
-                base_fee = int(TokenAmount(amount=1).Gwei)
+            fees = await self.client.fee_oracle.get()
+            base_fee = fees.base_fee
 
-            tip = int((await self.max_priority_fee()).Wei * random.uniform(1.2, 1.5))
+            tip = int(fees.max_priority_fee * random.uniform(1.2, 1.5))
             min_required = base_fee + tip
 
             # add ~10% buffer on base fee (optional)
@@ -228,6 +242,9 @@ class Transactions:
         """
         Sign and send a transaction. Additionally, add 'chainId', 'nonce', 'from', 'gasPrice' or
             'maxFeePerGas' + 'maxPriorityFeePerGas' and 'gas' parameters to transaction parameters if they are missing.
+            A locally managed nonce is resynced and the transaction resent once if the node rejects the nonce, given
+            back if the node surely didn't accept the transaction and fetched again if that is unknown.
+            Cached allowances of the recipient are forgotten if the transaction fails with an allowance error.
 
         Args:
             tx_params (TxParams): parameters of the transaction.
@@ -236,12 +253,44 @@ class Transactions:
             Tx: the instance of the sent transaction.
 
         """
-        await self.auto_add_params(tx_params=tx_params)
+        managed_nonce = tx_params.get("nonce") is None
+        sending = False
 
-        signed_tx = await self.sign_transaction(tx_params)
-
-        tx_hash = await self.client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+        try:
+            await self.auto_add_params(tx_params=tx_params)
+            signed_tx = await self.sign_transaction(tx_params)
 
+            try:
+                sending = True
+                tx_hash = await self.client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+
+            except Exception as err:
+                if not managed_nonce or not self.client.nonce_manager.is_nonce_error(err):
+                    raise
+
+                sending = False
+                self.client.nonce_manager.release(tx_params["nonce"])
+                await self.client.nonce_manager.resync()
+                tx_params["nonce"] = await self.client.nonce_manager.next()
+                signed_tx = await self.sign_transaction(tx_params)
+                sending = True
+                tx_hash = await self.client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+
+        except Exception as err:
+            if managed_nonce and tx_params.get("nonce") is not None:
+                if sending and not self.client.nonce_manager.is_rejected(err):
+                    # the node may have accepted the transaction before the error, so its nonce may be used
+                    self.client.nonce_manager.sent(tx_params["nonce"])
+                    self.client.nonce_manager.invalidate()
+                else:
+                    self.client.nonce_manager.release(tx_params["nonce"])
+            if managed_nonce and self.client.nonce_manager.is_nonce_error(err):
+                self.client.nonce_manager.invalidate()
+            if tx_params.get("to") and AllowanceCache.is_allowance_error(err):
+                AllowanceCache.invalidate(chain_id=self.client.network.chain_id, owner=self.client.account.address, spender=tx_params["to"])
+            raise
+
+        self.client.nonce_manager.sent(tx_params["nonce"])
         return Tx(tx_hash=tx_hash, params=tx_params)
 
     async def approved_amount(self, token: types.Contract, spender: types.Contract, owner: types.Address | None = None) -> TokenAmount:
@@ -258,16 +307,20 @@ class Transactions:
 
         """
         contract_address, abi = await self.client.contracts.get_contract_attributes(token)
-        contract = await self.client.contracts.default_token(contract_address)
         spender, abi = await self.client.contracts.get_contract_attributes(spender)
         if not owner:
             owner = self.client.account.address
 
-        return TokenAmount(
-            amount=await contract.functions.allowance(AsyncWeb3.to_checksum_address(owner), AsyncWeb3.to_checksum_address(spender)).call(),
-            decimals=await self.client.transactions.get_decimals(contract=contract.address),
-            wei=True,
-        )
+        chain_id = self.client.network.chain_id
+        decimals = await self.client.transactions.get_decimals(contract=contract_address)
+        if AllowanceCache.is_infinite(chain_id=chain_id, owner=owner, token=contract_address, spender=spender):
+            return TokenAmount(amount=CommonValues.InfinityInt, decimals=decimals, wei=True)
+
+        contract = await self.client.contracts.default_token(contract_address)
+        amount = await contract.functions.allowance(AsyncWeb3.to_checksum_address(owner), AsyncWeb3.to_checksum_address(spender)).call()
+        AllowanceCache.update(chain_id=chain_id, owner=owner, token=contract_address, spender=spender, amount=amount)
+
+        return TokenAmount(amount=amount, decimals=decimals, wei=True)
 
     @staticmethod
     async def wait_for_receipt(
@@ -304,7 +357,7 @@ class Transactions:
             spender (Address): the spender address, contract address or instance.
             amount (Optional[TokenAmount]): an amount to approve. (infinity)
             gas_limit (Optional[GasLimit]): the gas limit in Wei. (parsed from the network)
-            nonce (Optional[int]): a nonce of the sender address. (get it using the 'nonce' function)
+            nonce (Optional[int]): a nonce of the sender address. (taken from the nonce manager)
 
         Returns:
             Tx: the instance of the sent transaction.
@@ -321,14 +374,10 @@ class Transactions:
         else:
             amount = amount.Wei
 
-        tx_args = TxArgs(spender=spender, amount=amount)
-
         tx_params = {
             "nonce": nonce,
             "to": contract.address,
-            "data": contract.encode_abi("approve", args=tx_args.tuple()),
-            "maxFeePerGas": await self.client.w3.eth.max_priority_fee + Web3.to_wei(0.2, "gwei"),
-            "maxPriorityFeePerGas": await self.client.w3.eth.max_priority_fee,
+            "data": Encoders.approve.encode(spender, amount),
         }
 
         if gas_limit:
@@ -339,9 +388,44 @@ class Transactions:
         return await self.sign_and_send(tx_params=tx_params)
 
     async def get_decimals(self, contract: types.Contract) -> int:
+        return (await self.get_token_metadata(contract=contract)).decimals
+
+    async def get_token_metadata(self, contract: types.Contract) -> TokenMetadata:
+        """
+        Get decimals, symbol and name of a token. Known tokens are served from the registry without RPC calls.
+
+        Args:
+            contract (Contract): the contract address or instance of token.
+
+        Returns:
+            TokenMetadata: the token metadata.
+
+        """
         contract_address, abi = await self.client.contracts.get_contract_attributes(contract)
+        chain_id = self.client.network.chain_id
+
+        if metadata := TokenRegistry.get(chain_id=chain_id, address=contract_address):
+            return metadata
+
         contract = await self.client.contracts.default_token(contract_address=contract_address)
-        return await contract.functions.decimals().call()
+        decimals, symbol, name = await self.client.gather(
+            contract.functions.decimals().call(),
+            contract.functions.symbol().call(),
+            contract.functions.name().call(),
+            return_exceptions=True,
+        )
+        if isinstance(decimals, BaseException):
+            raise decimals
+
+        return TokenRegistry.register(
+            TokenMetadata(
+                chain_id=chain_id,
+                address=contract_address,
+                decimals=int(decimals),
+                symbol=symbol if isinstance(symbol, str) else None,
+                name=name if isinstance(name, str) else None,
+            )
+        )
 
     async def sign_message(self):
         pass
@@ -412,61 +496,114 @@ class Transactions:
                 txs[tx.get("hash")] = tx
         return txs
 
+    def _pages(
+        self, endpoint: str, address: str, fetch: PageFetcher, cache_ttl: float | None, cache: bool, item_id: ItemId | None = None
+    ) -> AsyncIterator[list[dict]]:
+        return iter_pages(
+            fetch=fetch,
+            key=(self.client.network.chain_id, endpoint, str(address).lower()),
+            cache=ListingCache(ttl=cache_ttl) if cache else None,
+            item_id=item_id,
+        )
+
+    async def iter_transactions_by_address(self, address: str, cache: bool = False) -> AsyncIterator[list[dict]]:
+        """
+        Stream transactions of an address from the explorer page by page, the next page is prefetched.
+
+        Args:
+            address (str): the address.
+            cache (bool): cache the listing on disk, so repeated scans only download new transactions. (False)
+
+        Returns:
+            AsyncIterator[List[dict]]: transactions of every page.
+
+        """
+
+        async def fetch(next_page_params: dict | None) -> dict:
+            return await self.client.network.api.functions.address.transactions(str(address), next_page_params)
+
+        async for items in self._pages(
+            endpoint="transactions", address=address, fetch=fetch, cache_ttl=None, cache=cache, item_id=lambda tx: tx.get("hash")
+        ):
+            yield items
+
+    async def iter_nft_ids_by_contract(self, owner: str, nft_address: str, cache: bool = False) -> AsyncIterator[int]:
+        """
+        Stream IDs of the collection instances owned by an address.
+
+        Args:
+            owner (str): the owner address.
+            nft_address (str): the collection address.
+            cache (bool): cache the listing on disk for an hour. (False)
+
+        Returns:
+            AsyncIterator[int]: the NFT IDs.
+
+        """
+
+        async def fetch(next_page_params: dict | None) -> dict:
+            return await self.client.network.api.functions.tokens.nft_instances(address=str(nft_address), next_page_params=next_page_params)
+
+        async for items in self._pages(endpoint="nft_instances", address=nft_address, fetch=fetch, cache_ttl=NFT_LISTINGS_TTL, cache=cache):
+            for item in items:
+                if item.get("owner") and item["owner"].get("hash") == str(owner):
+                    yield item["id"]
+
+    async def iter_nft_ids_by_owner(self, owner: str, nft_address: str, cache: bool = False) -> AsyncIterator[int]:
+        """
+        Stream IDs of the collection instances among NFTs of an address.
+
+        Args:
+            owner (str): the owner address.
+            nft_address (str): the collection address.
+            cache (bool): cache the listing on disk for an hour. (False)
+
+        Returns:
+            AsyncIterator[int]: the NFT IDs.
+
+        """
+
+        async def fetch(next_page_params: dict | None) -> dict:
+            return await self.client.network.api.functions.address.nft(address=str(owner), next_page_params=next_page_params)
+
+        async for items in self._pages(endpoint="nft", address=owner, fetch=fetch, cache_ttl=NFT_LISTINGS_TTL, cache=cache):
+            for item in items:
+                if item.get("token") and item["token"].get("address") == str(nft_address):
+                    yield item["id"]
+
+    async def iter_my_nfts(self, cache: bool = False) -> AsyncIterator[tuple[str, list]]:
+        """
+        Stream NFT collections of the client address with IDs of the owned instances.
+
+        Args:
+            cache (bool): cache the listing on disk for an hour. (False)
+
+        Returns:
+            AsyncIterator[Tuple[str, list]]: the collection address and the instance IDs.
+
+        """
+        address = str(self.client.account.address)
+
+        async def fetch(next_page_params: dict | None) -> dict:
+            return await self.client.network.api.functions.address.nft_collections(address=address, next_page_params=next_page_params)
+
+        async for items in self._pages(endpoint="nft_collections", address=address, fetch=fetch, cache_ttl=NFT_LISTINGS_TTL, cache=cache):
+            for item in items:
+                if not item.get("token") or not item.get("amount") or not (contract := item["token"].get("address")):
+                    continue
+
+                instances = item.get("token_instances")
+                yield contract, [instance["id"] for instance in instances] if isinstance(instances, list) else []
+
     async def get_transactions_by_address(self, address: str) -> list:
-        next_page_params = None
-        transactions = []
-        while True:
-            response = await self.client.network.api.functions.address.transactions(str(address), next_page_params)
-            next_page_params = response["next_page_params"]
-            transactions.append(response["items"])
-            if next_page_params is None:
-                return transactions
+        return [items async for items in self.iter_transactions_by_address(address=address)]
 
     async def get_nft_ids_by_contract(self, owner: str, nft_address: str) -> list:
-        next_page_params = None
-        nfts = []
-        while True:
-            response = await self.client.network.api.functions.tokens.nft_instances(
-                address=str(nft_address), next_page_params=next_page_params
-            )
-            next_page_params = response["next_page_params"]
-            for item in response["items"]:
-                if item.get("owner"):
-                    if item["owner"].get("hash") == str(owner):
-                        print(item["id"])
-                        nfts.append(item["id"])
-            if next_page_params is None:
-                return nfts
+        return [nft_id async for nft_id in self.iter_nft_ids_by_contract(owner=owner, nft_address=nft_address)]
 
     async def get_nft_ids_by_owner(self, owner: str, nft_address: str) -> list:
-        next_page_params = None
-        nfts = []
-        while True:
-            response = await self.client.network.api.functions.address.nft(address=str(owner), next_page_params=next_page_params)
-            next_page_params = response["next_page_params"]
-            for item in response["items"]:
-                if item.get("token"):
-                    if item["token"].get("address") == str(nft_address):
-                        nfts.append(item["id"])
-            if next_page_params is None:
-                return nfts
+        return [nft_id async for nft_id in self.iter_nft_ids_by_owner(owner=owner, nft_address=nft_address)]
 
     async def get_my_nfts(self) -> dict:
-        next_page_params = None
-        nfts = {}
         # nfts = {'contract1': [id1, id2], 'contract2': [id1]}
-        while True:
-            response = await self.client.network.api.functions.address.nft_collections(
-                address=str(self.client.account.address), next_page_params=next_page_params
-            )
-            next_page_params = response["next_page_params"]
-            for item in response["items"]:
-                ids = []
-                if item.get("token") and item.get("amount"):
-                    if contract := item["token"].get("address"):
-                        if type(instances := item.get("token_instances")) == list:
-                            for instance in instances:
-                                ids.append(instance["id"])
-                nfts[contract] = ids
-            if next_page_params is None:
-                return nfts
+        return {contract: ids async for contract, ids in self.iter_my_nfts()}
@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 
 
 def join_path(path: str | tuple | list) -> str:
@@ -13,6 +14,22 @@ def read_json(path: str | tuple | list, encoding: str | None = None) -> list | d
     return json.load(open(path, encoding=encoding))
 
 
+@lru_cache(maxsize=None)
+def _read_json_cached(path: str, encoding: str | None) -> list | dict:
+    return read_json(path=path, encoding=encoding)
+
+
+def read_json_cached(path: str | tuple | list, encoding: str | None = None) -> list | dict:
+    """
+    Read a JSON file once and return the same object on later calls. The returned object must not be modified.
+
+    :param Union[str, tuple, list] path: path to the JSON file
+    :param Optional[str] encoding: the name of the encoding used to decode the file
+    :return Union[list, dict]: the parsed JSON
+    """
+    return _read_json_cached(os.path.abspath(join_path(path)), encoding)
+
+
 def touch(path: str | tuple | list, file: bool = False) -> bool:
     """
     Create an object (file or directory) if it doesn't exist.
@@ -1,8 +1,104 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
 from curl_cffi.requests import AsyncSession
 
 from libs.eth_async import exceptions
 
 
+class _PooledSession:
+    def __init__(self, session: AsyncSession, loop: asyncio.AbstractEventLoop) -> None:
+        self.session = session
+        self.loop = loop
+        self.active = 0
+        self.last_used = time.monotonic()
+
+
+class SessionPool:
+    """
+    Keep-alive curl_cffi sessions shared by the request helpers and keyed by (host, proxy, impersonation profile).
+
+    The pool holds at most 'max_size' sessions, evicting the least recently used idle one, and closes sessions idle
+    for more than 'idle_timeout' seconds. Sessions with requests in flight are never closed, so the pool grows past
+    'max_size' while all of them are in use. Cookies are cleared when the last request of a session ends.
+    """
+
+    max_size: int = 32
+    idle_timeout: float = 90.0
+
+    _sessions: OrderedDict[tuple[str, str | None, str | None], _PooledSession] = OrderedDict()
+
+    @classmethod
+    @asynccontextmanager
+    async def session(cls, url: str, proxy: str | None = None, impersonate: str | None = None) -> AsyncIterator[AsyncSession]:
+        """
+        Use a pooled session for the URL host.
+
+        Args:
+            url (str): a URL.
+            proxy (Optional[str]): the proxy URL. (None)
+            impersonate (Optional[str]): the browser to impersonate. (None)
+
+        Returns:
+            AsyncIterator[AsyncSession]: the session, in use until the block exits.
+
+        """
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        key = (urlsplit(url).netloc, proxy, impersonate)
+
+        expired = [
+            key_
+            for key_, pooled in cls._sessions.items()
+            if pooled.loop is not loop or (pooled.active == 0 and now - pooled.last_used > cls.idle_timeout)
+        ]
+        for key_ in expired:
+            await cls._close(key_)
+
+        pooled = cls._sessions.get(key)
+        if pooled is None:
+            while len(cls._sessions) >= cls.max_size:
+                idle_key = next((key_ for key_, pooled_ in cls._sessions.items() if pooled_.active == 0), None)
+                if idle_key is None:
+                    break
+
+                await cls._close(idle_key)
+
+            pooled = cls._sessions[key] = _PooledSession(session=AsyncSession(proxy=proxy, impersonate=impersonate), loop=loop)
+
+        cls._sessions.move_to_end(key)
+        pooled.active += 1
+        try:
+            yield pooled.session
+
+        finally:
+            pooled.active -= 1
+            pooled.last_used = time.monotonic()
+            if pooled.active == 0:
+                pooled.session.cookies.clear()
+
+    @classmethod
+    async def _close(cls, key: tuple[str, str | None, str | None]) -> None:
+        pooled = cls._sessions.pop(key)
+        if pooled.loop is asyncio.get_running_loop():
+            try:
+                await pooled.session.close()
+            except Exception:
+                pass
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """
+        Close all pooled sessions.
+        """
+        for key in list(cls._sessions):
+            await cls._close(key)
+
+
 def request_params(params: dict[str, ...] | None) -> dict[str, str | int | float] | None:
     """
     Convert requests params to aiohttp params.
@@ -72,25 +168,25 @@ async def async_get(url: str, headers: dict | None = None, **kwargs) -> dict | N
         Optional[dict]: received dictionary in response.
 
     """
-    async with AsyncSession() as session:
+    async with SessionPool.session(url=url, proxy=kwargs.pop("proxy", None), impersonate="chrome120") as session:
         response = await session.get(
             url=url,
             headers=headers,
-            impersonate="chrome120",
             **kwargs,
             # params=params,
             # proxy=proxy_url
         )
-        status_code = response.status_code
 
-        if status_code <= 202:
-            try:
-                response = response.json()
-                return response
+    status_code = response.status_code
 
-            except:
-                return response.text
-        raise exceptions.HTTPException(response=response, status_code=status_code)
+    if status_code <= 202:
+        try:
+            response = response.json()
+            return response
+
+        except:
+            return response.text
+    raise exceptions.HTTPException(response=response, status_code=status_code)
 
 
 async def async_put(url: str, headers: dict | None = None, **kwargs) -> dict | None:
@@ -106,7 +202,7 @@ async def async_put(url: str, headers: dict | None = None, **kwargs) -> dict | N
         Optional[dict]: received dictionary in response.
 
     """
-    async with AsyncSession() as session:
+    async with SessionPool.session(url=url, proxy=kwargs.pop("proxy", None)) as session:
         response = await session.put(
             url=url,
             headers=headers,
@@ -114,12 +210,13 @@ async def async_put(url: str, headers: dict | None = None, **kwargs) -> dict | N
             # params=params,
             # proxy=proxy_url
         )
-        status_code = response.status_code
 
-        if status_code <= 202:
-            response = response.json()
-            return response
-        raise exceptions.HTTPException(response=response, status_code=status_code)
+    status_code = response.status_code
+
+    if status_code <= 202:
+        response = response.json()
+        return response
+    raise exceptions.HTTPException(response=response, status_code=status_code)
 
 
 async def async_post(url: str, headers: dict | None = None, cookies_return=False, **kwargs) -> dict | None:
@@ -135,27 +232,26 @@ async def async_post(url: str, headers: dict | None = None, cookies_return=False
         Optional[dict]: received dictionary in response.
 
     """
-    async with AsyncSession() as session:
+    async with SessionPool.session(url=url, proxy=kwargs.pop("proxy", None), impersonate="chrome136") as session:
         response = await session.post(
             url=url,
             headers=headers,
-            impersonate="chrome136",
             **kwargs,
             # params=params,
             # proxy=proxy_url
         )
 
-        status_code = response.status_code
+    status_code = response.status_code
 
-        if status_code <= 202:
-            if cookies_return:
-                cookies = response.cookies
-                return response.json(), cookies
+    if status_code <= 202:
+        if cookies_return:
+            cookies = response.cookies
+            return response.json(), cookies
 
-            else:
-                return response.json()
+        else:
+            return response.json()
 
-        # if status_code <= 401:
-        #     return response
+    # if status_code <= 401:
+    #     return response
 
-        raise exceptions.HTTPException(response=response, status_code=status_code)
+    raise exceptions.HTTPException(response=response, status_code=status_code)
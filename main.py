@@ -1,4 +1,5 @@
 import asyncio
+import multiprocessing
 import platform
 
 import inquirer
@@ -9,9 +10,14 @@ from rich.console import Console
 from check_python import check_python_version
 from data.constants import PROJECT_NAME
 from functions.activity import activity
+from libs.eth_async.providers import RPCProviders
+from libs.eth_async.utils.web_requests import SessionPool
+from utils.browser import Browser
 from utils.create_files import create_files
+from utils.db_api.allowance_api import attach_allowance_storage
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db
+from utils.db_api.token_api import attach_token_storage
+from utils.db_api.wallet_api import adb, db
 from utils.db_import_export_sync import Export, Import, Sync
 from utils.git_version import check_for_updates
 from utils.output import show_channel_info
@@ -71,8 +77,15 @@ async def choose_action():
         console.print(f"[bold blue]Starting sync data in DB[/bold blue]")
         await Sync.sync_wallets_with_tokens_and_proxies()
     elif action == "Export Database to CSV":
+        export_answer = inquirer.prompt(
+            [
+                inquirer.Confirm("decrypt_private_keys", message="Add decrypted private keys column?", default=False),
+                inquirer.Confirm("compress", message="Compress CSV with gzip?", default=False),
+            ],
+            theme=Default(),
+        )
         console.print(f"[bold blue]Starting Export Database to CSV[/bold blue]")
-        await Export.data_to_csv()
+        await Export.data_to_csv(decrypt_private_keys=export_answer["decrypt_private_keys"], compress=export_answer["compress"])
 
     elif "1" in action:
         await activity(action=1)
@@ -104,10 +117,20 @@ async def main():
     create_files()
     await check_for_updates(repo_name=PROJECT_NAME, repo_private=False)
     db.ensure_model_columns(Wallet)
-    await choose_action()
+    attach_token_storage()
+    attach_allowance_storage()
+
+    try:
+        await choose_action()
+    finally:
+        await RPCProviders.close_all()
+        await SessionPool.close_all()
+        await Browser.close_all()
+        await adb.close()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     show_channel_info(PROJECT_NAME)
 
     if platform.system() == "Windows":
@@ -171,7 +171,6 @@ class R2(Base):
         tx_params = TxParams(to=contract.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -194,7 +193,6 @@ class R2(Base):
         tx_params = TxParams(to=contract.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -1,23 +1,20 @@
 import asyncio
-import random
 
 from loguru import logger
 from web3 import Web3
 from web3.types import TxParams
 
-from data.config import ABIS_DIR
-from data.models import Contracts
+from data.models import Contracts, load_abi
 from libs.base import Base
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import RawContract, TokenAmount
-from libs.eth_async.utils.files import read_json
 from utils.db_api.models import Wallet
 from utils.logs_decorator import controller_log
 
 STAKE_CONTRACT = RawContract(
     title="STAKE_CONTRACT",
     address="0x56f4add11d723412D27A9e9433315401B351d6E3",
-    abi=read_json((ABIS_DIR, "asseto.json")),
+    abi=load_abi("asseto.json"),
 )
 
 
@@ -49,7 +46,6 @@ class Asseto(Base):
             )
         )
 
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt and receipt["status"] == 1:
@@ -84,7 +80,6 @@ class Asseto(Base):
             )
         )
 
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt and receipt["status"] == 1:
@@ -144,7 +144,7 @@ class AutoStaking(Base):
         self.client = client
         self.wallet = wallet
         self.proxy = proxy
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
         self.auth_token = None
         self.base_headers = {
             "Accept": "application/json, text/plain, */*",
@@ -238,7 +238,6 @@ class AutoStaking(Base):
 
         tx_params = TxParams(to=mvMUSD.address, data=data, value=0)
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -332,7 +331,6 @@ class AutoStaking(Base):
         tx_params = TxParams(to=Web3.to_checksum_address(data["to"]), data=data["data"], value=0)
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
 
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -154,7 +154,7 @@ class Bitverse(Base):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
         self.base_headers = {
             "Accept": "application/json, text/plain, */*",
             "Accept-Language": "en-US,en;q=0.9",
@@ -251,7 +251,6 @@ class Bitverse(Base):
                 value=value,
             )
         )
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=600)
         if receipt:
             return tx.hash.hex() if hasattr(tx.hash, "hex") else str(tx.hash)
@@ -279,7 +278,6 @@ class Bitverse(Base):
             )
         )
 
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -302,7 +300,6 @@ class Bitverse(Base):
             )
         )
 
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if receipt:
             return f"Withdraw {amount} {token.title}"
@@ -363,7 +360,6 @@ class Bitverse(Base):
             )
         )
 
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if receipt:
             return f"Success Opened {'LONG' if side == 1 else 'SHORT'} position {pair} with {amount.Ether:.0f} USD"
@@ -420,7 +416,6 @@ class Bitverse(Base):
                 value=0,
             )
         )
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -18,6 +18,7 @@ from data.settings import Settings
 from libs.baseAsyncSession import BaseAsyncSession
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import DefaultABIs, RawContract, TokenAmount
+from libs.eth_async.encoders import Encoders
 from libs.eth_async.utils.utils import randfloat
 from modules.bitwerse_swap import BitverseSpot, V4PoolCandidate
 from utils.db_api.models import Wallet
@@ -359,8 +360,7 @@ class BitverseLiquidity(BitverseSpot):
 
     async def _erc20_approve_max(self, token: RawContract, spender: str) -> str:
         token = self._as_erc20(token)
-        t = await self.client.contracts.get(contract_address=token)
-        data = t.encode_abi("approve", args=[Web3.to_checksum_address(spender), 2**256 - 1])
+        data = Encoders.approve.encode(Web3.to_checksum_address(spender), 2**256 - 1)
 
         tx_params = TxParams(to=Web3.to_checksum_address(token.address), data=data, value=0)
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
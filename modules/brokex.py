@@ -11,6 +11,7 @@ from data.settings import Settings
 from libs.base import Base
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import DefaultABIs, RawContract, TokenAmount
+from libs.eth_async.encoders import Encoders
 from utils.browser import Browser
 from utils.db_api.models import Wallet
 from utils.logs_decorator import controller_log
@@ -158,7 +159,7 @@ class Brokex(Base):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
 
         self.base_headers = {
             "Accept": "*/*",
@@ -182,10 +183,9 @@ class Brokex(Base):
         # if not claimed:
 
         contract = await self.client.contracts.get(contract_address=FAUCET_ROUTER)
-        data = contract.encode_abi("claim", args=[])
+        data = Encoders.claim.encode()
 
         tx = await self.client.transactions.sign_and_send(TxParams(to=contract.address, data=data, value=0))
-        await asyncio.sleep(2)
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -196,7 +196,7 @@ class Brokex(Base):
         settings = Settings()
         usdt_balance = await self.client.wallet.balance(token=USDT)
         percent = random.randint(settings.autostake_percent_min, settings.autostake_percent_max) / 100
-        amount = TokenAmount(amount=float(usdt_balance.Ether) * percent / 100, decimals=usdt_balance.decimals)
+        amount = usdt_balance * percent / 100
 
         if await self.approve_interface(token_address=USDT.address, spender=POOL_ROUTER.address, amount=None):
             await asyncio.sleep(2)
@@ -207,7 +207,6 @@ class Brokex(Base):
         data = c.encode_abi("depositLiquidity", args=[int(amount.Wei)])
 
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=0))
-        await asyncio.sleep(2)
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
         return f"Success | Deposit LP {amount} USDT" if rcpt else "Failed | Deposit LP"
 
@@ -223,7 +222,6 @@ class Brokex(Base):
         data = c.encode_abi("withdrawLiquidity", args=[int(lp_amount.Wei)])
 
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=0))
-        await asyncio.sleep(2)
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=600)
         return f"Success | Withdraw LP {lp_amount}" if rcpt else "Failed | Withdraw LP"
 
@@ -285,9 +283,9 @@ class Brokex(Base):
             usdt_balance = await self.client.wallet.balance(token=USDT)
 
         percent = random.randint(settings.brokex_percent_min, settings.brokex_percent_max) / 100
-        amount = TokenAmount(amount=float(usdt_balance.Ether) * percent, decimals=usdt_balance.decimals)
+        amount = usdt_balance * percent
 
-        if float(amount.Ether) < 10:
+        if amount < 10:
             amount = TokenAmount(amount=10, decimals=usdt_balance.decimals)
 
         return await self.open_position(pair=pair, is_long=direction, amount=amount, lev=leverage)
@@ -326,7 +324,6 @@ class Brokex(Base):
         data = c.encode_abi("openPosition", args=[idx, proof_bytes, bool(is_long), int(lev), int(amount.Wei), int(sl), int(tp)])
 
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=0))
-        await asyncio.sleep(2)
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         return f"Success | Open {pair} {'Long' if is_long else 'Short'} {amount} USDT" if rcpt else "Failed | Open position"
@@ -354,7 +351,6 @@ class Brokex(Base):
             data = c.encode_abi("closePosition", args=[int(open_id), proof_bytes])
 
             tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=0))
-            await asyncio.sleep(2)
             rcpt = await tx.wait_for_receipt(client=self.client, timeout=600)
             return f"Success | Close position #{open_id}" if rcpt else "Failed | Close position"
         except Exception as e:
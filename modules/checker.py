@@ -7,7 +7,7 @@ from libs.base import Base
 from libs.eth_async.client import Client
 from utils.browser import Browser
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db
+from utils.db_api.wallet_api import adb
 
 
 class Checker(Base):
@@ -19,7 +19,7 @@ class Checker(Base):
         self.jwt = None
         self.cookies = None
         self.proxy = client.proxy
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
         self.wallet = wallet
 
         self.base_headers = {
@@ -117,7 +117,7 @@ class Checker(Base):
         if r.json().get("data"):
             logger.success(f"{self.wallet.id} | {self.client.account.address} | ELIGBLE | {r.json()}")
             self.wallet.eligble = True
-            db.commit()
+            await adb.commit()
 
         else:
             logger.info(f"{self.wallet.id} | {self.client.account.address} | {r.json()} | Seems not eligble")
@@ -1,7 +1,5 @@
 # modules/euclid_swap.py
 
-import asyncio
-import random
 from typing import List, Optional
 
 from loguru import logger
@@ -29,7 +27,7 @@ class EuclidSwap(Base):
     def __init__(self, wallet: Wallet):
         self.client = Client(private_key=wallet.private_key, proxy=wallet.proxy, network=Networks.MonadTestnet)
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
 
         self.base_headers = {
             "accept": "*/*",
@@ -61,7 +59,7 @@ class EuclidSwap(Base):
         if balance.Ether == 0:
             raise Exception(f"Failed | No native Monad balance")
 
-        if float(balance.Ether) <= float(amount.Ether):
+        if balance <= amount:
             msg = f"{self.wallet} | {self.__module_name__} | balance: {balance} MON < amount {amount} MON"
             logger.warning(msg)
             raise Exception(f"balance: {balance} MON < amount {amount} MON")
@@ -154,7 +152,6 @@ class EuclidSwap(Base):
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
 
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -8,13 +8,11 @@ from loguru import logger
 from web3 import Web3
 from web3.types import TxParams
 
-from data.config import ABIS_DIR
-from data.models import Contracts
+from data.models import Contracts, load_abi
 from data.settings import Settings
 from libs.base import Base
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import RawContract, TokenAmount, TxArgs
-from libs.eth_async.utils.files import read_json
 from libs.eth_async.utils.utils import randfloat
 from utils.browser import Browser
 from utils.db_api.models import Wallet
@@ -46,7 +44,7 @@ class Faroswap(Base):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
 
         self.base_headers = {
             "accept": "application/json, text/plain, */*",
@@ -70,12 +68,14 @@ class Faroswap(Base):
 
         if to_native:
             results = []
+            balances = await self.client.multicall.token_balances(tokens=tokens)
 
-            for token in tokens:
+            for token, amount in zip(tokens, balances):
                 try:
                     if token == Contracts.PHRS:
                         continue
-                    amount = await self.client.wallet.balance(token=token)
+                    if amount is None:
+                        amount = await self.client.wallet.balance(token=token)
                     if amount.Ether == 0:
                         continue
                     await self._swap(from_token=token, to_token=Contracts.WPHRS, amount=amount)
@@ -245,7 +245,6 @@ class Faroswap(Base):
         tx_params = TxParams(to=Web3.to_checksum_address(route.get("to")), data=route.get("data"), value=int(route.get("value")))
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -255,11 +254,11 @@ class Faroswap(Base):
 
 
 ZENITH_SWAP_ROUTER = RawContract(
-    title="FaroSwap Router", address="0x3541423f25a1ca5c98fdbcf478405d3f0aad1164", abi=read_json(path=(ABIS_DIR, "zenith_router.json"))
+    title="FaroSwap Router", address="0x3541423f25a1ca5c98fdbcf478405d3f0aad1164", abi=load_abi("zenith_router.json")
 )
 
 ZENITH_FACTORY = RawContract(
-    title="Zebith_factory", address="0x4b177aded3b8bd1d5d747f91b9e853513838cd49", abi=read_json(path=(ABIS_DIR, "zenith_factory_v3.json"))
+    title="Zebith_factory", address="0x4b177aded3b8bd1d5d747f91b9e853513838cd49", abi=load_abi("zenith_factory_v3.json")
 )
 
 POSITION_MANAGER_ABI = [
@@ -329,7 +328,7 @@ class FaroswapLiquidity(Faroswap):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
 
         self.base_headers = {
             "accept": "application/json, text/plain, */*",
@@ -526,7 +525,6 @@ class FaroswapLiquidity(Faroswap):
 
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=0))
 
-        await asyncio.sleep(2)
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if rcpt:
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import asyncio
-import random
 import time
 
 from eth_abi import encode
@@ -166,7 +164,7 @@ class Gotchipus(Base):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
         self.base_headers = {
             "Accept": "*/*",
             "Origin": "https://gotchipus.com",
@@ -194,7 +192,6 @@ class Gotchipus(Base):
         tx_params = TxParams(to=c.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -213,7 +210,6 @@ class Gotchipus(Base):
         tx_params = TxParams(to=c.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -310,7 +306,6 @@ class Gotchipus(Base):
         tx_params = TxParams(to=c.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -348,7 +343,7 @@ class Gotchipus(Base):
 
         balance = await self.client.wallet.balance()
 
-        stake = TokenAmount(amount=float(balance.Ether) * 0.05)
+        stake = balance * 0.05
 
         args = [
             [
@@ -366,7 +361,6 @@ class Gotchipus(Base):
         tx_params = TxParams(to=c.address, data=data, value=stake.Wei)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -389,7 +383,6 @@ class Gotchipus(Base):
         tx_params = TxParams(to=c.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
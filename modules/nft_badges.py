@@ -1,4 +1,3 @@
-import asyncio
 import random
 
 from web3 import Web3
@@ -7,6 +6,7 @@ from web3.types import TxParams
 from libs.base import Base
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import RawContract, TokenAmount, TxArgs
+from libs.eth_async.encoders import Encoders
 from utils.browser import Browser
 from utils.db_api.models import Wallet
 from utils.logs_decorator import controller_log
@@ -64,7 +64,7 @@ class NFTS(Base):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
         self.headers = {
             "Accept": "application/json, text/plain, */*",
         }
@@ -94,22 +94,25 @@ class NFTS(Base):
             _data=b"",
         ).tuple()
 
-        data = c.encode_abi("claim", args=data)
+        data = Encoders.nft_drop_claim.encode(*data)
 
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=amount.Wei))
 
-        await asyncio.sleep(2)
-
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
         return f"Success | Minted {contract.title}" if rcpt else f"Failed | Mint {contract.title}"
 
     async def check_badges(self):
         nfts = PHAROS_ATLANTIC_BADGE
 
+        balances = await self.client.multicall.aggregate(
+            [self.client.multicall.balance_of(token=nft, owner=self.client.account.address) for nft in nfts]
+        )
+
         not_minted = []
 
-        for nft in nfts:
-            balance = await self.check_mint(contract=nft)
+        for nft, balance in zip(nfts, balances):
+            if balance is None:
+                balance = await self.check_mint(contract=nft)
             if balance == 0:
                 not_minted.append(nft)
 
@@ -318,13 +318,13 @@ class OpenFi(Base):
 
     async def balance_map(self, tokens: list):
         balance_map = {}
-        for token in tokens:
-            if token == Contracts.PHRS:
-                balance = await self.client.wallet.balance()
-                if balance.Ether == 0:
-                    return "Failed | No balance, try to faucet first"
-            else:
-                balance = await self.client.wallet.balance(token.address)
+        balances = await self.client.multicall.token_balances(tokens=tokens)
+        for token, balance in zip(tokens, balances):
+            if not balance:
+                continue
+
+            if token == Contracts.PHRS and balance.Ether == 0:
+                return "Failed | No balance, try to faucet first"
 
             if balance.Ether > 0.1:
                 balance_map[token] = balance.Ether
@@ -418,7 +418,6 @@ class OpenFi(Base):
         tx_params = TxParams(to=contract.address, data=encode, value=amount.Wei if from_token_is_phrs else 0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if receipt:
             return f"Success supplied {amount.Ether:.5f} {token.title}"
@@ -462,7 +461,6 @@ class OpenFi(Base):
         tx_params = TxParams(to=contract.address, data=encode, value=amount.Wei if from_token_is_phrs else 0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if receipt:
             return f"Success borrowed {amount.Ether:.5f} {token.title}"
@@ -506,7 +504,6 @@ class OpenFi(Base):
         tx_params = TxParams(to=contract.address, data=encode, value=amount.Wei if from_token_is_phrs else 0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if receipt:
             return f"Success borrowed {amount.Ether:.5f} {token.title}"
@@ -2,6 +2,7 @@ import asyncio
 import datetime as dt
 import random
 from datetime import datetime, timezone
+from functools import cached_property
 from urllib.parse import parse_qs, unquote, urlparse
 
 from loguru import logger
@@ -11,12 +12,15 @@ from libs.base import Base
 from libs.eth_async.client import Client
 from utils.browser import Browser
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db
+from utils.db_api.wallet_api import get_invite_codes
 from utils.logs_decorator import action_log, controller_log
 from utils.query_json import query_to_json
 from utils.retry import async_retry
+from utils.shared_cache import SharedCache
 from utils.twitter.twitter_client import TwitterClient
 
+TASKS_CATALOGUE_TTL = 600
+
 
 class PharosPortal(Base):
     __module__ = "Pharos Portal"
@@ -32,9 +36,7 @@ class PharosPortal(Base):
         self.jwt = None
         self.auth = False
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
-        self.twitter = TwitterClient(user=self.wallet)
-
+        self.session = Browser.for_wallet(wallet=wallet)
         self.base_headers = {
             "accept": "application/json, text/plain, */*",
             "accept-language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
@@ -51,6 +53,10 @@ class PharosPortal(Base):
     def __repr__(self):
         return f"{self.__module__} | [{self.client.account.address}]"
 
+    @cached_property
+    def twitter(self) -> TwitterClient:
+        return TwitterClient(user=self.wallet)
+
     async def _siwe_message(self, nonce: int) -> tuple[str, str]:
         issued_at = dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
@@ -84,7 +90,7 @@ class PharosPortal(Base):
 
     async def login(self, registration=False):
         settings = Settings()
-        nonce = await self.client.wallet.nonce()
+        nonce = await self.client.nonce_manager.peek()
 
         message, timestamp = await self._siwe_message(nonce=nonce)
         sig = await self.sign_message(text=message)
@@ -103,7 +109,7 @@ class PharosPortal(Base):
             if settings.invite_codes:  # use only settings if provided
                 invite_code = random.choice(settings.invite_codes)
             else:
-                invite_codes_from_db = [code[0] for code in db.all(Wallet.invite_code, Wallet.invite_code != "")]
+                invite_codes_from_db = await get_invite_codes()
                 invite_code = random.choice(invite_codes_from_db) if invite_codes_from_db else ""
 
             if invite_code:
@@ -359,6 +365,10 @@ class PharosPortal(Base):
             return "Failed Check In"
 
     async def get_user_tasks(self, user=False) -> dict:
+        if not user:
+            # the task catalogue is the same for every wallet
+            return await SharedCache.get(key=f"{self.BASE}/info/tasks", fetch=self._get_tasks_catalogue, ttl=TASKS_CATALOGUE_TTL)
+
         if not self.auth:
             await self.login()
 
@@ -367,20 +377,28 @@ class PharosPortal(Base):
             "authorization": f"Bearer {self.jwt}",
         }
 
-        if user:
-            params = {
-                "address": self.client.account.address,
-            }
-            r = await self.session.get(
-                url=f"{self.BASE}/user/tasks",
-                headers=headers,
-                params=params,
-                timeout=120,
-            )
+        params = {
+            "address": self.client.account.address,
+        }
+        r = await self.session.get(
+            url=f"{self.BASE}/user/tasks",
+            headers=headers,
+            params=params,
+            timeout=120,
+        )
 
-            r.raise_for_status()
+        r.raise_for_status()
+
+        return r.json().get("data").get("user_tasks")
 
-            return r.json().get("data").get("user_tasks")
+    async def _get_tasks_catalogue(self) -> dict:
+        if not self.auth:
+            await self.login()
+
+        headers = {
+            **self.base_headers,
+            "authorization": f"Bearer {self.jwt}",
+        }
 
         r = await self.session.get(
             url=f"{self.BASE}/info/tasks",
@@ -415,9 +433,11 @@ class PharosPortal(Base):
 
         return out
 
-    async def tasks_flow(self):
-        all_tasks = await self.get_user_tasks()
-        user_tasks = await self.get_user_tasks(user=True)
+    async def tasks_flow(self, all_tasks: dict | None = None, user_tasks: list[dict] | None = None):
+        if all_tasks is None:
+            all_tasks = await self.get_user_tasks()
+        if user_tasks is None:
+            user_tasks = await self.get_user_tasks(user=True)
 
         completed_ids = {task.get("TaskId") for task in user_tasks}
         social_tasks = (all_tasks.get("Social Tasks") or {}).get("tasks") or []
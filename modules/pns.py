@@ -7,11 +7,10 @@ from loguru import logger
 from web3 import Web3
 from web3.types import TxParams
 
-from data.config import ABIS_DIR
+from data.models import load_abi
 from libs.base import Base
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import RawContract, TokenAmount, TxArgs
-from libs.eth_async.utils.files import read_json
 from utils.browser import Browser
 from utils.db_api.models import Wallet
 from utils.logs_decorator import controller_log
@@ -19,14 +18,14 @@ from utils.logs_decorator import controller_log
 PNS_CONTROLLER = RawContract(
     title="PNS_Controller",
     address="0x51be1ef20a1fd5179419738fc71d95a8b6f8a175",
-    abi=read_json((ABIS_DIR, "pns_controller.json")),
+    abi=load_abi("pns_controller.json"),
 )
 
 
 RESOLVER = RawContract(
     title="Resolver",
     address="0x9a43dcA1C3BB268546b98eb2AB1401bFc5b58505",
-    abi=read_json((ABIS_DIR, "pns_controller.json")),
+    abi=load_abi("pns_controller.json"),
 )
 
 ONE_MONTH_DURATION = 2_592_000
@@ -38,7 +37,7 @@ class PNS(Base):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
 
     @staticmethod
     async def _rand_domain(length: int = 9) -> str:
@@ -67,7 +66,7 @@ class PNS(Base):
 
         balance = await self.client.wallet.balance()
 
-        if float(balance.Ether) < float(amount.Ether):
+        if balance < amount:
             return f"Failed | Not enough balance {balance.Ether} PNS for mint PNS domain - {amount.Ether}"
 
         # 1) makeCommitment (view)
@@ -77,7 +76,6 @@ class PNS(Base):
         tx_commit = TxParams(to=contract.address, data=commit_data, value=0)
 
         tx1 = await self.client.transactions.sign_and_send(tx_params=tx_commit)
-        await asyncio.sleep(random.randint(2, 4))
         rcpt1 = await tx1.wait_for_receipt(client=self.client, timeout=300)
 
         if not rcpt1:
@@ -96,7 +94,6 @@ class PNS(Base):
 
         tx_register = TxParams(to=contract.address, data=reg_data, value=amount.Wei)
         tx2 = await self.client.transactions.sign_and_send(tx_params=tx_register)
-        await asyncio.sleep(random.randint(2, 4))
         rcpt2 = await tx2.wait_for_receipt(client=self.client, timeout=300)
 
         if rcpt2:
@@ -181,7 +178,6 @@ class PNS(Base):
         tx_register = TxParams(to=contract.address, data=data, value=0)
 
         tx2 = await self.client.transactions.sign_and_send(tx_params=tx_register)
-        await asyncio.sleep(random.randint(2, 4))
         reciept = await tx2.wait_for_receipt(client=self.client, timeout=300)
 
         if reciept:
@@ -1,14 +1,12 @@
-import asyncio
 import random
 import string
 
 from web3.types import TxParams
 
-from data.config import ABIS_DIR
+from data.models import load_abi
 from libs.base import Base
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import RawContract, TokenAmount
-from libs.eth_async.utils.files import read_json
 from libs.eth_async.utils.utils import randfloat
 from utils.db_api.models import Wallet
 from utils.logs_decorator import controller_log
@@ -16,7 +14,7 @@ from utils.logs_decorator import controller_log
 PRIMUS = RawContract(
     title="Primus",
     address="0xd17512b7ec12880bd94eca9d774089ff89805f02",
-    abi=read_json((ABIS_DIR, "primus.json")),
+    abi=load_abi("primus.json"),
 )
 
 
@@ -64,8 +62,6 @@ class Primus(Base):
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
 
-        await asyncio.sleep(random.randint(2, 4))
-
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
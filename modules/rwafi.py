@@ -1,4 +1,3 @@
-import asyncio
 import json
 import random
 import time
@@ -116,7 +115,7 @@ class AquaFlux(Base):
         self.client = client
         self.wallet = wallet
         self.proxy = proxy
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
         self.auth_token: Optional[str] = None
         self.base_headers = {
             "Accept": "application/json, text/plain, */*",
@@ -332,7 +331,6 @@ class AquaFlux(Base):
         data = c.encode_abi("stake", args=params.tuple())
         data = "0xa694fc3a" + data[10:]
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data))
-        await asyncio.sleep(4)
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if rcpt:
             return f"{self.wallet} success earn {amount} {token_structure.title}"
@@ -373,7 +371,6 @@ class AquaFlux(Base):
         data = c.encode_abi("deposit", args=params.tuple())
         data = "0xef272020" + data[10:]
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=0))
-        await asyncio.sleep(2)
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if rcpt:
             return f"{self.wallet} success deposit {amount} {token_structure.title}"
@@ -439,7 +436,6 @@ class AquaFlux(Base):
         data = "0xc564e9ce" + data[10:]
         contract_address = Web3.to_checksum_address(get_faucet_data.get("contractAddress"))
         tx = await self.client.transactions.sign_and_send(TxParams(to=contract_address, data=data))
-        await asyncio.sleep(3)
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if rcpt:
             return f"{self.wallet} success faucet {get_faucet_data.get('baseAmount')} {token_claim.title}"
@@ -456,8 +452,6 @@ class AquaFlux(Base):
 
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=0))
 
-        await asyncio.sleep(2)
-
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
         return f"Success | {variant} {amount.Ether} PHRS" if rcpt else f"Failed | {variant}"
 
@@ -519,6 +513,5 @@ class AquaFlux(Base):
 
             tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=calldata, value=0))
 
-            await asyncio.sleep(2)
             rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
             return f"Success | minted {nft_type} nft" if rcpt else f"Failed | mint {nft_type} nft"
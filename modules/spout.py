@@ -128,7 +128,7 @@ class Spout(Base):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
         self.BASE_API = "https://www.spout.finance/api"
 
     async def get_identity(self) -> str:
@@ -221,7 +221,6 @@ class Spout(Base):
         tx_params = TxParams(to=c.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -277,7 +276,6 @@ class Spout(Base):
         tx_params = TxParams(to=c.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -304,7 +302,6 @@ class Spout(Base):
         tx_params = TxParams(to=c.address, data=data, value=0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
@@ -326,8 +323,6 @@ class Spout(Base):
         to_token = SLQD
 
         balance = await self.client.wallet.balance(token=from_token)
-        amount = TokenAmount(
-            amount=float(balance.Ether) * percent, decimals=await self.client.transactions.get_decimals(contract=from_token.address)
-        )
+        amount = balance * percent
 
         return await self._swap(from_token=from_token, to_token=to_token, amount=amount)
@@ -1,4 +1,3 @@
-import asyncio
 import random
 
 from eth_abi import encode
@@ -20,7 +19,7 @@ class Watchoor(Base):
     def __init__(self, client: Client, wallet: Wallet):
         self.client = client
         self.wallet = wallet
-        self.browser = Browser(wallet=wallet)
+        self.browser = Browser.for_wallet(wallet=wallet)
 
     def encode_exact(self, selector_hex: str, name: str, symbol: str) -> str:
         selector = bytes.fromhex(selector_hex.replace("0x", ""))
@@ -84,8 +83,6 @@ class Watchoor(Base):
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
 
-        await asyncio.sleep(random.randint(2, 4))
-
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if receipt:
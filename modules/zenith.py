@@ -2,17 +2,17 @@ import asyncio
 import random
 import time
 
+from hexbytes import HexBytes
 from loguru import logger
 from web3 import Web3
 from web3.types import TxParams
 
-from data.config import ABIS_DIR
-from data.models import Contracts
+from data.models import Contracts, load_abi
 from data.settings import Settings
 from libs.base import Base
 from libs.eth_async.client import Client
 from libs.eth_async.data.models import RawContract, TokenAmount, TxArgs
-from libs.eth_async.utils.files import read_json
+from libs.eth_async.encoders import Encoders
 from libs.eth_async.utils.utils import randfloat
 from modules.R2 import USDC_R2
 from utils.browser import Browser
@@ -21,11 +21,11 @@ from utils.db_api.models import Wallet
 from utils.logs_decorator import controller_log
 
 ZENITH_SWAP_ROUTER = RawContract(
-    title="Zenith_router", address="0x9b84996d519c6a046da9fb6b9be41bad217cb783", abi=read_json(path=(ABIS_DIR, "zenith_router.json"))
+    title="Zenith_router", address="0x9b84996d519c6a046da9fb6b9be41bad217cb783", abi=load_abi("zenith_router.json")
 )
 
 ZENITH_FACTORY = RawContract(
-    title="Zebith_factory", address="0xb056A6B9f61B2c0eBF4906aac341Bd118A1763fe", abi=read_json(path=(ABIS_DIR, "zenith_factory_v3.json"))
+    title="Zebith_factory", address="0xb056A6B9f61B2c0eBF4906aac341Bd118A1763fe", abi=load_abi("zenith_factory_v3.json")
 )
 
 
@@ -42,7 +42,7 @@ class Zenith(Base):
             "origin": "https://atlantic.zenithswap.xyz",
             "referer": "https://atlantic.zenithswap.xyz/",
         }
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
 
     # todo Zenith Faucet
 
@@ -148,7 +148,7 @@ class Zenith(Base):
             if pool_address == "0x0000000000000000000000000000000000000000":
                 return None
             else:
-                return RawContract(title="POOL", address=pool_address, abi=read_json(path=(ABIS_DIR, "zenith_v3_pool.json")))
+                return RawContract(title="POOL", address=pool_address, abi=load_abi("zenith_v3_pool.json"))
         except Exception as e:
             logger.exception(e)
             return None
@@ -223,18 +223,18 @@ class Zenith(Base):
             sqrtPriceLimitX96=0,
         ).tuple()
 
-        encode = contract.encode_abi("exactInputSingle", args=[data])
+        encode = Encoders.exact_input_single.encode(data)
 
         deadline = int(time.time() + 20 * 60)
 
         if from_token_is_phrs:
-            second_item = contract.encode_abi("refundETH", args=[])
+            second_item = Encoders.refund_eth.encode()
         elif to_token_is_phrs:
-            second_item = contract.encode_abi("unwrapWETH9", args=[amount_out_min.Wei, self.client.account.address])
+            second_item = Encoders.unwrap_weth9.encode(amount_out_min.Wei, self.client.account.address)
         else:
             second_item = None
 
-        encode = contract.encode_abi("multicall", args=[deadline, [item for item in [encode, second_item] if item is not None]])
+        encode = Encoders.multicall_deadline.encode(deadline, [HexBytes(item) for item in [encode, second_item] if item is not None])
 
         if not from_token_is_phrs:
             if await self.approve_interface(token_address=from_token.address, spender=contract.address, amount=None):
@@ -245,7 +245,6 @@ class Zenith(Base):
         tx_params = TxParams(to=contract.address, data=encode, value=amount.Wei if from_token_is_phrs else 0)
 
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if receipt:
             return f"Success swap {amount.Ether:.5f} {from_token.title} to {amount_out_min.Ether:.5f} {to_token.title}"
@@ -580,7 +579,7 @@ class ZenithLiquidity(Zenith):
 
         if not from_token_is_phrs:
             from_token_balance = await self.client.wallet.balance(token=from_token)
-            if float(from_token_balance.Ether) < float(amt0.Ether):
+            if from_token_balance < amt0:
                 logger.warning(
                     f"{self.wallet} | {self.__module_name__} | Not enought {amt0} {from_token.title} balance {from_token_balance}, trying to swap from native"
                 )
@@ -592,7 +591,7 @@ class ZenithLiquidity(Zenith):
 
         if not to_token_is_phrs:
             to_token_balance = await self.client.wallet.balance(token=to_token)
-            if float(to_token_balance.Ether) < float(amt1.Ether):
+            if to_token_balance < amt1:
                 logger.warning(
                     f"{self.wallet} | {self.__module_name__} | Not enought {amt1} {to_token.title} balance {to_token_balance}, trying to swap from native"
                 )
@@ -648,8 +647,8 @@ class ZenithLiquidity(Zenith):
         c = await self.client.contracts.get(contract_address=POSITION_MANAGER)
 
         if slippage:
-            a_amt_min = TokenAmount(amount=float(a_amt.Ether) * (100 - slippage) / 100, decimals=a_amt.decimals)
-            b_amt_min = TokenAmount(amount=float(b_amt.Ether) * (100 - slippage) / 100, decimals=b_amt.decimals)
+            a_amt_min = a_amt * (100 - slippage) / 100
+            b_amt_min = b_amt * (100 - slippage) / 100
         else:
             a_amt_min = 0
             b_amt_min = 0
@@ -723,7 +722,6 @@ class ZenithLiquidity(Zenith):
 
         tx = await self.client.transactions.sign_and_send(TxParams(to=c.address, data=data, value=value.Wei))
 
-        await asyncio.sleep(2)
         rcpt = await tx.wait_for_receipt(client=self.client, timeout=300)
 
         if rcpt:
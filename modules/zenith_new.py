@@ -41,7 +41,7 @@ class ZenithNew(Faroswap):
             "origin": "https://testnet.zenithswap.xyz",
             "referer": "https://testnet.zenithswap.xyz/",
         }
-        self.session = Browser(wallet=wallet)
+        self.session = Browser.for_wallet(wallet=wallet)
         self.base_headers = {
             "accept": "application/json, text/plain, */*",
             "accept-language": "en-US,en;q=0.9",
@@ -76,7 +76,6 @@ class ZenithNew(Faroswap):
         data = c.encode_abi("supply", args=tx_args.tuple())
         tx_params = TxParams(to=c.address, data=data)
         tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-        await asyncio.sleep(random.randint(2, 4))
         receipt = await tx.wait_for_receipt(client=self.client, timeout=300)
         if receipt:
             return f"Success Add Liq {amount.Ether:.5f} {token_liq.title} to Zenith"
@@ -1,3 +1,6 @@
+import asyncio
+import time
+from collections import OrderedDict
 from typing import Optional
 
 from libs.baseAsyncSession import BaseAsyncSession
@@ -5,39 +8,141 @@ from utils.db_api.models import Wallet
 
 
 class Browser:
+    """
+    An HTTP client of a wallet that keeps its curl_cffi session open between requests, so requests through the wallet
+    proxy reuse the connection (keep-alive, HTTP/2 when the server negotiates it) instead of repeating the proxy and
+    TLS handshakes.
+
+    A session idle for more than 'idle_timeout' seconds is closed and reopened on the next request. At most
+    'max_sessions' sessions are open across all wallets: opening one more closes the least recently used idle session
+    or waits for one. Cookies are not kept between requests.
+    """
+
     __module__ = "Browser"
 
+    idle_timeout: float = 90.0
+    max_sessions: int = 100
+
+    _wallet_browsers: dict[Wallet, "Browser"] = {}
+    _open: OrderedDict["Browser", None] = OrderedDict()
+    _released: asyncio.Event = asyncio.Event()
+
     def __init__(self, wallet: Optional[Wallet] = None):
         self.wallet: Optional[Wallet] = wallet
         self.async_session: Optional[BaseAsyncSession] = None
+        self._active = 0
+        self._last_used = 0.0
+
+    @classmethod
+    def for_wallet(cls, wallet: Optional[Wallet] = None) -> "Browser":
+        """
+        Returns the browser shared by all modules of the wallet. It is kept until 'aclose_for_wallet' is called for
+        the wallet, e.g. when the wallet task ends.
+        """
+        if wallet is None:
+            return cls()
+
+        browser = cls._wallet_browsers.get(wallet)
+        if browser is None:
+            browser = cls._wallet_browsers[wallet] = cls(wallet=wallet)
+
+        return browser
+
+    @classmethod
+    async def aclose_for_wallet(cls, wallet: Wallet):
+        """
+        Closes the session of the wallet browser and forgets the browser, e.g. when the wallet task ends.
+        """
+        browser = cls._wallet_browsers.pop(wallet, None)
+        if browser is not None:
+            await browser.aclose()
+
+    @classmethod
+    async def close_all(cls):
+        """
+        Closes sessions of all browsers and forgets wallet browsers.
+        """
+        cls._wallet_browsers.clear()
+        for browser in list(cls._open):
+            await browser.aclose()
+
+    @classmethod
+    async def _close_expired(cls):
+        now = time.monotonic()
+        for browser in [browser for browser in cls._open if browser._active == 0 and now - browser._last_used > cls.idle_timeout]:
+            await browser.aclose()
+
+    @classmethod
+    async def _wait_for_slot(cls):
+        while len(cls._open) >= cls.max_sessions:
+            idle_browser = next((browser for browser in cls._open if browser._active == 0), None)
+            if idle_browser is not None:
+                await idle_browser.aclose()
+                continue
+
+            cls._released.clear()
+            await cls._released.wait()
 
     async def _ensure_session(self):
+        self._active += 1
+        try:
+            await Browser._close_expired()
+            if self.async_session is None:
+                await Browser._wait_for_slot()
+
+        except BaseException:
+            self._release()
+            raise
+
         if self.async_session is None:
             proxy = self.wallet.proxy if self.wallet else None
             self.async_session = BaseAsyncSession(proxy=proxy)
 
-    async def _close_session(self):
-        if self.async_session:
-            await self.async_session.close()
-            self.async_session = None
+        Browser._open[self] = None
+        Browser._open.move_to_end(self)
+        return self.async_session
+
+    def _release(self):
+        self._active -= 1
+        self._last_used = time.monotonic()
+        Browser._released.set()
+
+    def _release_session(self, session: BaseAsyncSession):
+        session.cookies.clear()
+        self._release()
+
+    async def aclose(self):
+        """
+        Closes the session, the next request opens a new one.
+        """
+        session, self.async_session = self.async_session, None
+        if session is None:
+            return
+
+        Browser._open.pop(self, None)
+        Browser._released.set()
+        try:
+            await session.close()
+        except Exception:
+            pass
 
     async def get(self, **kwargs):
-        await self._ensure_session()
+        session = await self._ensure_session()
         try:
-            return await self.async_session.get(**kwargs)
+            return await session.get(**kwargs)
         finally:
-            await self._close_session()
+            self._release_session(session)
 
     async def post(self, **kwargs):
-        await self._ensure_session()
+        session = await self._ensure_session()
         try:
-            return await self.async_session.post(**kwargs)
+            return await session.post(**kwargs)
         finally:
-            await self._close_session()
+            self._release_session(session)
 
     async def put(self, **kwargs):
-        await self._ensure_session()
+        session = await self._ensure_session()
         try:
-            return await self.async_session.put(**kwargs)
+            return await session.put(**kwargs)
         finally:
-            await self._close_session()
+            self._release_session(session)
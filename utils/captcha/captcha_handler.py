@@ -21,7 +21,7 @@ class CloudflareHandler:
         Args:
             browser: Browser instance for making requests
         """
-        self.browser = Browser(wallet=wallet)
+        self.browser = Browser.for_wallet(wallet=wallet)
 
     async def parse_proxy(self) -> Tuple[Optional[str], Optional[int], Optional[str], Optional[str]]:
         """
@@ -0,0 +1,31 @@
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert
+
+from libs.eth_async.allowance_cache import AllowanceCache, AllowanceKey
+from utils.db_api.models import Allowance
+from utils.db_api.wallet_api import adb, db
+
+
+def get_infinite_allowances() -> list[AllowanceKey]:
+    return [(allowance.chain_id, allowance.owner, allowance.token, allowance.spender) for allowance in db.all(Allowance)]
+
+
+def save_infinite_allowance(key: AllowanceKey) -> None:
+    chain_id, owner, token, spender = key
+    stmt = insert(Allowance).values(chain_id=chain_id, owner=owner, token=token, spender=spender)
+    adb.submit(stmt.on_conflict_do_nothing(index_elements=["chain_id", "owner", "token", "spender"]))
+
+
+def delete_infinite_allowance(key: AllowanceKey) -> None:
+    chain_id, owner, token, spender = key
+    stmt = delete(Allowance).where(
+        Allowance.chain_id == chain_id, Allowance.owner == owner, Allowance.token == token, Allowance.spender == spender
+    )
+    adb.submit(stmt)
+
+
+def attach_allowance_storage() -> None:
+    """
+    Persist infinite allowances seen at runtime in the wallets DB, so warm starts skip allowance checks.
+    """
+    AllowanceCache.attach_storage(load=get_infinite_allowances, save=save_infinite_allowance, delete=delete_infinite_allowance)
@@ -1,7 +1,22 @@
+import asyncio
+from contextlib import suppress
+
 from loguru import logger
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, select, text, update
 from sqlalchemy.exc import DatabaseError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+# WAL lets readers work during a write and NORMAL syncs the WAL on checkpoints only, instead of on every commit.
+SQLITE_PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL", "PRAGMA busy_timeout=5000")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 
 class DB:
@@ -13,6 +28,8 @@ class DB:
         """
         self.db_url = db_url
         self.engine = create_engine(self.db_url, **kwargs)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         self.Base = None
         self.s: Session = Session(bind=self.engine)
         self.conn = self.engine.connect()
@@ -60,17 +77,16 @@ class DB:
         :return list: found row or None
         """
         if entities and criterion:
-            rows = self.all(entities, *criterion)
-        else:
-            rows = self.all(stmt=stmt)
+            stmt = select(entities).where(*criterion)
 
-        if rows:
-            if from_the_end:
-                return rows[-1]
+        if stmt is None:
+            return None
 
-            return rows[0]
+        if from_the_end:
+            rows = self.all(stmt=stmt)
+            return rows[-1] if rows else None
 
-        return None
+        return self.s.scalars(stmt.limit(1)).first()
 
     def execute(self, query, *args):
         """
@@ -145,6 +161,13 @@ class DB:
         except DatabaseError as e:
             logger.error(f"Error adding column '{column_name}' to table '{table_name}': {e}")
 
+    def ensure_model_indexes(self, model) -> None:
+        """
+        Creating indexes of ORM-model missed in SQLite, e.g. on tables created before the index was declared.
+        """
+        for index in model.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+
     def ensure_model_columns(self, model) -> None:
         """
         Adding to SQLite missed columns based on ORM-model.
@@ -185,3 +208,222 @@ class DB:
                 logger.warning(f"[schema] '{table_name}.{col.name}' NOT NULL without DEFAULT → adding as NULLABLE")
 
             self.add_column_to_table(table_name=table_name, column_name=col.name, column_type=col_type_sql, default_value=default_val)
+
+
+class AsyncDB:
+    def __init__(self, db_url: str, flush_interval: float = 0.5, max_pending: int = 50, **kwargs):
+        """
+        Initializes a class with an asynchronous engine, e.g. 'sqlite+aiosqlite:///...'.
+
+        The session is shared by all tasks, so its operations are serialized with a lock. Loaded objects aren't
+        expired, because reloading their attributes lazily isn't possible outside of an awaited call. Rows changed
+        elsewhere, e.g. through the sync 'DB' from the menu, are reloaded only by reads with 'refresh', so a run
+        should load its rows with it.
+
+        'commit' is write-behind: it takes the changed columns of loaded objects, coalescing several changes of the
+        same row, and they are written in one transaction 'flush_interval' seconds after the first change or as soon
+        as 'max_pending' rows are changed. Statements queued with 'submit' are executed in the same transaction.
+        A failed write is queued again and retried with a growing delay, 'close' writes the rest and raises if it fails.
+
+        :param str db_url: a URL containing all the necessary parameters to connect to a DB
+        :param float flush_interval: the maximum delay of a write in seconds
+        :param int max_pending: the number of changed rows that triggers a write at once
+        """
+        self.db_url = db_url
+        self.engine: AsyncEngine = create_async_engine(self.db_url, **kwargs)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine.sync_engine, "connect", _set_sqlite_pragmas)
+        self.s: AsyncSession = AsyncSession(bind=self.engine, expire_on_commit=False, autoflush=False)
+        self.lock = asyncio.Lock()
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: dict[tuple, dict] = {}
+        self._statements: list = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def all(self, entities=None, *criterion, stmt=None, order_by=None, refresh: bool = False) -> list:
+        """
+        Fetches all rows.
+
+        :param entities: an ORM entity
+        :param stmt: stmt
+        :param criterion: criterion for rows filtering
+        :param refresh: write pending changes and reload already loaded objects from the DB
+        :return list: the list of rows
+        """
+        if stmt is None:
+            if not entities:
+                return []
+
+            stmt = select(entities)
+            if criterion:
+                stmt = stmt.where(*criterion)
+            if order_by is not None:
+                stmt = stmt.order_by(order_by)
+
+        if refresh:
+            await self.flush()
+            stmt = stmt.execution_options(populate_existing=True)
+
+        async with self.lock:
+            return list((await self.s.scalars(stmt)).all())
+
+    async def one(self, entities=None, *criterion, stmt=None, from_the_end: bool = False):
+        """
+        Fetches one row.
+
+        :param entities: an ORM entity
+        :param stmt: stmt
+        :param criterion: criterion for rows filtering
+        :param from_the_end: get the row from the end
+        :return list: found row or None
+        """
+        if entities and criterion:
+            stmt = select(entities).where(*criterion)
+
+        if stmt is None:
+            return None
+
+        if from_the_end:
+            rows = await self.all(stmt=stmt)
+            return rows[-1] if rows else None
+
+        async with self.lock:
+            return (await self.s.scalars(stmt.limit(1))).first()
+
+    async def execute(self, query, *args):
+        """
+        Executes SQL query.
+
+        :param query: the query
+        :param args: any additional arguments
+        """
+        await self.flush()
+        async with self.engine.begin() as conn:
+            return await conn.execute(text(query), *args)
+
+    def submit(self, stmt) -> None:
+        """
+        Queues a write statement, e.g. an insert of a row that isn't loaded in the session. It is executed with the
+        next write, so it must be called from a running event loop.
+
+        :param stmt: the statement
+        """
+        self._statements.append(stmt)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    def _collect(self) -> None:
+        # Changes are moved from the objects to the queue synchronously, so tasks changing objects while the queue
+        # is being written can't lose their changes.
+        for obj in list(self.s.dirty):
+            state = inspect(obj)
+            changes = {key: state.dict[key] for key in state.committed_state if key in state.dict}
+            if not changes:
+                continue
+
+            self._pending.setdefault((type(obj), state.identity), {}).update(changes)
+            for key, value in changes.items():
+                set_committed_value(obj, key, value)
+
+    async def commit(self):
+        """
+        Schedules committing of changes.
+        """
+        self._collect()
+        if len(self._pending) >= self.max_pending:
+            try:
+                await self.flush()
+                return
+
+            except DatabaseError as e:
+                logger.error(f"DB write failed, retrying later: {e}")
+
+        if self._pending:
+            self._schedule_flush()
+
+    async def _flush_later(self):
+        delay = self.flush_interval
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await asyncio.shield(self.flush())
+                # changes queued while the write was running are written on the next round
+                if not self._pending and not self._statements:
+                    return
+
+                delay = self.flush_interval
+
+            except DatabaseError as e:
+                delay = min(delay * 2, 30)
+                logger.error(f"DB write failed, retrying in {delay} seconds: {e}")
+
+    async def flush(self):
+        """
+        Commits changes now. If the write fails, the changes are queued again and the error is raised.
+        """
+        self._collect()
+        async with self.lock:
+            pending, self._pending = self._pending, {}
+            statements, self._statements = self._statements, []
+            if not pending and not statements:
+                return
+
+            try:
+                async with self.engine.begin() as conn:
+                    for (model, identity), values in pending.items():
+                        primary_key = inspect(model).primary_key
+                        stmt = update(model).where(*(column == value for column, value in zip(primary_key, identity)))
+                        await conn.execute(stmt.values(**values))
+
+                    for stmt in statements:
+                        await conn.execute(stmt)
+
+            except DatabaseError:
+                # changes queued while the batch was being written are newer
+                for key, values in pending.items():
+                    self._pending[key] = {**values, **self._pending.get(key, {})}
+                self._statements[:0] = statements
+                raise
+
+    async def insert(self, row: object | list[object]):
+        """
+        Inserts rows.
+
+        :param Union[object, list[object]] row: an ORM entity or list of entities
+        """
+        rows = row if isinstance(row, list) else [row]
+        async with self.lock:
+            async with AsyncSession(bind=self.engine, expire_on_commit=False) as session:
+                session.add_all(rows)
+                try:
+                    await session.commit()
+
+                except DatabaseError as e:
+                    logger.error(e)
+                    await session.rollback()
+                    return
+
+                session.expunge_all()
+
+            self.s.add_all(rows)
+
+    async def close(self):
+        """
+        Writes pending changes, closes the session and the connections of the engine.
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flush_task
+
+        try:
+            await self.flush()
+
+        finally:
+            async with self.lock:
+                await self.s.close()
+                await self.engine.dispose()
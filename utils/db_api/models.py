@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from sqlalchemy import UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from data.constants import PROJECT_SHORT_NAME
@@ -15,11 +16,11 @@ class Wallet(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     private_key: Mapped[str] = mapped_column(unique=True, index=True)
-    address: Mapped[str] = mapped_column(unique=True)
+    address: Mapped[str] = mapped_column(unique=True, index=True)
     proxy: Mapped[str] = mapped_column(default=None, nullable=True)
     discord_token: Mapped[str] = mapped_column(default=None, nullable=True)
     twitter_token: Mapped[str] = mapped_column(default=None, nullable=True)
-    # next_activity_action_time: Mapped[datetime | None] = mapped_column(default=None, nullable=True)
+    next_activity_action_time: Mapped[datetime | None] = mapped_column(default=None, nullable=True)
     points: Mapped[int] = mapped_column(default=0)
     invite_code: Mapped[str] = mapped_column(default="")
     wallet_type: Mapped[str] = mapped_column(default="")
@@ -29,10 +30,39 @@ class Wallet(Base):
     eligble: Mapped[bool] = mapped_column(default=False)
     drop: Mapped[float] = mapped_column(default=0.0)
     next_faucet_time: Mapped[datetime] = mapped_column(default=datetime.now)
-    twitter_status: Mapped[str] = mapped_column(default=None, nullable=True)
-    proxy_status: Mapped[str] = mapped_column(default=None, nullable=True)
+    twitter_status: Mapped[str] = mapped_column(default=None, nullable=True, index=True)
+    proxy_status: Mapped[str] = mapped_column(default=None, nullable=True, index=True)
 
     def __repr__(self):
         if Settings().hide_wallet_address_log:
             return f"[{PROJECT_SHORT_NAME} | {self.id}]"
         return f"[{PROJECT_SHORT_NAME} | {self.id} | {self.address}]"
+
+
+class Token(Base):
+    __tablename__ = "tokens"
+    __table_args__ = (UniqueConstraint("chain_id", "address"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    chain_id: Mapped[int] = mapped_column()
+    address: Mapped[str] = mapped_column()
+    decimals: Mapped[int] = mapped_column()
+    symbol: Mapped[str] = mapped_column(default=None, nullable=True)
+    name: Mapped[str] = mapped_column(default=None, nullable=True)
+
+    def __repr__(self):
+        return f"[{self.chain_id} | {self.symbol} | {self.address}]"
+
+
+class Allowance(Base):
+    __tablename__ = "allowances"
+    __table_args__ = (UniqueConstraint("chain_id", "owner", "token", "spender"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    chain_id: Mapped[int] = mapped_column()
+    owner: Mapped[str] = mapped_column()
+    token: Mapped[str] = mapped_column()
+    spender: Mapped[str] = mapped_column()
+
+    def __repr__(self):
+        return f"[{self.chain_id} | {self.owner} | {self.token} -> {self.spender}]"
@@ -0,0 +1,30 @@
+from sqlalchemy.dialects.sqlite import insert
+
+from libs.eth_async.token_registry import TokenMetadata, TokenRegistry
+from utils.db_api.models import Token
+from utils.db_api.wallet_api import adb, db
+
+
+def get_tokens_metadata() -> list[TokenMetadata]:
+    return [
+        TokenMetadata(chain_id=token.chain_id, address=token.address, decimals=token.decimals, symbol=token.symbol, name=token.name)
+        for token in db.all(Token)
+    ]
+
+
+def save_token_metadata(metadata: TokenMetadata) -> None:
+    stmt = insert(Token).values(
+        chain_id=metadata.chain_id,
+        address=metadata.address,
+        decimals=metadata.decimals,
+        symbol=metadata.symbol,
+        name=metadata.name,
+    )
+    adb.submit(stmt.on_conflict_do_nothing(index_elements=["chain_id", "address"]))
+
+
+def attach_token_storage() -> None:
+    """
+    Persist token metadata learned at runtime in the wallets DB, so warm starts make no metadata calls.
+    """
+    TokenRegistry.attach_storage(load=get_tokens_metadata, save=save_token_metadata)
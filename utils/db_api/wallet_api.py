@@ -1,5 +1,7 @@
+from sqlalchemy import select
+
 from data.config import WALLETS_DB
-from utils.db_api.db import DB
+from utils.db_api.db import DB, AsyncDB
 from utils.db_api.models import Base, Wallet
 
 
@@ -24,7 +26,16 @@ def get_wallet_by_address(address: str, sqlite_query: bool = False) -> Wallet |
     return db.one(Wallet, Wallet.address == address)
 
 
-def update_twitter_token(private_key: str, updated_token: str | None) -> bool:
+def get_wallets_by_addresses(addresses: list[str], chunk_size: int = 500) -> dict[str, Wallet]:
+    wallets = {}
+    for i in range(0, len(addresses), chunk_size):
+        for wallet in db.all(stmt=select(Wallet).where(Wallet.address.in_(addresses[i : i + chunk_size]))):
+            wallets[wallet.address] = wallet
+
+    return wallets
+
+
+async def update_twitter_token(private_key: str, updated_token: str | None) -> bool:
     """
     Updates the Twitter token for a wallet with the given private_key.
 
@@ -38,16 +49,16 @@ def update_twitter_token(private_key: str, updated_token: str | None) -> bool:
     if not updated_token:
         return False
 
-    wallet = db.one(Wallet, Wallet.private_key == private_key)
+    wallet = await adb.one(Wallet, Wallet.private_key == private_key)
     if not wallet:
         return False
 
     wallet.twitter_token = updated_token
-    db.commit()
+    await adb.commit()
     return True
 
 
-def update_twitter_token(id: int, updated_token: str | None) -> bool:
+async def update_twitter_token(id: int, updated_token: str | None) -> bool:
     """
     Updates the Twitter token for a wallet with the given private_key.
 
@@ -61,79 +72,114 @@ def update_twitter_token(id: int, updated_token: str | None) -> bool:
     if not updated_token:
         return False
 
-    wallet = db.one(Wallet, Wallet.id == id)
+    wallet = await adb.one(Wallet, Wallet.id == id)
     if not wallet:
         return False
 
     wallet.twitter_token = updated_token
-    db.commit()
+    await adb.commit()
     return True
 
 
-def replace_bad_proxy(id: int, new_proxy: str) -> bool:
-    wallet = db.one(Wallet, Wallet.id == id)
+async def replace_bad_proxy(id: int, new_proxy: str) -> bool:
+    wallet = await adb.one(Wallet, Wallet.id == id)
     if not wallet:
         return False
     wallet.proxy = new_proxy
     wallet.proxy_status = "OK"
-    db.commit()
+    await adb.commit()
     return True
 
 
-def replace_bad_twitter(id: int, new_token: str) -> bool:
-    wallet = db.one(Wallet, Wallet.id == id)
+async def replace_bad_twitter(id: int, new_token: str) -> bool:
+    wallet = await adb.one(Wallet, Wallet.id == id)
     if not wallet:
         return False
     wallet.twitter_token = new_token
     wallet.twitter_status = "OK"
-    db.commit()
+    await adb.commit()
     return True
 
 
-def mark_proxy_as_bad(id: int) -> bool:
-    wallet = db.one(Wallet, Wallet.id == id)
+async def mark_proxy_as_bad(id: int) -> bool:
+    wallet = await adb.one(Wallet, Wallet.id == id)
     if not wallet:
         return False
     wallet.proxy_status = "BAD"
-    db.commit()
+    await adb.commit()
     return True
 
 
-def mark_discord_as_bad(id: int) -> bool:
-    wallet = db.one(Wallet, Wallet.id == id)
+async def mark_discord_as_bad(id: int) -> bool:
+    wallet = await adb.one(Wallet, Wallet.id == id)
     if not wallet:
         return False
     wallet.discord_status = "BAD"
-    db.commit()
+    await adb.commit()
     return True
 
 
-def mark_twitter_as_bad(id: int) -> bool:
-    wallet = db.one(Wallet, Wallet.id == id)
+async def mark_twitter_as_bad(id: int) -> bool:
+    wallet = await adb.one(Wallet, Wallet.id == id)
     if not wallet:
         return False
     wallet.twitter_status = "BAD"
-    db.commit()
+    await adb.commit()
     return True
 
 
-def set_fs_form_status(id: int, status: str) -> bool:
-    wallet = db.one(Wallet, Wallet.id == id)
+async def set_fs_form_status(id: int, status: str) -> bool:
+    wallet = await adb.one(Wallet, Wallet.id == id)
     if not wallet:
         return False
     wallet.hs_form_status = status
-    db.commit()
+    await adb.commit()
     return True
 
 
-def get_wallets_with_bad_proxy() -> list:
-    return db.all(Wallet, Wallet.proxy_status == "BAD")
+_invite_codes: list[str] | None = None
+
+
+async def get_invite_codes() -> list[str]:
+    """
+    Returns invite codes of all wallets. The list is read once and then kept up to date by 'replace_invite_code'.
+    """
+    global _invite_codes
+    if _invite_codes is None:
+        _invite_codes = await adb.all(stmt=select(Wallet.invite_code).where(Wallet.invite_code != ""))
+
+    return _invite_codes
+
+
+def replace_invite_code(old_code: str | None, new_code: str | None) -> None:
+    """
+    Updates the cached invite codes after a wallet got a new one, without waiting for the change to be written.
+    """
+    if _invite_codes is None or old_code == new_code:
+        return
+
+    if old_code and old_code in _invite_codes:
+        _invite_codes.remove(old_code)
+    if new_code:
+        _invite_codes.append(new_code)
+
+
+async def get_wallets_with_bad_proxy() -> list:
+    # statuses are written behind, so queued changes are written before filtering on them
+    await adb.flush()
+    return await adb.all(Wallet, Wallet.proxy_status == "BAD")
 
 
-def get_wallets_with_bad_twitter() -> list:
-    return db.all(Wallet, Wallet.twitter_status == "BAD")
+async def get_wallets_with_bad_twitter() -> list:
+    # statuses are written behind, so queued changes are written before filtering on them
+    await adb.flush()
+    return await adb.all(Wallet, Wallet.twitter_status == "BAD")
 
 
+# 'db' serves the menu and imports before the wallet tasks start. Helpers used while tasks run are coroutines on
+# 'adb', so they don't block the loop and change the same Wallet objects as the tasks.
 db = DB(f"sqlite:///{WALLETS_DB}", echo=False, pool_recycle=3600, connect_args={"check_same_thread": False})
 db.create_tables(Base)
 db.ensure_model_columns(Wallet)
+db.ensure_model_indexes(Wallet)
+adb = AsyncDB(f"sqlite+aiosqlite:///{WALLETS_DB}", echo=False, pool_recycle=3600)
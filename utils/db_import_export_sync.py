@@ -1,4 +1,6 @@
+import asyncio
 import csv
+import gzip
 import os
 import random
 import sys
@@ -6,13 +8,15 @@ from types import SimpleNamespace
 from typing import Dict, List, Optional
 
 from loguru import logger
+from sqlalchemy import select
 
+from data import config
 from data.config import FILES_DIR
-from libs.eth_async.client import Client
-from libs.eth_async.data.models import Networks
+from data.settings import Settings
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db, get_wallet_by_address
-from utils.encryption import check_encrypt_param, get_private_key, prk_encrypt
+from utils.db_api.wallet_api import db, get_wallets_by_addresses
+from utils.encryption import check_encrypt_param, get_private_key
+from utils.wallet_keys import prepare_private_keys, private_keys_decryptor
 
 
 def parse_proxy(proxy: str | None) -> Optional[str]:
@@ -38,26 +42,29 @@ def pick_proxy(proxies: list, i: int) -> Optional[str]:
     return proxies[i % len(proxies)]
 
 
-def remove_line_from_file(value: str, filename: str) -> bool:
+def remove_lines_from_file(values: list[str], filename: str) -> int:
     file_path = os.path.join(FILES_DIR, filename)
 
     if not os.path.isfile(file_path):
-        return False
+        return 0
 
     with open(file_path, encoding="utf-8") as f:
         lines = [line.rstrip("\n") for line in f]
 
-    original_len = len(lines)
-
-    keep = [line for line in lines if line.strip() != value.strip()]
+    remove = {value.strip() for value in values}
+    keep = [line for line in lines if line.strip() not in remove]
 
-    if len(keep) == original_len:
-        return False
+    if len(keep) == len(lines):
+        return 0
 
     with open(file_path, "w", encoding="utf-8") as f:
         for line in keep:
             f.write(line + "\n")
-    return True
+    return len(lines) - len(keep)
+
+
+def remove_line_from_file(value: str, filename: str) -> bool:
+    return remove_lines_from_file([value], filename) > 0
 
 
 def read_lines(path: str) -> List[str]:
@@ -104,77 +111,59 @@ class Import:
 
         wallets = [SimpleNamespace(**w) for w in raw_wallets]
 
-        imported: list[Wallet] = []
-        edited: list[Wallet] = []
         total = len(wallets)
 
-        check_wallets = db.all(Wallet)
+        check_wallet = db.one(stmt=select(Wallet))
 
-        if len(check_wallets) > 0:
+        if check_wallet:
             # Check pwd1
             try:
-                check_wallet = check_wallets[0]
                 get_private_key(check_wallet.private_key)
 
             except Exception as e:
                 sys.exit(f"Database not empty | You must use same password for new wallets | {e}")
 
-        for wl in wallets:
-            decoded_private_key = get_private_key(wl.private_key)
+        prepared = await asyncio.to_thread(
+            prepare_private_keys,
+            private_keys=[wl.private_key for wl in wallets],
+            cipher=config.CIPHER_SUITE,
+            encryption=Settings().private_key_encryption,
+        )
 
-            client = Client(private_key=decoded_private_key, network=Networks.Ethereum)
+        existing = get_wallets_by_addresses(addresses=[address for address, _ in prepared])
+        new_wallets: dict[str, Wallet] = {}
+        edited: dict[str, Wallet] = {}
 
-            wallet_instance = get_wallet_by_address(address=client.account.address)
+        for wl, (address, stored_key) in zip(wallets, prepared):
+            wallet_instance = existing.get(address)
 
             if wallet_instance:
-                changed = False
-
-                if wallet_instance.address == client.account.address:
-                    wallet_instance.private_key = prk_encrypt(decoded_private_key) if not "gAAAA" in wl.private_key else wl.private_key
-                    changed = True
-
-                if wallet_instance.proxy != wl.proxy:
-                    wallet_instance.proxy = wl.proxy
-                    changed = True
-
-                if hasattr(wallet_instance, "twitter_token") and wallet_instance.twitter_token != wl.twitter_token:
-                    wallet_instance.twitter_token = wl.twitter_token
-                    changed = True
-
-                if hasattr(wallet_instance, "discord_token") and wallet_instance.discord_token != wl.discord_token:
-                    wallet_instance.discord_token = wl.discord_token
-                    changed = True
-
-                if changed:
-                    db.commit()
-                    edited.append(wallet_instance)
-                    remove_line_from_file(wl.private_key, "private_keys.txt")
-
+                wallet_instance.private_key = stored_key
+                wallet_instance.proxy = wl.proxy
+                wallet_instance.twitter_token = wl.twitter_token
+                wallet_instance.discord_token = wl.discord_token
+                edited[address] = wallet_instance
                 continue
 
-            wallet_instance = Wallet(
-                private_key=prk_encrypt(wl.private_key) if not "gAAAA" in wl.private_key else wl.private_key,
-                address=client.account.address,
+            new_wallets[address] = Wallet(
+                private_key=stored_key,
+                address=address,
                 proxy=wl.proxy,
                 twitter_token=wl.twitter_token,
                 discord_token=wl.discord_token,
                 wallet_type=random.choice(["Metamask", "Rabby Wallet", "OKX Wallet"]),
             )
 
-            remove_line_from_file(wl.private_key, "private_keys.txt")
+        imported = list(new_wallets.values())
+        db.insert(imported)
 
-            if not wallet_instance.twitter_token:
-                logger.warning(
-                    f"{wallet_instance.id} | {wallet_instance.address} | Twitter Token not found, Twitter Action will be skipped"
-                )
+        remove_lines_from_file([wl.private_key for wl in wallets], "private_keys.txt")
 
-            if not wallet_instance.discord_token:
-                logger.warning(
-                    f"{wallet_instance.id} | {wallet_instance.address} | Discord Token not found, Discord Action will be skipped"
-                )
+        if without_twitter := sum(1 for wallet in imported if not wallet.twitter_token):
+            logger.warning(f"{without_twitter} imported wallets have no Twitter Token, Twitter Action will be skipped for them")
 
-            db.insert(wallet_instance)
-            imported.append(wallet_instance)
+        if without_discord := sum(1 for wallet in imported if not wallet.discord_token):
+            logger.warning(f"{without_discord} imported wallets have no Discord Token, Discord Action will be skipped for them")
 
         logger.success(f"Done! imported wallets: {len(imported)}/{total}; edited wallets: {len(edited)}/{total}; total: {total}")
 
@@ -225,33 +214,27 @@ class Sync:
         logger.info(f"Start syncing wallets: {total}")
 
         edited: list[Wallet] = []
-        for wl in wallets:
-            decoded_private_key = get_private_key(wl.private_key)
-
-            client = Client(private_key=decoded_private_key, network=Networks.Ethereum)
+        for wallet_instance in wallets:
+            changed = False
 
-            wallet_instance = get_wallet_by_address(address=client.account.address)
-
-            if wallet_instance:
-                changed = False
+            wallet_data = wallet_auxiliary_data[wallet_instance.id - 1]
+            if wallet_instance.proxy != wallet_data.proxy:
+                wallet_instance.proxy = wallet_data.proxy
+                changed = True
 
-                wallet_data = wallet_auxiliary_data[wallet_instance.id - 1]
-                if wallet_instance.proxy != wallet_data.proxy:
-                    wallet_instance.proxy = wallet_data.proxy
-                    changed = True
+            if wallet_instance.twitter_token != wallet_data.twitter_token:
+                wallet_instance.twitter_token = wallet_data.twitter_token
+                changed = True
 
-                if hasattr(wallet_instance, "twitter_token") and wallet_instance.twitter_token != wallet_data.twitter_token:
-                    wallet_instance.twitter_token = wallet_data.twitter_token
-                    changed = True
+            if wallet_instance.discord_token != wallet_data.discord_token:
+                wallet_instance.discord_token = wallet_data.discord_token
+                wallet_instance.discord_status = None
+                changed = True
 
-                if hasattr(wallet_instance, "discord_token") and wallet_instance.discord_token != wallet_data.discord_token:
-                    wallet_instance.discord_token = wallet_data.discord_token
-                    wallet_instance.discord_status = None
-                    changed = True
+            if changed:
+                edited.append(wallet_instance)
 
-                if changed:
-                    db.commit()
-                    edited.append(wallet_instance)
+        db.commit()
 
         logger.success(f"Done! edited wallets: {len(edited)}/{total}; total: {total}")
 
@@ -264,24 +247,11 @@ class Export:
         "discord_token": "exported_discord_tokens.txt",
     }
 
-    @staticmethod
-    async def data_to_csv() -> None:
-        if not check_encrypt_param():
-            logger.error(f"Decryption Failed | Wrong Password")
-            return
-
-        wallets: List[Wallet] = db.all(Wallet)
-
-        if not wallets:
-            logger.warning("Export: no wallets in db, skip....")
-            return
-
-        keys_set = set()
-        for w in wallets:
-            for k in getattr(w, "__dict__", {}).keys():
-                if not k.startswith("_"):
-                    keys_set.add(k)
+    _CSV_CHUNK_SIZE = 1000
 
+    @staticmethod
+    def _csv_fieldnames(decrypt_private_keys: bool) -> list[str]:
+        columns = [column.name for column in Wallet.__table__.columns]
         preferred = [
             "id",
             "address",
@@ -290,16 +260,56 @@ class Export:
             "twitter_token",
         ]
 
-        fieldnames = [k for k in preferred if k in keys_set] + sorted(k for k in keys_set if k not in preferred)
+        fieldnames = [k for k in preferred if k in columns] + sorted(k for k in columns if k not in preferred)
+        if decrypt_private_keys:
+            fieldnames.insert(fieldnames.index("private_key") + 1, "decrypted_private_key")
 
-        path = os.path.join(FILES_DIR, "export_data.csv")
+        return fieldnames
 
-        with open(path, "w", encoding="utf-8", newline="") as f:
+    @staticmethod
+    def _write_csv(path: str, decrypt_private_keys: bool, compress: bool) -> int:
+        fieldnames = Export._csv_fieldnames(decrypt_private_keys=decrypt_private_keys)
+        columns = [column for column in Wallet.__table__.columns]
+        count = 0
+
+        if compress:
+            file = gzip.open(path, "wt", encoding="utf-8", newline="")
+        else:
+            file = open(path, "w", encoding="utf-8", newline="")
+
+        with (
+            file as f,
+            private_keys_decryptor(
+                cipher=config.CIPHER_SUITE, encryption=decrypt_private_keys and Settings().private_key_encryption
+            ) as decrypt,
+            db.engine.connect() as conn,
+        ):
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
             writer.writeheader()
 
-            for w in wallets:
-                row = {k: v for k, v in getattr(w, "__dict__", {}).items() if not k.startswith("_")}
-                writer.writerow(row)
+            result = conn.execution_options(yield_per=Export._CSV_CHUNK_SIZE).execute(select(*columns).order_by(Wallet.id))
+            for rows in result.mappings().partitions():
+                rows = [dict(row) for row in rows]
+                if decrypt_private_keys:
+                    for row, private_key in zip(rows, decrypt([row["private_key"] for row in rows])):
+                        row["decrypted_private_key"] = private_key
+
+                writer.writerows(rows)
+                count += len(rows)
+
+        return count
+
+    @staticmethod
+    async def data_to_csv(decrypt_private_keys: bool = False, compress: bool = False) -> None:
+        if not check_encrypt_param():
+            logger.error(f"Decryption Failed | Wrong Password")
+            return
+
+        if not db.one(stmt=select(Wallet.id)):
+            logger.warning("Export: no wallets in db, skip....")
+            return
+
+        path = os.path.join(FILES_DIR, "export_data.csv.gz" if compress else "export_data.csv")
+        count = await asyncio.to_thread(Export._write_csv, path=path, decrypt_private_keys=decrypt_private_keys, compress=compress)
 
-        logger.success(f"Export: Database to CSV | Wallets exported: {len(wallets)} | Path: {path}")
+        logger.success(f"Export: Database to CSV | Wallets exported: {count} | Path: {path}")
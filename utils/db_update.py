@@ -2,25 +2,16 @@ import random
 from datetime import datetime, timedelta
 
 from loguru import logger
-from sqlalchemy import or_, select
 
-from data.config import LOCK
 from data.settings import Settings
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db, get_wallet_by_private_key
+from utils.db_api.wallet_api import adb, replace_invite_code
 
 
-def update_expired() -> None:
+async def update_expired(wallets: list[Wallet]) -> None:
     now = datetime.now()
 
-    stmt = select(Wallet).where(
-        or_(
-            Wallet.next_activity_action_time <= now,
-            Wallet.next_activity_action_time.is_(None),
-        )
-    )
-
-    expired_wallets: list[Wallet] = db.all(stmt=stmt)
+    expired_wallets = [w for w in wallets if w.next_activity_action_time is None or w.next_activity_action_time <= now]
 
     if not expired_wallets:
         return
@@ -29,15 +20,9 @@ def update_expired() -> None:
     first_start_wallets = [w for w in expired_wallets if w.next_activity_action_time is None]
     already_scheduled_wallets = [w for w in expired_wallets if w.next_activity_action_time is not None]
 
-    next_time = now
-
-    if Settings().shuffle_wallets:
-        random.shuffle(first_start_wallets)
-
     for wallet in first_start_wallets:
-        offset = random.randint(30, 120)  # random delay between 30s and 120s
-        next_time += timedelta(seconds=offset)
-        wallet.next_activity_action_time = next_time
+        offset = random.randint(settings.random_pause_start_wallet_min, settings.random_pause_start_wallet_max)
+        wallet.next_activity_action_time = now + timedelta(seconds=offset)
         logger.info(f"{wallet}: First startup – scheduled at {wallet.next_activity_action_time}")
 
     for wallet in already_scheduled_wallets:
@@ -46,17 +31,16 @@ def update_expired() -> None:
         )
         logger.info(f"{wallet}: Action time was re-generated: {wallet.next_activity_action_time}.")
 
-    db.commit()
+    await adb.commit()
 
 
 async def update_next_action_time(private_key: str, seconds: int) -> bool:
     try:
         now = datetime.now()
-        wallet = get_wallet_by_private_key(private_key=private_key)
+        wallet = await adb.one(Wallet, Wallet.private_key == private_key)
         wallet.next_activity_action_time = now + timedelta(seconds=seconds)
 
-        async with LOCK:
-            db.commit()
+        await adb.commit()
         return True
     except BaseException:
         return False
@@ -64,12 +48,17 @@ async def update_next_action_time(private_key: str, seconds: int) -> bool:
 
 async def update_points_invites(private_key: str, points: int, invite_code: str) -> bool:
     try:
-        wallet = get_wallet_by_private_key(private_key=private_key)
+        wallet = await adb.one(Wallet, Wallet.private_key == private_key)
+        if wallet is None:
+            return False
+
         wallet.points = points
-        wallet.invite_code = invite_code
+        # a missing code in the portal response doesn't clear the stored one
+        if invite_code is not None:
+            replace_invite_code(old_code=wallet.invite_code, new_code=invite_code)
+            wallet.invite_code = invite_code
 
-        async with LOCK:
-            db.commit()
+        await adb.commit()
         return True
     except BaseException:
         return False
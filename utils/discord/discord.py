@@ -17,7 +17,7 @@ from libs.baseAsyncSession import BaseAsyncSession, FINGERPRINT_MAC136
 from utils.captcha.bestcapthca import create_bestcaptcha_task, get_bestcaptcha_task_result
 from utils.captcha.capthca24 import create_24captch_task, get_24captcha_task_result
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db
+from utils.db_api.wallet_api import adb
 from utils.discord.captcha import get_hcaptcha_solution
 from utils.query_json import json_to_query, query_to_json
 
@@ -389,7 +389,7 @@ class DiscordInviter:
             if "You need to verify your account" in r.text:
                 logger.error(f"{self.wallet} | {self.__module_name__} | Account needs verification (Email code etc).")
                 self.wallet.discord_status = DiscordStatus.bad_token
-                db.commit()
+                await adb.commit()
                 return "verification_failed", "", False
 
             location_guild_id = r.json()['guild_id']
@@ -471,7 +471,7 @@ class DiscordInviter:
                 "captcha_rqdata" in (r.text or "")):
             need_captcha = True
             self.wallet.discord_status = DiscordStatus.captcha
-            db.commit()
+            await adb.commit()
             # todo captcha flow
             return False, f'{self.wallet} | {self.__module_name__} | {r.text}'
 
@@ -480,7 +480,7 @@ class DiscordInviter:
                 return False, f'{self.wallet} | {self.__module_name__} | Incorrect discord token or your account is blocked.'
             if "You need to verify your account in order to" in (r.text or ""):
                 self.wallet.discord_status = DiscordStatus.verify
-                db.commit()
+                await adb.commit()
                 return False, f'{self.wallet} | {self.__module_name__} | Account needs verification (Email code etc).'
             return False, f'{self.wallet} | {self.__module_name__} | Unknown error: {r.text}'
 
@@ -725,7 +725,7 @@ class DiscordInviter:
                 if ("Banned" in answer) or ("Incorrect discord token or your account is blocked" in answer):
                     logger.error(answer)
                     self.wallet.discord_status = DiscordStatus.bad_token
-                    db.commit()
+                    await adb.commit()
                     await self.close()
                     continue
 
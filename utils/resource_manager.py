@@ -7,7 +7,7 @@ from loguru import logger
 from data import config
 from utils.db_api.models import Wallet
 from utils.db_api.wallet_api import (
-    db,
+    adb,
     get_wallets_with_bad_proxy,
     get_wallets_with_bad_twitter,
     mark_proxy_as_bad,
@@ -131,7 +131,7 @@ class ResourceManager:
         if not new_proxy:
             return False, "No available reserve proxies"
 
-        success = replace_bad_proxy(id, new_proxy)
+        success = await replace_bad_proxy(id, new_proxy)
 
         if success:
             return True, f"Proxy successfully replaced with {new_proxy}"
@@ -152,7 +152,7 @@ class ResourceManager:
         if not new_token:
             return False, "No available reserve Twitter tokens"
 
-        success = replace_bad_twitter(id, new_token)
+        success = await replace_bad_twitter(id, new_token)
 
         if success:
             logger.success("Twitter token successfully replaced in database")
@@ -172,7 +172,7 @@ class ResourceManager:
         Returns:
             Success status
         """
-        return mark_proxy_as_bad(id)
+        return await mark_proxy_as_bad(id)
 
     async def mark_twitter_as_bad(self, id: int) -> bool:
         """
@@ -184,7 +184,7 @@ class ResourceManager:
         Returns:
             Success status
         """
-        return mark_twitter_as_bad(id)
+        return await mark_twitter_as_bad(id)
 
     async def get_bad_proxies(self) -> List:
         """
@@ -193,7 +193,7 @@ class ResourceManager:
         Returns:
             List of wallets
         """
-        return get_wallets_with_bad_proxy()
+        return await get_wallets_with_bad_proxy()
 
     async def get_bad_twitter(self) -> List:
         """
@@ -202,7 +202,7 @@ class ResourceManager:
         Returns:
             List of wallets
         """
-        return get_wallets_with_bad_twitter()
+        return await get_wallets_with_bad_twitter()
 
     async def replace_all_bad_proxies(self) -> Tuple[int, int]:
         """
@@ -242,8 +242,8 @@ class ResourceManager:
 
 
 async def replace_twitter_tokens(wallet: Wallet):
-    wallets = db.all(Wallet)
-    all_twitter_tokens = [wallet.twitter_token for wallets in wallets]
+    wallets = await adb.all(Wallet)
+    all_twitter_tokens = [wallet_.twitter_token for wallet_ in wallets]
 
     all_tokens = ResourceManager._load_from_file(config.RESERVE_TWITTER_FILE)
 
@@ -260,7 +260,7 @@ async def replace_twitter_tokens(wallet: Wallet):
 
         # Save updated list back to file
         if ResourceManager._save_to_file(config.RESERVE_TWITTER_FILE, all_tokens):
-            db.commit()
+            await adb.commit()
             logger.success(f"{wallet} | Twitter token successfully replaced and removed from file. Remaining: {len(all_tokens)}")
 
         else:
@@ -5,6 +5,7 @@ from typing import Tuple, Type
 from loguru import logger
 
 from data.settings import Settings
+from utils.scheduler import pause
 
 
 def async_retry(
@@ -39,7 +40,7 @@ def async_retry(
                     last_msg = f"{func.__name__} | attempt {attempt}/{retries}: {e}"
                     logger.warning(msg)
                     if attempt < retries:
-                        await asyncio.sleep(delay)
+                        await pause(delay)
 
             if to_raise and last_exc is not None:
                 raise last_exc
@@ -0,0 +1,223 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
+from datetime import datetime
+
+from loguru import logger
+
+from libs.eth_async.receipt_tracker import ReceiptTracker
+from utils.browser import Browser
+from utils.db_api.models import Wallet
+
+
+class _Slot:
+    def __init__(self, semaphore: asyncio.Semaphore) -> None:
+        self.semaphore = semaphore
+        self.held = False
+        self.waited = 0.0
+        self.waiting_since: float | None = None
+
+    async def acquire(self) -> None:
+        self.waiting_since = time.monotonic()
+        try:
+            await self.semaphore.acquire()
+            self.held = True
+        finally:
+            self.waited += time.monotonic() - self.waiting_since
+            self.waiting_since = None
+
+    def wait_time(self) -> float:
+        """
+        Returns the seconds spent waiting for the slot, including a wait in progress.
+        """
+        if self.waiting_since is None:
+            return self.waited
+
+        return self.waited + time.monotonic() - self.waiting_since
+
+    def release(self) -> None:
+        if self.held:
+            self.held = False
+            self.semaphore.release()
+
+
+_current_slot: ContextVar[_Slot | None] = ContextVar("current_slot", default=None)
+
+
+@asynccontextmanager
+async def idle():
+    """
+    Gives the concurrency slot of the current wallet back to the scheduler while the block is awaited, e.g. while
+    sleeping or waiting for a receipt. Does nothing outside the scheduler.
+    """
+    slot = _current_slot.get()
+    if slot is None or not slot.held:
+        yield
+        return
+
+    slot.release()
+    try:
+        yield
+    except asyncio.CancelledError:
+        raise
+    except BaseException:
+        await slot.acquire()
+        raise
+
+    await slot.acquire()
+
+
+# receipts are awaited without holding the slot
+ReceiptTracker.attach_idle(idle)
+
+
+async def pause(seconds: int | float) -> None:
+    """
+    Sleeps without holding the concurrency slot of the current wallet.
+
+    :param int | float seconds: the pause duration
+    """
+    async with idle():
+        await asyncio.sleep(seconds)
+
+
+class WalletScheduler:
+    """
+    Runs a wallet task from a timer heap keyed by the next run time of every wallet.
+
+    A wallet is started only when it is due and a slot is free, and its task gives the slot back during every pause
+    (see 'idle' and 'pause'), so 'threads' bounds the number of wallets doing work at a time, not the number of
+    sleeping ones. With 'repeat_pause' a wallet is put back on the heap after every run and 'on_reschedule' can store its
+    next run time, so the schedule survives restarts.
+    """
+
+    def __init__(
+        self,
+        task_func: Callable[[Wallet], Awaitable],
+        threads: int,
+        repeat_pause: tuple[int, int] | None = None,
+        on_reschedule: Callable[[Wallet, int], Awaitable] | None = None,
+        timeout: int | float = 3600,
+    ) -> None:
+        """
+        :param task_func: the wallet task
+        :param int threads: the number of wallets doing work at a time
+        :param tuple[int, int] | None repeat_pause: the range of the pause between runs of a wallet in seconds (run once)
+        :param on_reschedule: a coroutine function called with the wallet and the seconds until its next run (None)
+        :param int | float timeout: the wallet task timeout in seconds, the time spent waiting for a slot after a pause
+            isn't counted (3600)
+        """
+        self.task_func = task_func
+        self.repeat_pause = repeat_pause
+        self.on_reschedule = on_reschedule
+        self.timeout = timeout
+
+        self._semaphore = asyncio.Semaphore(threads)
+        self._heap: list[tuple[float, int, Wallet]] = []
+        self._counter = itertools.count()
+        self._running: set[asyncio.Task] = set()
+        self._changed = asyncio.Event()
+
+    def schedule(self, wallet: Wallet, at: float | None = None) -> None:
+        """
+        Puts the wallet on the heap.
+
+        :param Wallet wallet: the wallet
+        :param float | None at: the run time as a timestamp (now)
+        """
+        heapq.heappush(self._heap, (at or time.time(), next(self._counter), wallet))
+        self._changed.set()
+
+    async def run(self, wallets: list[Wallet], start_at: Callable[[Wallet], datetime | None] | None = None) -> None:
+        """
+        Runs the wallets until the heap and the running tasks are exhausted.
+
+        :param list[Wallet] wallets: the wallets
+        :param start_at: a function returning the first run time of a wallet, None means now (now)
+        """
+        for wallet in wallets:
+            at = start_at(wallet) if start_at else None
+            self.schedule(wallet=wallet, at=at.timestamp() if at else None)
+
+        try:
+            while self._heap or self._running:
+                self._changed.clear()
+                if not self._heap:
+                    await self._changed.wait()
+                    continue
+
+                delay = self._heap[0][0] - time.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                slot = _Slot(self._semaphore)
+                await slot.acquire()
+                _, _, wallet = heapq.heappop(self._heap)
+
+                task = asyncio.create_task(self._run_wallet(wallet=wallet, slot=slot))
+                self._running.add(task)
+
+        finally:
+            for task in self._running:
+                task.cancel()
+
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def _run_wallet(self, wallet: Wallet, slot: _Slot) -> None:
+        _current_slot.set(slot)
+        try:
+            await self._run_with_timeout(wallet=wallet, slot=slot)
+
+        except asyncio.TimeoutError:
+            logger.error(f"[{wallet.id}] Core Execution Tasks | {self.task_func.__name__} timed out after {self.timeout // 60:.0f}m")
+
+        except Exception as e:
+            logger.error(f"[{wallet.id}] failed: {e}")
+
+        finally:
+            slot.release()
+            seconds = self._reschedule(wallet=wallet) if self.repeat_pause else None
+
+            self._running.discard(asyncio.current_task())
+            self._changed.set()
+            await Browser.aclose_for_wallet(wallet=wallet)
+
+        if seconds is not None and self.on_reschedule:
+            await self.on_reschedule(wallet, seconds)
+
+    async def _run_with_timeout(self, wallet: Wallet, slot: _Slot) -> None:
+        # the time spent waiting for the slot after a pause isn't counted, only the time the wallet could work
+        started, waited = time.monotonic(), slot.wait_time()
+        task = asyncio.ensure_future(self.task_func(wallet))
+        try:
+            while True:
+                remaining = started + self.timeout + slot.wait_time() - waited - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+
+                done, _ = await asyncio.wait({task}, timeout=remaining)
+                if done:
+                    return task.result()
+
+        finally:
+            if not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+    def _reschedule(self, wallet: Wallet) -> int:
+        seconds = random.randint(*self.repeat_pause)
+        at = time.time() + seconds
+        self.schedule(wallet=wallet, at=at)
+
+        logger.info(f"{wallet} | Sleeping {seconds} seconds. Next run at: {datetime.fromtimestamp(at).strftime('%Y-%m-%d %H:%M:%S')}")
+        return seconds
@@ -0,0 +1,48 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SharedCache:
+    """
+    A process-wide cache of wallet-independent responses, e.g. the portal task catalogue, shared by all wallets.
+
+    Values expire after 'ttl' seconds. Requests are coalesced: while a key is being fetched, other callers await the
+    same request instead of sending their own, so N concurrent wallets send one upstream request. Errors aren't cached.
+    Cached values are shared, callers mustn't modify them.
+    """
+
+    _values: dict[Hashable, tuple[float, Any]] = {}
+    _pending: dict[Hashable, asyncio.Future] = {}
+
+    @classmethod
+    async def get(cls, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """
+        Get a cached value or fetch it.
+
+        :param Hashable key: the cache key, e.g. the endpoint URL.
+        :param fetch: a coroutine function requesting the value.
+        :param float ttl: the value lifetime in seconds.
+        :return Any: the value.
+        """
+        entry = cls._values.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        future = cls._pending.get(key)
+        if future is None:
+            future = cls._pending[key] = asyncio.ensure_future(cls._fetch(key=key, fetch=fetch, ttl=ttl))
+
+        # one caller being cancelled mustn't cancel the request for the others
+        return await asyncio.shield(future)
+
+    @classmethod
+    async def _fetch(cls, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        try:
+            value = await fetch()
+            cls._values[key] = (time.monotonic() + ttl, value)
+            return value
+
+        finally:
+            cls._pending.pop(key, None)
@@ -11,7 +11,7 @@ from libs.twitter.errors import AccountLocked, AccountNotFound, AccountSuspended
 from libs.twitter.utils import remove_at_sign
 from utils.browser import Browser
 from utils.db_api.models import Wallet
-from utils.db_api.wallet_api import db, update_twitter_token
+from utils.db_api.wallet_api import adb
 
 
 # TODO Move to Exception file
@@ -117,7 +117,8 @@ class TwitterClient:
 
             if self.twitter_account.status == twitter.AccountStatus.GOOD:
                 logger.success(f"{self.user} Twitter client initialized")
-                update_twitter_token(id=self.user.id, updated_token=self.twitter_account.auth_token)
+                if self.twitter_account.auth_token:
+                    self.user.twitter_token = self.twitter_account.auth_token
 
                 self.user.twitter_status = TwitterStatuses.ok
                 return True
@@ -143,7 +144,7 @@ class TwitterClient:
             return False
 
         finally:
-            db.commit()
+            await adb.commit()
 
     async def close(self):
         """Closes the Twitter connection"""
@@ -397,7 +398,7 @@ class TwitterClient:
             if not initialize:
                 raise Exception("Can't initialize twitter client")
 
-        browser = Browser(wallet=self.user)
+        browser = Browser.for_wallet(wallet=self.user)
         logger.debug(f"{self.user} Requesting Twitter authorization parameters")
 
         parsed_url = urllib.parse.urlparse(twitter_auth_url)
@@ -458,7 +459,7 @@ class TwitterClient:
             if not initialize:
                 raise Exception("Can't initialize twitter client")
 
-        browser = Browser(wallet=self.user)
+        browser = Browser.for_wallet(wallet=self.user)
         logger.debug(f"{self.user} Requesting Twitter authorization parameters")
 
         parsed_url = urllib.parse.urlparse(twitter_auth_url)
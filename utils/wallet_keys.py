@@ -0,0 +1,83 @@
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from cryptography.fernet import Fernet
+from eth_keys import keys
+from hexbytes import HexBytes
+
+ENCRYPTED_PREFIX = "gAAAA"
+
+# Starting worker processes costs more than deriving a few hundred addresses in place.
+PARALLEL_THRESHOLD = 500
+
+_cipher: Fernet | None = None
+_encryption: bool = False
+
+
+def _init_worker(cipher: Fernet | None, encryption: bool) -> None:
+    global _cipher, _encryption
+    _cipher = cipher
+    _encryption = encryption
+
+
+def _prepare_private_key(private_key: str) -> tuple[str, str]:
+    if _encryption and ENCRYPTED_PREFIX in private_key:
+        stored_key = private_key
+        private_key = _cipher.decrypt(private_key.encode()).decode()
+    elif _encryption:
+        stored_key = _cipher.encrypt(private_key.encode()).decode()
+    else:
+        stored_key = private_key
+
+    return keys.PrivateKey(HexBytes(private_key)).public_key.to_checksum_address(), stored_key
+
+
+def prepare_private_keys(
+    private_keys: list[str], cipher: Fernet | None, encryption: bool, workers: int | None = None
+) -> list[tuple[str, str]]:
+    """
+    Derives addresses of private keys and encrypts the keys for storing, using all CPU cores for large lists.
+
+    :param list[str] private_keys: plain or already encrypted private keys
+    :param Fernet | None cipher: the cipher of encrypted keys
+    :param bool encryption: whether keys are stored encrypted
+    :param int | None workers: the number of worker processes (the number of CPUs)
+    :return list[tuple[str, str]]: the address and the key to store for every private key, in the same order
+    """
+    if len(private_keys) < PARALLEL_THRESHOLD:
+        _init_worker(cipher=cipher, encryption=encryption)
+        return [_prepare_private_key(private_key) for private_key in private_keys]
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cipher, encryption)) as pool:
+        return list(pool.map(_prepare_private_key, private_keys, chunksize=max(1, len(private_keys) // (workers * 4))))
+
+
+def _decrypt_private_key(private_key: str) -> str:
+    if _encryption and ENCRYPTED_PREFIX in private_key:
+        return _cipher.decrypt(private_key.encode()).decode()
+
+    return private_key
+
+
+@contextmanager
+def private_keys_decryptor(
+    cipher: Fernet | None, encryption: bool, workers: int | None = None
+) -> Iterator[Callable[[list[str]], list[str]]]:
+    """
+    Starts worker processes decrypting stored private keys and yields a function decrypting a chunk of keys with them.
+
+    :param Fernet | None cipher: the cipher of encrypted keys
+    :param bool encryption: whether keys are stored encrypted
+    :param int | None workers: the number of worker processes (the number of CPUs)
+    :return Iterator[Callable[[list[str]], list[str]]]: the function returning decrypted keys in the same order
+    """
+    if not encryption:
+        yield list
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cipher, encryption)) as pool:
+        yield lambda private_keys: list(pool.map(_decrypt_private_key, private_keys, chunksize=max(1, len(private_keys) // (workers * 4))))